@@ -0,0 +1,493 @@
+"""
+VideoOtoFabrika - Render Benchmark
+Sentetik stok video (yatay + dikey) ve TTS uzunluğunda sessiz ses üretir,
+create_final_video pipeline'ının her aşamasını ayrı ölçer:
+decode, resize/crop, zoom, alt yazı oluşturma, composite, encode.
+Her aşama kendi girdisi önceden hazırlanmış olarak tek başına ölçülür ve
+birkaç kez tekrarlanıp medyan alınır.
+
+Sonuçlar (kare/sn, süre, en yüksek bellek) JSON'a yazılır ve kayıtlı
+baseline ile karşılaştırılır. İnternet, Pexels veya Gemini anahtarı gerekmez.
+
+Kullanım:
+    python benchmark.py                       # ölç ve baseline ile karşılaştır
+    python benchmark.py --save-baseline       # sonucu yeni baseline yap
+    python benchmark.py --duration 60 --backend ffmpeg
+    python benchmark.py --repeat 5            # her ölçümün 5 tekrarının medyanı
+    python benchmark.py --smoke               # varsayılan ayarlarla FFmpeg motoru çalışıyor mu
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+
+# Benchmark çevrimdışı çalışır, VideoManager API anahtarı olmadan başlatılamıyor
+os.environ.setdefault('PEXELS_API_KEY', 'benchmark')
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import config
+from ffmpeg_renderer import get_ffmpeg_exe
+from zoom_effect import ZoomEffect
+from compositor import LayerCompositor
+from encoding_profiles import get_profile, moviepy_kwargs
+
+
+# Sentetik kaynaklar: ad -> (genişlik, yükseklik)
+SYNTHETIC_SOURCES = {
+    "landscape": (1920, 1080),
+    "portrait": (1080, 1920),
+}
+
+# Alt yazı metni (~30 saniyelik seslendirme uzunluğunda)
+SAMPLE_TEXT = (
+    "DUR! Bunu biliyor muydun? Okyanusun en derin noktası Everest dağından daha derin! "
+    "Mariana Çukuru neredeyse on bir kilometre derinliğinde ve oraya ulaşan insan sayısı "
+    "aya gidenlerden bile az! Orada ışık yok, basınç inanılmaz yüksek ama yine de canlılar "
+    "yaşıyor! Bilim insanları her yıl yeni türler keşfediyor. Sence orada başka neler var? "
+    "Yorumlara yaz ve takip etmeyi unutma!"
+)
+
+DEFAULT_RESULTS = os.path.join("cache", "benchmark_results.json")
+DEFAULT_BASELINE = "benchmark_baseline.json"
+
+# Aşama girdisi olarak bellekte tutulan kare sayısı (zaman boyunca döngüyle kullanılır)
+SAMPLE_FRAMES = 10
+
+# Bundan küçük mutlak yavaşlamalar gerileme sayılmaz (saniye)
+MIN_REGRESSION_SECONDS = 0.05
+
+
+def peak_rss_mb():
+    """Bu süreç ve alt süreçlerin (ffmpeg) en yüksek bellek kullanımı (MB)"""
+    if resource is None:
+        return None
+    
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024  # macOS bayt, Linux KB
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale
+    return round(max(own, children), 1)
+
+
+def generate_synthetic_media(workdir, duration, fps=30):
+    """
+    ffmpeg lavfi ile sentetik video ve sessiz ses üret
+    
+    Args:
+        workdir: Çıktı klasörü
+        duration: Süre (saniye)
+        fps: Kare hızı
+    
+    Returns:
+        tuple: ({ad: video yolu}, ses yolu)
+    """
+    ffmpeg = get_ffmpeg_exe()
+    videos = {}
+    
+    for name, (width, height) in SYNTHETIC_SOURCES.items():
+        path = os.path.join(workdir, f"{name}.mp4")
+        subprocess.run([
+            ffmpeg, "-y", "-hide_banner", "-loglevel", "error",
+            "-f", "lavfi", "-i", f"testsrc2=size={width}x{height}:rate={fps}:duration={duration}",
+            "-c:v", "libx264", "-preset", "ultrafast", "-pix_fmt", "yuv420p",
+            path,
+        ], check=True)
+        videos[name] = path
+    
+    audio_path = os.path.join(workdir, "audio.mp3")
+    subprocess.run([
+        ffmpeg, "-y", "-hide_banner", "-loglevel", "error",
+        "-f", "lavfi", "-i", "anullsrc=r=24000:cl=mono",
+        "-t", str(duration), "-c:a", "libmp3lame", "-b:a", "48k",
+        audio_path,
+    ], check=True)
+    
+    return videos, audio_path
+
+
+def _median_seconds(func, repeat):
+    """
+    Fonksiyonu tekrar tekrar çalıştırıp süresinin medyanını döndür
+    
+    Args:
+        func: Ölçülecek fonksiyon (argümansız)
+        repeat: Tekrar sayısı
+    
+    Returns:
+        float: Medyan süre (saniye)
+    """
+    samples = []
+    for _ in range(max(repeat, 1)):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def _time_frames(clip, times, repeat):
+    """Clip'in tüm kare zamanlarını çizme süresi (medyan)"""
+    def run():
+        for t in times:
+            clip.get_frame(t)
+    return _median_seconds(run, repeat)
+
+
+def _frame_source(frames, duration, fps):
+    """
+    Bellekteki karelerden clip (aşama girdisi - decode veya önceki aşama maliyeti yok)
+    
+    Args:
+        frames: Kare listesi (zaman boyunca döngüyle tekrarlanır)
+        duration: Süre (saniye)
+        fps: Kare hızı
+    
+    Returns:
+        VideoClip
+    """
+    from moviepy import VideoClip
+    
+    return VideoClip(
+        frame_function=lambda t: frames[int(round(t * fps)) % len(frames)],
+        duration=duration
+    )
+
+
+def _sample_frames(clip, fps):
+    """Clip'in ilk SAMPLE_FRAMES karesini çiz (bir sonraki aşamanın girdisi)"""
+    return [clip.get_frame(i / fps) for i in range(SAMPLE_FRAMES)]
+
+
+def _stage(seconds, frames=None):
+    """Aşama sonucu sözlüğü"""
+    result = {"seconds": round(seconds, 3)}
+    if frames:
+        result["fps"] = round(frames / seconds, 2) if seconds > 0 else None
+    return result
+
+
+def benchmark_source(manager, video_path, audio_path, duration, workdir, fps=30, repeat=3):
+    """
+    Tek kaynak video için aşama aşama ölçüm
+    
+    Her aşama, girdisi bellekteki karelerden gelen bir clip üzerinde tek
+    başına ölçülür (decode ve önceki aşamalar süreye karışmaz); toplamdan
+    çıkarma yapılmaz.
+    
+    Args:
+        manager: VideoManager
+        video_path: Sentetik video
+        audio_path: Sessiz ses
+        duration: Süre (saniye)
+        workdir: Geçici klasör
+        fps: Kare hızı
+        repeat: Her ölçümün tekrar sayısı (medyan alınır)
+    
+    Returns:
+        dict: Aşama sonuçları
+    """
+    from moviepy import VideoFileClip, AudioFileClip
+    
+    frames = int(duration * fps)
+    times = [i / fps for i in range(frames)]
+    stages = {}
+    
+    source = VideoFileClip(video_path)
+    audio = AudioFileClip(audio_path)
+    
+    # Alt yazı oluşturma (kare başına değil, bir kerelik maliyet; sprite önbelleği her turda boşaltılır)
+    def word_by_word():
+        manager.subtitle_rasterizer._cache.clear()
+        return manager.create_word_by_word_subtitle(SAMPLE_TEXT, 1080, 1920, duration)
+    stages["subtitle_word_by_word"] = _stage(_median_seconds(word_by_word, repeat))
+    subtitle_events = word_by_word()
+    
+    def scrolling():
+        return manager.create_scrolling_subtitle(SAMPLE_TEXT, 1080, 1920, duration)
+    stages["subtitle_scrolling"] = _stage(_median_seconds(scrolling, repeat))
+    scrolling_subtitle = scrolling()
+    
+    zoom_effect = ZoomEffect(
+        duration,
+        zoom_amount=config.ZOOM_AMOUNT,
+        direction=getattr(config, 'ZOOM_DIRECTION', 'center'),
+        easing=getattr(config, 'ZOOM_EASING', 'linear')
+    )
+    
+    # Composite (config'teki alt yazı tipiyle)
+    compositor = LayerCompositor()
+    if getattr(config, 'SUBTITLE_TYPE', "word_by_word") == "scrolling":
+        compositor.add_dynamic(scrolling_subtitle)
+    else:
+        for event_start, event_end, sprite, x, y in subtitle_events:
+            compositor.add_timed(sprite, x, y, event_start, event_end)
+    
+    # Decode: gerçek dosyadan
+    stages["decode"] = _stage(_time_frames(source, times, repeat), frames)
+    
+    # Diğer aşamalar: girdi bir önceki aşamanın bellekteki kareleri
+    stage_input = _frame_source(_sample_frames(source, fps), duration, fps)
+    for name, build in (
+        ("resize_crop", lambda clip: manager._fit_to_shorts(clip, 1080, 1920)),
+        ("zoom", lambda clip: clip.transform(zoom_effect)),
+        ("composite", lambda clip: clip.transform(compositor)),
+    ):
+        clip = build(stage_input)
+        stages[name] = _stage(_time_frames(clip, times, repeat), frames)
+        stage_input = _frame_source(_sample_frames(clip, fps), duration, fps)
+    
+    # Encode: hazır karelerden x264 + ses
+    output_path = os.path.join(workdir, "encode.mp4")
+    encode_input = stage_input.with_audio(audio)
+    
+    def encode(clip):
+        clip.write_videofile(
+            output_path,
+            codec='libx264',
+            audio_codec='aac',
+            fps=fps,
+            logger=None,
+            **moviepy_kwargs(get_profile())
+        )
+    stages["encode"] = _stage(_median_seconds(lambda: encode(encode_input), repeat), frames)
+    
+    # Tüm zincir dosyadan dosyaya (aşamaların birlikte maliyeti)
+    pipeline = manager._fit_to_shorts(source, 1080, 1920).transform(zoom_effect).transform(compositor)
+    pipeline = pipeline.with_audio(audio)
+    stages["pipeline_total"] = _stage(_median_seconds(lambda: encode(pipeline), repeat), frames)
+    
+    source.close()
+    audio.close()
+    return stages
+
+
+def _use_temp_caches(root):
+    """
+    config'teki önbellek ve veritabanı yollarını geçici klasöre yönlendir
+    
+    Args:
+        root: Geçici önbellek klasörü
+    """
+    for name, filename in (
+        ("FOOTAGE_CACHE_DIR", "footage"),
+        ("FOOTAGE_LIBRARY_DB", "footage_library.sqlite"),
+        ("SEARCH_CACHE_PATH", "search_cache.sqlite"),
+        ("PEXELS_RATE_DB", "pexels_rate.sqlite"),
+        ("FOOTAGE_POOL_DB", "footage_pool.sqlite"),
+        ("SUBTITLE_CACHE_DIR", "subtitles"),
+    ):
+        setattr(config, name, os.path.join(root, filename))
+
+
+def run_benchmark(duration=30, backend=None, repeat=3):
+    """
+    Tüm kaynaklar için ölçüm yap
+    
+    Args:
+        duration: Sentetik video/ses süresi (saniye)
+        backend: create_final_video render motoru (None = config'deki)
+        repeat: Her ölçümün tekrar sayısı (medyan alınır)
+    
+    Returns:
+        dict: JSON'a yazılacak sonuç
+    """
+    from video_manager import VideoManager
+    
+    if backend:
+        config.RENDER_BACKEND = backend
+    
+    results = {
+        "meta": {
+            "duration": duration,
+            "fps": 30,
+            "repeat": repeat,
+            "backend": getattr(config, 'RENDER_BACKEND', 'moviepy'),
+            "encoding_profile": get_profile()["name"],
+            "subtitle_type": getattr(config, 'SUBTITLE_TYPE', "word_by_word"),
+            "zoom": config.ENABLE_ZOOM_EFFECT,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "sources": {},
+    }
+    
+    with tempfile.TemporaryDirectory(prefix="benchmark_") as workdir:
+        # VideoManager'ın açtığı sqlite ve önbellek klasörleri repodaki cache/'e yazılmasın
+        _use_temp_caches(os.path.join(workdir, "cache"))
+        manager = VideoManager(template_name=config.DEFAULT_TEMPLATE)
+        
+        # Önbellekler ölçümü bozmasın
+        manager.footage_cache = None
+        manager.subtitle_rasterizer.cache_dir = None
+        
+        print(f"🧪 Sentetik medya üretiliyor ({duration}s)...")
+        videos, audio_path = generate_synthetic_media(workdir, duration)
+        
+        for name, video_path in videos.items():
+            print(f"⏱️ Aşamalar ölçülüyor: {name}")
+            stages = benchmark_source(manager, video_path, audio_path, duration, workdir, repeat=repeat)
+            
+            # Gerçek giriş noktası (render motoru seçimi, intro/outro, watermark dahil)
+            output_path = os.path.join(workdir, f"final_{name}.mp4")
+            seconds = _median_seconds(
+                lambda: manager.create_final_video(video_path, audio_path, output_path, subtitle_text=SAMPLE_TEXT),
+                repeat
+            )
+            stages["create_final_video"] = _stage(seconds, int(duration * 30))
+            
+            results["sources"][name] = stages
+    
+    results["peak_rss_mb"] = peak_rss_mb()
+    return results
+
+
+def smoke_ffmpeg(duration=3):
+    """
+    Varsayılan ayarlarla FFmpeg motorunu MoviePy'ye düşmeden çalıştır
+    
+    create_final_video FFmpeg hatasında sessizce MoviePy'ye döner; bu kontrol
+    kullanılan ffmpeg'de (get_ffmpeg_exe) eksik filtre gibi sorunları yakalar.
+    
+    Args:
+        duration: Sentetik video süresi (saniye)
+    
+    Returns:
+        bool: Render başarılı mı
+    """
+    from template_manager import TemplateManager
+    from ffmpeg_renderer import FFmpegRenderer
+    
+    print(f"🧪 FFmpeg duman testi: {get_ffmpeg_exe()}")
+    renderer = FFmpegRenderer(TemplateManager(config.DEFAULT_TEMPLATE))
+    
+    with tempfile.TemporaryDirectory(prefix="benchmark_smoke_") as workdir:
+        videos, audio_path = generate_synthetic_media(workdir, duration)
+        output_path = os.path.join(workdir, "smoke.mp4")
+        try:
+            renderer.render(
+                [(path, None, None) for path in videos.values()],
+                audio_path,
+                output_path,
+                duration,
+                subtitle_text=SAMPLE_TEXT,
+                subtitle_type=getattr(config, 'SUBTITLE_TYPE', "word_by_word")
+            )
+        except Exception as e:
+            print(f"❌ FFmpeg motoru varsayılan ayarlarla çalışmıyor: {e}")
+            return False
+        
+        print(f"✅ FFmpeg motoru çalışıyor ({os.path.getsize(output_path) / 1024:.0f} KB)")
+        return True
+
+
+def compare_with_baseline(results, baseline, tolerance=0.10):
+    """
+    Sonuçları baseline ile karşılaştır
+    
+    Args:
+        results: Yeni sonuçlar
+        baseline: Kayıtlı baseline
+        tolerance: İzin verilen yavaşlama oranı (0.10 = %10)
+    
+    Returns:
+        list: Gerileme mesajları (boş = gerileme yok)
+    """
+    regressions = []
+    
+    print("\n📊 Baseline karşılaştırması:")
+    for name, stages in results["sources"].items():
+        base_stages = baseline.get("sources", {}).get(name, {})
+        for stage, current in stages.items():
+            base = base_stages.get(stage)
+            if not base or not base.get("seconds") or not current.get("seconds"):
+                continue
+            
+            ratio = current["seconds"] / base["seconds"]
+            mark = "🔴" if ratio > 1 + tolerance else ("🟢" if ratio < 1 - tolerance else "⚪")
+            print(f"   {mark} {name}/{stage}: {base['seconds']:.3f}s → {current['seconds']:.3f}s ({ratio:.2f}x)")
+            
+            # Çok kısa aşamalarda ölçüm gürültüsü oranı şişirir
+            if ratio > 1 + tolerance and current["seconds"] - base["seconds"] > MIN_REGRESSION_SECONDS:
+                regressions.append(f"{name}/{stage} {ratio:.2f}x yavaşladı")
+    
+    base_rss = baseline.get("peak_rss_mb")
+    rss = results.get("peak_rss_mb")
+    if base_rss and rss:
+        print(f"   💾 Peak RSS: {base_rss} MB → {rss} MB")
+        if rss > base_rss * (1 + tolerance):
+            regressions.append(f"peak RSS {rss / base_rss:.2f}x arttı")
+    
+    return regressions
+
+
+def print_summary(results):
+    """Sonuç tablosunu yazdır"""
+    for name, stages in results["sources"].items():
+        print(f"\n🎞️ {name}")
+        for stage, result in stages.items():
+            fps_text = f"{result['fps']:>8.2f} kare/sn" if result.get("fps") else " " * 16
+            print(f"   {stage:<24} {result['seconds']:>8.3f}s {fps_text}")
+    if results.get("peak_rss_mb") is not None:
+        print(f"\n💾 Peak RSS: {results['peak_rss_mb']} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="VideoOtoFabrika render benchmark")
+    parser.add_argument("--duration", type=float, default=30, help="Sentetik video süresi (saniye)")
+    parser.add_argument("--backend", choices=["moviepy", "ffmpeg"], help="Render motoru (varsayılan: config)")
+    parser.add_argument("--smoke", action="store_true", help="Sadece FFmpeg motoru duman testi")
+    parser.add_argument("--repeat", type=int, default=3, help="Her ölçümün tekrar sayısı (medyan alınır)")
+    parser.add_argument("--output", default=DEFAULT_RESULTS, help="Sonuç JSON dosyası")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON dosyası")
+    parser.add_argument("--save-baseline", action="store_true", help="Sonucu baseline olarak kaydet")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="İzin verilen yavaşlama oranı")
+    args = parser.parse_args()
+    
+    if args.smoke:
+        return 0 if smoke_ffmpeg() else 1
+    
+    results = run_benchmark(duration=args.duration, backend=args.backend, repeat=args.repeat)
+    print_summary(results)
+    
+    directory = os.path.dirname(args.output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    print(f"\n✅ Sonuçlar kaydedildi: {args.output}")
+    
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"📌 Baseline güncellendi: {args.baseline}")
+        return 0
+    
+    if not os.path.exists(args.baseline):
+        print(f"ℹ️ Baseline yok ({args.baseline}), --save-baseline ile oluşturun")
+        return 0
+    
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    
+    regressions = compare_with_baseline(results, baseline, args.tolerance)
+    if regressions:
+        print("\n❌ Performans gerilemesi:")
+        for message in regressions:
+            print(f"   - {message}")
+        return 1
+    
+    print("\n✅ Gerileme yok")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+"""
+VideoOtoFabrika - Katman Birleştirici (Compositor) Modülü
+CompositeVideoClip yerine: statik katmanlar bir kez ön-birleştirilir,
+her katman sadece kendi sınır kutusunda işlenir, t anında aktif olmayan
+katmanlar atlanır.
+"""
+
+import bisect
+import numpy as np
+from subtitle_renderer import Sprite
+
+
+def _resolve_position(value, size, frame_size):
+    """MoviePy konum değerini (sayı, "center", "left", ...) piksele çevir"""
+    if isinstance(value, str):
+        if value == "center":
+            return (frame_size - size) // 2
+        if value in ("right", "bottom"):
+            return frame_size - size
+        return 0
+    if isinstance(value, float) and 0 < value < 1:
+        # Göreli konum (relative=True ile verilmiş)
+        return int(value * frame_size)
+    return int(value)
+
+
+def sprite_from_clip(clip, frame_width, frame_height, t=0):
+    """
+    Sabit görünümlü bir MoviePy clip'ini (watermark, logo, renk bandı) sprite'a çevir
+    
+    Args:
+        clip: ImageClip / TextClip / ColorClip
+        frame_width: Kare genişliği
+        frame_height: Kare yüksekliği
+        t: Görüntünün alınacağı an
+    
+    Returns:
+        tuple: (Sprite, x, y)
+    """
+    rgb = clip.get_frame(t)[..., :3].astype(np.float32)
+    
+    if clip.mask is not None:
+        alpha = clip.mask.get_frame(t).astype(np.float32)
+    else:
+        alpha = np.ones(rgb.shape[:2], dtype=np.float32)
+    
+    rgba = np.empty(rgb.shape[:2] + (4,), dtype=np.uint8)
+    rgba[..., :3] = np.rint(rgb * alpha[..., None])
+    rgba[..., 3] = np.rint(alpha * 255.0)
+    
+    h, w = rgba.shape[:2]
+    pos = clip.pos(t)
+    if not isinstance(pos, (tuple, list)):
+        pos = (pos, pos)
+    
+    x = _resolve_position(pos[0], w, frame_width)
+    y = _resolve_position(pos[1], h, frame_height)
+    
+    return Sprite(rgba), x, y
+
+
+def _flatten_static(layers):
+    """
+    Ardışık statik katmanları birleşim kutusunda tek sprite'a indir (premultiplied over)
+    
+    Args:
+        layers: (Sprite, x, y) listesi (alttan üste)
+    
+    Returns:
+        tuple: (Sprite, x, y)
+    """
+    x0 = min(x for _, x, _ in layers)
+    y0 = min(y for _, _, y in layers)
+    x1 = max(x + s.width for s, x, _ in layers)
+    y1 = max(y + s.height for s, _, y in layers)
+    
+    canvas = np.zeros((y1 - y0, x1 - x0, 4), dtype=np.float32)
+    for sprite, x, y in layers:
+        src = sprite.rgba.astype(np.float32)
+        dst = canvas[y - y0:y - y0 + sprite.height, x - x0:x - x0 + sprite.width]
+        dst *= 1.0 - src[..., 3:4] / 255.0
+        dst += src
+    
+    return Sprite(np.rint(canvas).astype(np.uint8)), x0, y0
+
+
+class LayerCompositor:
+    def __init__(self):
+        """Boş katman birleştirici oluştur (katmanlar eklenme sırasıyla üst üste biner)"""
+        self._layers = []
+        self._groups = None
+    
+    def __len__(self):
+        return len(self._layers)
+    
+    def add_static(self, sprite, x, y):
+        """
+        Değişmeyen katman ekle (watermark, logo) - diğer statiklerle bir kez birleştirilir
+        
+        Args:
+            sprite: Sprite
+            x: Sol üst köşe x
+            y: Sol üst köşe y
+        """
+        self._layers.append(("static", (sprite, x, y)))
+        self._groups = None
+    
+    def add_timed(self, sprite, x, y, start, end):
+        """
+        Sadece [start, end) aralığında görünen sabit katman ekle (kelime grubu alt yazısı)
+        
+        Args:
+            sprite: Sprite
+            x: Sol üst köşe x
+            y: Sol üst köşe y
+            start: Başlangıç zamanı
+            end: Bitiş zamanı
+        """
+        self._layers.append(("timed", (start, end, sprite, x, y)))
+        self._groups = None
+    
+    def add_dynamic(self, layer, start=0, end=None):
+        """
+        Her karede değişen katman ekle (kayan alt yazı)
+        
+        Args:
+            layer: apply(frame, t) metodu olan nesne (sadece kendi alanını işlemeli)
+            start: Başlangıç zamanı
+            end: Bitiş zamanı (None = sonuna kadar)
+        """
+        self._layers.append(("dynamic", (layer, start, end)))
+        self._groups = None
+    
+    def _prepare(self):
+        """Ardışık aynı tür katmanları grupla, statik grupları ön-birleştir"""
+        groups = []
+        for kind, layer in self._layers:
+            if groups and groups[-1][0] == kind and kind != "dynamic":
+                groups[-1][1].append(layer)
+            else:
+                groups.append((kind, [layer]))
+        
+        prepared = []
+        for kind, layers in groups:
+            if kind == "static":
+                prepared.append((kind, _flatten_static(layers)))
+            elif kind == "timed":
+                layers.sort(key=lambda e: e[0])
+                prepared.append((kind, (layers, [e[0] for e in layers])))
+            else:
+                prepared.append((kind, layers[0]))
+        
+        self._groups = prepared
+    
+    def apply(self, frame, t):
+        """
+        Tüm katmanları kareye uygula (sadece sınır kutuları işlenir)
+        
+        Args:
+            frame: RGB kare
+            t: Zaman (saniye)
+        
+        Returns:
+            numpy.ndarray: Birleştirilmiş kare
+        """
+        if self._groups is None:
+            self._prepare()
+        
+        if not frame.flags.writeable:
+            frame = frame.copy()
+        
+        for kind, group in self._groups:
+            if kind == "static":
+                sprite, x, y = group
+                sprite.blit(frame, x, y)
+            elif kind == "timed":
+                events, starts = group
+                # Sadece t'den önce başlayanlar aday
+                for start, end, sprite, x, y in events[:bisect.bisect_right(starts, t)]:
+                    if t < end:
+                        sprite.blit(frame, x, y)
+            else:
+                layer, start, end = group
+                if t >= start and (end is None or t < end):
+                    frame = layer.apply(frame, t)
+        
+        return frame
+    
+    def __call__(self, get_frame, t):
+        """MoviePy clip.transform() ile kullanım için"""
+        return self.apply(get_frame(t), t)
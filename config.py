@@ -39,6 +39,10 @@ VOICE_SPEED = 1.5
 # Ses modeli (tr-TR-AhmetNeural veya tr-TR-EmelNeural)
 VOICE_MODEL = "tr-TR-AhmetNeural"
 
+# Normal hızda (1.0x) saniyede okunan kelime - ses üretilmeden video süresini tahmin
+# etmek için (stok videolar seslendirmeyle aynı anda aranıp indirilir)
+TTS_WORDS_PER_SECOND = 2.3
+
 # ==========================================
 # YÜKLEME AYARLARI
 # ==========================================
@@ -69,6 +73,190 @@ ENABLE_ZOOM_EFFECT = True
 # Zoom miktarı (0.15 = %15 zoom)
 ZOOM_AMOUNT = 0.15
 
+# Zoom sırasında kaydırma yönü (Ken Burns):
+# center, left, right, up, down, up-left, up-right, down-left, down-right
+ZOOM_DIRECTION = "center"
+
+# Zoom hız eğrisi: linear, ease_in, ease_out, ease_in_out
+ZOOM_EASING = "linear"
+
+# Render motoru:
+# - "moviepy": Kareler Python'da işlenir (yedek, her özellik destekli)
+# - "ffmpeg": Tek ffmpeg filtergraph'ı (çok daha hızlı, intro/outro yoksa)
+# FFmpeg motoru hata verirse otomatik olarak MoviePy'ye geçilir
+RENDER_BACKEND = "ffmpeg"
+
+# ffmpeg yolu (None = PATH'teki ffmpeg, yoksa MoviePy'nin ffmpeg'i)
+FFMPEG_BINARY = None
+
+# MoviePy render'ı kaç parçaya bölünsün (1 = tek parça, >1 = parçalar paralel süreçlerde)
+RENDER_SEGMENTS = 1
+
+# Paralel render süreç sayısı (None = CPU çekirdek sayısı)
+RENDER_WORKERS = None
+
+# Encode profili: "draft" (hızlı önizleme), "standard" (Shorts), "archival" (yüksek kalite)
+ENCODING_PROFILE = "standard"
+
+# x264 encode profilleri
+# preset: hız/sıkıştırma dengesi, crf: kalite (düşük = daha iyi), tune: içerik tipi,
+# gop: anahtar kare aralığı (kare), threads: None = CPU çekirdek sayısı
+# (En uygun preset/crf için: python encoding_profiles.py referans.mp4)
+ENCODING_PROFILES = {
+    "draft": {"preset": "veryfast", "crf": 28, "tune": None, "gop": 60, "threads": None},
+    "standard": {"preset": "faster", "crf": 23, "tune": None, "gop": 60, "threads": None},
+    "archival": {"preset": "slow", "crf": 18, "tune": "film", "gop": 30, "threads": None},
+}
+
+# ==========================================
+# ÖNBELLEK AYARLARI
+# ==========================================
+
+# İndirilen stok videolar bir kez 1080x1920/30fps'e dönüştürülüp saklanır
+# (aynı video tekrar kullanıldığında indirme ve ölçekleme yapılmaz)
+FOOTAGE_CACHE_ENABLED = True
+
+# Stok video önbellek klasörü
+FOOTAGE_CACHE_DIR = "cache/footage"
+
+# Stok video önbelleği disk bütçesi (GB) - aşılınca en eski kullanılanlar silinir
+FOOTAGE_CACHE_MAX_GB = 20
+
+# Yerel lisanslı stok video klasörü (None = kapalı). Pexels'ten önce burada aranır.
+# Etiketler klip.json / klip.txt yan dosyalarından veya dosya adından okunur.
+FOOTAGE_LIBRARY_DIR = None
+
+# Yerel kütüphane indeksi (sqlite FTS5)
+FOOTAGE_LIBRARY_DB = "cache/footage_library.sqlite"
+
+# Yerelde en az bu kadar klip bulunursa Pexels'e hiç gidilmez
+FOOTAGE_LIBRARY_MIN_RESULTS = 3
+
+# Pexels arama yanıtları önbelleği (sqlite)
+SEARCH_CACHE_ENABLED = True
+SEARCH_CACHE_PATH = "cache/search_cache.sqlite"
+
+# Arama sonucu bu süre boyunca taze sayılır (saniye)
+SEARCH_CACHE_TTL = 24 * 60 * 60
+
+# TTL dolduktan sonra bu süre boyunca bayat sonuç kullanılır, arka planda yenilenir (saniye)
+SEARCH_CACHE_STALE_TTL = 7 * 24 * 60 * 60
+
+# Sadece önbellek: Pexels'e hiç istek atılmaz (çevrimdışı test / benchmark için)
+SEARCH_CACHE_ONLY = False
+
+# Asıl terimle birlikte eşzamanlı aranacak eş anlamlılar (terim -> liste)
+SEARCH_SYNONYMS = {
+    "money": ["cash", "dollar bills"],
+    "luxury car": ["sports car", "supercar"],
+    "mansion": ["luxury house", "villa"],
+    "success": ["celebration", "winner"],
+    "entrepreneur": ["businessman", "startup"],
+    "ai": ["artificial intelligence", "robot"],
+    "space": ["galaxy", "stars"],
+    "ocean": ["sea", "underwater"],
+    "football": ["soccer"],
+}
+
+# Konuyla ilgili sorgular MAX_VIDEOS videodan azını bulursa eksik yerleri dolduran genel terim
+# (sonuçları her zaman konuyla ilgili videoların arkasında kalır)
+SEARCH_FALLBACK_TERM = "nature"
+
+# Pexels hız sınırı: tüm süreçler bu sqlite kovasını paylaşır
+PEXELS_RATE_DB = "cache/pexels_rate.sqlite"
+
+# Saatlik istek hakkı (Pexels varsayılanı 200/saat) ve art arda yapılabilecek istek
+PEXELS_RATE_PER_HOUR = 200
+PEXELS_RATE_BURST = 20
+
+# Bir istek hak beklerken en fazla bu kadar sırada kalır, sonra hata verir (saniye)
+PEXELS_MAX_WAIT = 600
+
+# Önceden ısıtılmış klip havuzları (python prewarm.py ile doldurulur).
+# Havuzu olan terimler ağa çıkmadan çözülür, klipler her videoda sırayla döner.
+FOOTAGE_POOL_DB = "cache/footage_pool.sqlite"
+
+# Isıtılacak arama terimleri (None = content_generator.py'deki prompt sözlüğü)
+PREWARM_TERMS = None
+
+# Terim başına havuzdaki klip sayısı (MAX_VIDEOS'tan büyük olmalı ki videolar tekrar etmesin)
+PREWARM_POOL_SIZE = 12
+
+# Her klipten indirilecek süre (saniye) - 60 sn ses / 5 video = 12 sn
+PREWARM_CLIP_DURATION = 12
+
+# İş kaydı: her aşamanın çıktısı (senaryo, ses, klipler) sqlite'ta saklanır.
+# Render/yükleme hata verirse dosyalar silinmez; python main.py --resume ile
+# iş ilk eksik aşamadan devam eder (Gemini, TTS ve indirme tekrar ödenmez)
+JOB_STORE_DB = "cache/jobs.sqlite"
+
+# Bu kadar kez hata veren veya bu kadar saatten eski hatalı işler bırakılır:
+# çalışma klasörü silinir, çıktı adı serbest kalır (elle: python main.py --discard ID)
+JOB_MAX_ATTEMPTS = 3
+JOB_MAX_AGE_HOURS = 72
+
+# Çalışan işin heartbeat'i bu kadar saniye yenilenmezse sahibi çökmüş sayılır
+# ve --resume ile başka süreç devralabilir (canlı işler devralınmaz)
+JOB_LEASE_SECONDS = 120
+
+# Hatalı işlerin tmpfs'teki çalışma klasörleri --resume'a kadar buraya (diske) taşınır
+WORKSPACE_PARK_DIR = "cache/failed_jobs"
+
+# Her iş kendi çalışma klasöründe çalışır (ses, ham klipler, ara dosyalar).
+# None = yer varsa tmpfs (WORKSPACE_TMPFS), yoksa sistemin geçici klasörü
+WORKSPACE_ROOT = None
+WORKSPACE_TMPFS = "/dev/shm"
+
+# Bir işin ara dosyalarının tahmini boyutu ve tmpfs seçilirken hem tmpfs'te
+# hem bellekte kalması gereken boş alan (MB) - render'lara bellek kalsın
+WORKSPACE_SIZE_MB = 500
+WORKSPACE_MIN_FREE_MB = 2048
+
+# ==========================================
+# İNDİRME AYARLARI
+# ==========================================
+
+# Aynı anda indirilecek stok video sayısı
+DOWNLOAD_WORKERS = 5
+
+# İndirme okuma/yazma parça boyutu (bayt)
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Kesilen indirme kaç kez kaldığı yerden devam ettirilsin
+DOWNLOAD_RETRIES = 3
+
+# Stok videoların sadece kullanılacak saniyelerini indir (HTTP Range, yeniden encode yok)
+PARTIAL_DOWNLOAD = True
+
+# Önbellekte olmayan videoları diske indirmeden render sırasında HTTP'den akıt
+# (sadece FFmpeg motoru ve faststart MP4; diğerleri normal indirilir). Akıtılan
+# videolar önbelleğe alınmaz - tek seferlik klipler için.
+STREAM_UNCACHED = False
+
+# Akışta ağdan okunup decode'u bekleyebilecek maksimum veri (MB)
+STREAM_READ_AHEAD_MB = 16
+
+
+# ==========================================
+# ZAMANLAYICI AYARLARI (toplu mod)
+# ==========================================
+
+# Aynı anda çalışabilecek ağ aşaması (Gemini, edge-tts, Pexels indirme, yükleme)
+NETWORK_CONCURRENCY = 8
+
+# Eşzamanlı render sayısı (None = çekirdek sayısı / RENDER_THREADS ve
+# kullanılabilir bellek / RENDER_MEMORY_MB'den küçüğü)
+RENDER_SLOTS = None
+
+# Slot hesabında bir render'a düşen çekirdek sayısı
+RENDER_THREADS = 4
+
+# Bir render'ın tepe bellek kullanımı (MB); bu kadar boş bellek yoksa render sırada bekler
+RENDER_MEMORY_MB = 1500
+
+# Aynı anda işlenen iş sayısı (None = ağ + 2 × render slotu)
+MAX_ACTIVE_JOBS = None
+
 
 # ==========================================
 # ALT YAZI AYARLARI
@@ -78,3 +266,9 @@ ZOOM_AMOUNT = 0.15
 # - "word_by_word": Kelime kelime göster (statik, ekranın ortasında)
 # - "scrolling": Aşağıdan yukarıya kayan (dinamik, TikTok tarzı)
 SUBTITLE_TYPE = "scrolling"  # KAYAN YAZI (VİRAL!)
+
+# Alt yazı sprite önbelleği (bellekte tutulacak kelime grubu sayısı)
+SUBTITLE_CACHE_SIZE = 256
+
+# Alt yazı disk önbelleği klasörü (None = sadece bellek)
+SUBTITLE_CACHE_DIR = "cache/subtitles"
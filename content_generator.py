@@ -11,6 +11,41 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+# Prompt'ta Gemini'ye verilen arama terimi sözlüğü (kategori -> terimler).
+# prewarm.py aynı listeyi kullanarak bu terimlerin stok videolarını önceden indirir.
+SEARCH_VOCABULARY = {
+    "Para/Lüks": ["money", "luxury car", "mansion", "yacht", "gold", "cash"],
+    "Başarı": ["success", "entrepreneur", "business", "startup", "office"],
+    "Teknoloji": ["technology", "ai", "robot", "computer", "future"],
+    "Bilim": ["science", "space", "laboratory", "research", "brain"],
+    "Hayvanlar": ["shark", "lion", "eagle", "ocean", "wildlife"],
+    "Spor": ["football", "basketball", "athlete", "stadium", "training"],
+}
+
+
+def search_terms():
+    """
+    Sözlükteki tüm arama terimleri (prompt sırasıyla, tekrarsız)
+    
+    Returns:
+        list: Arama terimleri
+    """
+    terms = []
+    for category_terms in SEARCH_VOCABULARY.values():
+        for term in category_terms:
+            if term not in terms:
+                terms.append(term)
+    return terms
+
+
+def _vocabulary_prompt_lines():
+    """Sözlüğü prompt satırlarına çevir: - Para/Lüks için: "money", "luxury car", ..."""
+    return "\n".join(
+        f'            - {category} için: ' + ", ".join(f'"{term}"' for term in category_terms)
+        for category, category_terms in SEARCH_VOCABULARY.items()
+    )
+
+
 class ContentGenerator:
     def __init__(self):
         """Gemini API'yi yapılandır"""
@@ -85,12 +120,7 @@ class ContentGenerator:
             ❗ Pexels'te görseli bulunabilecek konular seç
             
             ARAMA TERİMİ İÇİN (KONUYLA TAM UYUMLU):
-            - Para/Lüks için: "money", "luxury car", "mansion", "yacht", "gold", "cash"
-            - Başarı için: "success", "entrepreneur", "business", "startup", "office"
-            - Teknoloji için: "technology", "ai", "robot", "computer", "future"
-            - Bilim için: "science", "space", "laboratory", "research", "brain"
-            - Hayvanlar için: "shark", "lion", "eagle", "ocean", "wildlife"
-            - Spor için: "football", "basketball", "athlete", "stadium", "training"
+{vocabulary}
             
             ÇOK ÖNEMLİ - ARAMA TERİMİ KURALLARI:
             ❗ Arama terimi KONUNUN ÖZÜ olmalı (örn: Para → "money", Araba → "luxury car")
@@ -104,7 +134,7 @@ class ContentGenerator:
             
             ARAMA_TERİMİ:
             [Pexels'te bulunabilecek genel arama terimi - 1-2 kelime, konuyla TAM UYUMLU]
-            """
+            """.replace("{vocabulary}", _vocabulary_prompt_lines())
             
             print("🤖 Gemini'den içerik üretiliyor...")
             response = self.client.models.generate_content(
@@ -134,7 +164,7 @@ class ContentGenerator:
             print(f"🔍 Arama terimi: {search_term}")
             
             return scenario, search_term
-            
+        
         except Exception as e:
             print(f"❌ İçerik üretimi hatası: {e}")
             raise
@@ -0,0 +1,251 @@
+"""
+VideoOtoFabrika - Encode Profilleri Modülü
+config.ENCODING_PROFILES içindeki isimli x264 profillerini (draft, standard,
+archival) çözer, thread sayısını makinenin çekirdeklerine göre belirler ve
+MoviePy / ffmpeg için parametreleri üretir.
+
+Kalibrasyon: referans bir clip'i aday ayarlarla encode eder, SSIM/PSNR ve
+dosya boyutu hedefini karşılayan en hızlı ayarı seçer.
+
+Kullanım:
+    python encoding_profiles.py referans.mp4 --ssim 0.97 --max-mb 20
+"""
+
+import os
+import re
+import sys
+import time
+import argparse
+import itertools
+import subprocess
+import tempfile
+import config
+
+
+# config'te profil yoksa kullanılan varsayılanlar
+DEFAULT_PROFILES = {
+    "draft": {"preset": "veryfast", "crf": 28, "tune": None, "gop": 60, "threads": None},
+    "standard": {"preset": "faster", "crf": 23, "tune": None, "gop": 60, "threads": None},
+    "archival": {"preset": "slow", "crf": 18, "tune": "film", "gop": 30, "threads": None},
+}
+
+# Kalibrasyonda denenen adaylar (preset x crf)
+CALIBRATION_PRESETS = ["ultrafast", "superfast", "veryfast", "faster", "fast", "medium"]
+CALIBRATION_CRFS = [20, 23, 26]
+
+
+def get_profile(name=None):
+    """
+    İsimli encode profilini çöz
+    
+    Args:
+        name: Profil adı (None = config.ENCODING_PROFILE)
+    
+    Returns:
+        dict: preset, crf, tune, gop, threads (threads her zaman sayı)
+    """
+    profiles = getattr(config, 'ENCODING_PROFILES', DEFAULT_PROFILES)
+    name = name or getattr(config, 'ENCODING_PROFILE', "standard")
+    
+    if name not in profiles:
+        raise ValueError(f"Bilinmeyen encode profili: {name} (seçenekler: {', '.join(profiles)})")
+    
+    profile = dict(DEFAULT_PROFILES.get(name, DEFAULT_PROFILES["standard"]))
+    profile.update(profiles[name])
+    profile["name"] = name
+    
+    # None = tüm çekirdekler (x264 çekirdek başına ~1.5 thread'e kadar ölçeklenir)
+    if not profile.get("threads"):
+        profile["threads"] = os.cpu_count() or 1
+    
+    return profile
+
+
+def x264_args(profile, threads=None):
+    """
+    Profil için ffmpeg x264 argümanları
+    
+    Args:
+        profile: get_profile() sonucu
+        threads: Thread sayısı (None = profildeki)
+    
+    Returns:
+        list: ["-preset", ..., "-crf", ..., "-g", ..., "-threads", ...]
+    """
+    gop = str(profile["gop"])
+    args = [
+        "-preset", profile["preset"],
+        "-crf", str(profile["crf"]),
+        "-g", gop,
+        "-keyint_min", gop,
+        "-sc_threshold", "0",
+    ]
+    if profile.get("tune"):
+        args += ["-tune", profile["tune"]]
+    args += ["-threads", str(threads or profile["threads"])]
+    return args
+
+
+def moviepy_kwargs(profile, threads=None):
+    """
+    Profil için write_videofile() parametreleri
+    
+    Args:
+        profile: get_profile() sonucu
+        threads: Thread sayısı (None = profildeki)
+    
+    Returns:
+        dict: preset, threads, ffmpeg_params
+    """
+    gop = str(profile["gop"])
+    ffmpeg_params = [
+        "-crf", str(profile["crf"]),
+        "-g", gop,
+        "-keyint_min", gop,
+        "-sc_threshold", "0",
+    ]
+    if profile.get("tune"):
+        ffmpeg_params += ["-tune", profile["tune"]]
+    
+    return {
+        "preset": profile["preset"],
+        "threads": threads or profile["threads"],
+        "ffmpeg_params": ffmpeg_params,
+    }
+
+
+def measure_quality(reference_path, encoded_path):
+    """
+    Encode edilmiş dosyayı referansla karşılaştır
+    
+    Args:
+        reference_path: Referans video
+        encoded_path: Encode edilmiş video
+    
+    Returns:
+        tuple: (SSIM, PSNR dB)
+    """
+    from ffmpeg_renderer import get_ffmpeg_exe
+    
+    cmd = [
+        get_ffmpeg_exe(), "-hide_banner", "-nostats",
+        "-i", encoded_path, "-i", reference_path,
+        "-lavfi", "[0:v][1:v]ssim;[0:v][1:v]psnr",
+        "-f", "null", "-",
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Kalite ölçülemedi: {result.stderr.strip()[-300:]}")
+    
+    ssim = re.search(r"SSIM .*All:([\d.]+)", result.stderr)
+    psnr = re.search(r"PSNR .*average:([\d.]+|inf)", result.stderr)
+    return (
+        float(ssim.group(1)) if ssim else 0.0,
+        float(psnr.group(1)) if psnr else 0.0,
+    )
+
+
+def calibrate(reference_path, target_ssim=0.97, target_psnr=None, max_size_mb=None,
+              presets=None, crfs=None, tune=None, gop=60, threads=None):
+    """
+    Hedefleri karşılayan en hızlı x264 ayarını bul
+    
+    Args:
+        reference_path: Referans clip (tipik bir Short, 1080x1920)
+        target_ssim: Minimum SSIM
+        target_psnr: Minimum PSNR (dB, None = kontrol yok)
+        max_size_mb: Maksimum dosya boyutu (MB, None = kontrol yok)
+        presets: Denenecek preset'ler
+        crfs: Denenecek CRF değerleri
+        tune: x264 tune (opsiyonel)
+        gop: Anahtar kare aralığı
+        threads: Thread sayısı (None = tüm çekirdekler)
+    
+    Returns:
+        tuple: (en iyi sonuç veya None, tüm sonuçlar listesi)
+    """
+    from ffmpeg_renderer import get_ffmpeg_exe
+    
+    results = []
+    
+    with tempfile.TemporaryDirectory(prefix="calibrate_") as workdir:
+        for preset, crf in itertools.product(presets or CALIBRATION_PRESETS, crfs or CALIBRATION_CRFS):
+            profile = {"preset": preset, "crf": crf, "tune": tune, "gop": gop,
+                       "threads": threads or os.cpu_count() or 1}
+            output_path = os.path.join(workdir, f"{preset}_{crf}.mp4")
+            
+            cmd = [
+                get_ffmpeg_exe(), "-y", "-hide_banner", "-loglevel", "error",
+                "-i", reference_path, "-an",
+                "-c:v", "libx264", *x264_args(profile),
+                "-pix_fmt", "yuv420p",
+                output_path,
+            ]
+            start = time.perf_counter()
+            subprocess.run(cmd, check=True)
+            seconds = time.perf_counter() - start
+            
+            ssim, psnr = measure_quality(reference_path, output_path)
+            size_mb = os.path.getsize(output_path) / (1024 * 1024)
+            
+            passed = ssim >= target_ssim
+            if target_psnr is not None:
+                passed = passed and psnr >= target_psnr
+            if max_size_mb is not None:
+                passed = passed and size_mb <= max_size_mb
+            
+            result = {
+                "preset": preset, "crf": crf, "seconds": round(seconds, 2),
+                "ssim": round(ssim, 4), "psnr": round(psnr, 2),
+                "size_mb": round(size_mb, 2), "passed": passed,
+            }
+            results.append(result)
+            
+            mark = "✅" if passed else "❌"
+            print(f"   {mark} {preset:<10} crf={crf:<3} {seconds:6.2f}s  "
+                  f"SSIM={ssim:.4f}  PSNR={psnr:5.2f}  {size_mb:6.2f} MB")
+            
+            os.remove(output_path)
+    
+    passing = [r for r in results if r["passed"]]
+    best = min(passing, key=lambda r: r["seconds"]) if passing else None
+    return best, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="x264 encode ayarı kalibrasyonu")
+    parser.add_argument("reference", help="Referans video (tipik bir Short)")
+    parser.add_argument("--ssim", type=float, default=0.97, help="Minimum SSIM")
+    parser.add_argument("--psnr", type=float, help="Minimum PSNR (dB)")
+    parser.add_argument("--max-mb", type=float, help="Maksimum dosya boyutu (MB)")
+    parser.add_argument("--tune", help="x264 tune (film, animation, ...)")
+    parser.add_argument("--gop", type=int, default=60, help="Anahtar kare aralığı")
+    args = parser.parse_args()
+    
+    print(f"🎯 Kalibrasyon: SSIM≥{args.ssim}"
+          + (f", PSNR≥{args.psnr}" if args.psnr else "")
+          + (f", ≤{args.max_mb} MB" if args.max_mb else ""))
+    
+    best, _ = calibrate(
+        args.reference,
+        target_ssim=args.ssim,
+        target_psnr=args.psnr,
+        max_size_mb=args.max_mb,
+        tune=args.tune,
+        gop=args.gop
+    )
+    
+    if not best:
+        print("\n❌ Hedefleri karşılayan ayar bulunamadı")
+        return 1
+    
+    print(f"\n🏆 En hızlı uygun ayar: preset={best['preset']}, crf={best['crf']} "
+          f"({best['seconds']}s, SSIM={best['ssim']}, {best['size_mb']} MB)")
+    print("ℹ️ config.py içindeki ENCODING_PROFILES'a şöyle ekleyebilirsin:")
+    print(f'    "calibrated": {{"preset": "{best["preset"]}", "crf": {best["crf"]}, '
+          f'"tune": {repr(args.tune)}, "gop": {args.gop}, "threads": None}},')
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
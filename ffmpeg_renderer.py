@@ -0,0 +1,460 @@
+"""
+VideoOtoFabrika - FFmpeg Render Modülü
+create_final_video planını tek bir ffmpeg filtergraph'ına çevirir.
+Kareler Python'dan geçmez; ölçekleme, kırpma, zoom, watermark ve
+alt yazı tamamen ffmpeg içinde yapılır.
+"""
+
+import os
+import math
+import shutil
+import subprocess
+import tempfile
+import numpy as np
+import config
+from zoom_effect import ZoomEffect
+from subtitle_renderer import split_lines
+from encoding_profiles import get_profile, x264_args
+from stream_source import HTTPStreamSource
+
+
+def get_ffmpeg_exe():
+    """
+    Kullanılacak ffmpeg çalıştırılabilir dosyasını bul
+    
+    Returns:
+        str: ffmpeg yolu (config.FFMPEG_BINARY > PATH > imageio-ffmpeg)
+    """
+    binary = getattr(config, 'FFMPEG_BINARY', None)
+    if binary:
+        return binary
+    
+    found = shutil.which("ffmpeg")
+    if found:
+        return found
+    
+    # MoviePy'nin kullandığı ffmpeg
+    import imageio_ffmpeg
+    return imageio_ffmpeg.get_ffmpeg_exe()
+
+
+def escape_filter_value(value):
+    """
+    Filtergraph içinde tek tırnakla kullanılacak değeri kaçır (Windows yolları dahil)
+    
+    İki seviye vardır: filtre seçeneği ayrıştırıcısı için ':' ve "'" ters
+    bölüyle kaçırılır; filtergraph seviyesinde tırnak içinde ters bölü
+    işlenmez, bu yüzden "'" tırnağı kapatıp kaçırılarak yazılır ('\\'').
+    """
+    value = str(value).replace("\\", "/")
+    value = value.replace(":", "\\:").replace("'", "\\'")
+    return value.replace("'", "'\\''")
+
+
+def ass_color(color, opacity=1.0):
+    """
+    Şablon rengini ASS formatına çevir (&HAABBGGRR)
+    
+    Args:
+        color: Renk adı veya #RRGGBB
+        opacity: Opaklık (0-1)
+    
+    Returns:
+        str: ASS renk kodu
+    """
+    from PIL import ImageColor
+    
+    r, g, b = ImageColor.getrgb(color)[:3]
+    alpha = int(round((1.0 - opacity) * 255))
+    return f"&H{alpha:02X}{b:02X}{g:02X}{r:02X}"
+
+
+def font_family(font_path, default="Arial"):
+    """Font dosyasından aile adını oku (libass dosya yolu değil aile adı ister)"""
+    if not font_path or not os.path.exists(font_path):
+        return default
+    
+    try:
+        from PIL import ImageFont
+        return ImageFont.truetype(font_path, 10).getname()[0]
+    except Exception:
+        return default
+
+
+def _ass_time(seconds):
+    """Saniyeyi ASS zaman damgasına çevir (H:MM:SS.cc)"""
+    centis = int(round(max(seconds, 0) * 100))
+    hours, centis = divmod(centis, 360000)
+    minutes, centis = divmod(centis, 6000)
+    secs, centis = divmod(centis, 100)
+    return f"{hours}:{minutes:02d}:{secs:02d}.{centis:02d}"
+
+
+def _ass_text(text):
+    """ASS olay metnindeki özel karakterleri kaçır"""
+    return text.replace("\\", "\\\\").replace("{", "(").replace("}", ")").replace("\n", "\\N")
+
+
+class FFmpegRenderer:
+    def __init__(self, template, width=1080, height=1920, fps=30, footage_cache=None, profile=None):
+        """
+        FFmpeg render motorunu başlat
+        
+        Args:
+            template: TemplateManager nesnesi
+            width: Çıktı genişliği
+            height: Çıktı yüksekliği
+            fps: Çıktı kare hızı
+            footage_cache: FootageCache (mezzanine dosyaları ölçeklenmeden kullanılır)
+            profile: Encode profili (None = config.ENCODING_PROFILE)
+        """
+        self.template = template
+        self.footage_cache = footage_cache
+        self.profile = profile or get_profile()
+        self.settings = template.get_template_settings()
+        self.width = width
+        self.height = height
+        self.fps = fps
+    
+    def build_ass_subtitles(self, text, duration, subtitle_type="word_by_word"):
+        """
+        Alt yazı metninden ASS dosya içeriği üret
+        
+        Args:
+            text: Alt yazı metni
+            duration: Video süresi
+            subtitle_type: "word_by_word" veya "scrolling"
+        
+        Returns:
+            str: ASS dosya içeriği
+        """
+        if subtitle_type == "scrolling":
+            style, events = self._scrolling_events(text, duration)
+        else:
+            style, events = self._word_by_word_events(text, duration)
+        
+        header = [
+            "[Script Info]",
+            "ScriptType: v4.00+",
+            f"PlayResX: {self.width}",
+            f"PlayResY: {self.height}",
+            "WrapStyle: 0",
+            "ScaledBorderAndShadow: yes",
+            "",
+            "[V4+ Styles]",
+            "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, "
+            "BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, "
+            "BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding",
+            style,
+            "",
+            "[Events]",
+            "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text",
+        ]
+        return "\n".join(header + events) + "\n"
+    
+    def _style_line(self, font_path, font_size, color, stroke_color, stroke_width, margin):
+        """Tek bir ASS stil satırı oluştur (üst-orta hizalı)"""
+        return (
+            f"Style: Main,{font_family(font_path)},{font_size},{ass_color(color)},&H000000FF,"
+            f"{ass_color(stroke_color)},&H00000000,0,0,0,0,100,100,0,0,1,{stroke_width},0,8,"
+            f"{margin},{margin},0,1"
+        )
+    
+    def _word_by_word_events(self, text, duration):
+        """create_word_by_word_subtitle ile aynı gruplama ve konum"""
+        settings = self.settings
+        style = self._style_line(
+            settings["fonts"]["main"],
+            settings["text_size"],
+            settings["colors"]["primary"],
+            settings["colors"]["background"],
+            settings["stroke_width"],
+            50
+        )
+        
+        words = text.split()
+        if not words:
+            return style, []
+        
+        time_per_word = duration / len(words)
+        words_per_group = 6
+        y_position = int(self.height * 0.38)
+        
+        events = []
+        for i in range(0, len(words), words_per_group):
+            group = words[i:i+words_per_group]
+            mid = len(group) // 2
+            group_text = f"{' '.join(group[:mid])}\n{' '.join(group[mid:])}".upper()
+            
+            start_time = i * time_per_word
+            end_time = start_time + len(group) * time_per_word
+            events.append(
+                f"Dialogue: 0,{_ass_time(start_time)},{_ass_time(end_time)},Main,,0,0,0,,"
+                f"{{\\pos({self.width // 2},{y_position})}}{_ass_text(group_text)}"
+            )
+        
+        return style, events
+    
+    def _scrolling_events(self, text, duration):
+        """create_scrolling_subtitle ile aynı satır bölme ve kaydırma hızı"""
+        font_size = 56
+        stroke_width = 4
+        font_path = next(
+            (f for f in ["C:/Windows/Fonts/arialbd.ttf", "C:/Windows/Fonts/impact.ttf",
+                         "C:/Windows/Fonts/arial.ttf", "C:/Windows/Fonts/calibrib.ttf"]
+             if os.path.exists(f)),
+            None
+        )
+        style = self._style_line(font_path, font_size, "yellow", "black", stroke_width, 30)
+        
+        # Satırlara böl (max 25 karakter)
+        lines = split_lines(text, max_chars_per_line=25)
+        
+        if not lines:
+            return style, []
+        
+        # Metin yüksekliği tahmini (satır yüksekliği ~1.2 x font boyutu)
+        text_height = int(len(lines) * font_size * 1.2 + 2 * stroke_width)
+        start_y = self.height
+        end_y = -text_height
+        
+        # Kaydırma süresi video süresinden uzun: video bittiğinde yolun 1/1.8'i tamamlanır
+        scroll_duration = duration * 1.8
+        y_at_end = start_y + (end_y - start_y) * (duration / scroll_duration)
+        
+        x = self.width // 2
+        events = [
+            f"Dialogue: 0,{_ass_time(0)},{_ass_time(duration)},Main,,0,0,0,,"
+            f"{{\\move({x},{start_y},{x},{int(y_at_end)},0,{int(duration * 1000)})}}"
+            f"{_ass_text(chr(10).join(lines))}"
+        ]
+        return style, events
+    
+    def _watermark_image(self, duration, workdir):
+        """
+        Watermark'ı (logo.png veya kanal adı) bir kez PNG'ye çiz
+        
+        Metin watermark'ı ffmpeg'in drawtext filtresi yerine MoviePy ile
+        çizilir: imageio-ffmpeg'in ffmpeg'inde drawtext yoktur. Görüntü
+        MoviePy motorundakiyle aynıdır (aynı şablon clip'i).
+        
+        Args:
+            duration: Video süresi
+            workdir: PNG'nin yazılacağı klasör
+        
+        Returns:
+            tuple: (PNG yolu, x, y) veya None (watermark oluşturulamadıysa)
+        """
+        from PIL import Image
+        from compositor import sprite_from_clip
+        
+        watermark = self.template.add_watermark(self.width, self.height, duration)
+        if watermark is None:
+            return None
+        try:
+            sprite, x, y = sprite_from_clip(watermark, self.width, self.height)
+        finally:
+            watermark.close()
+        
+        # Sprite premultiplied; PNG düz alfa ister
+        rgba = sprite.rgba.astype(np.float32)
+        alpha = rgba[..., 3:4]
+        rgba[..., :3] = np.where(alpha > 0, rgba[..., :3] * 255.0 / np.maximum(alpha, 1.0), 0.0)
+        
+        image_path = os.path.join(workdir, "watermark.png")
+        Image.fromarray(np.clip(np.rint(rgba), 0, 255).astype(np.uint8), "RGBA").save(image_path)
+        return image_path, x, y
+    
+    def _file_input(self, path, start, wanted):
+        """
+        Dosya kaynağının giriş argümanları ve gerekirse döngü filtresi
+        
+        -stream_loop her turda dosyanın başına döner (-ss noktasına değil).
+        Başlangıç noktası olan ve kısa kalan clip'lerde döngü filtergraph'ta
+        yapılır: her turda başlangıçtan önceki kareler atlanır.
+        
+        Args:
+            path: Video dosyası
+            start: Başlangıç (saniye)
+            wanted: Gereken süre (saniye)
+        
+        Returns:
+            tuple: (ffmpeg giriş argümanları, döngü filtresi - boş veya "...," ile biten)
+        """
+        if not start:
+            return ["-stream_loop", "-1", "-t", f"{wanted:.3f}"], ""
+        
+        try:
+            from footage_library import probe_video
+            clip_duration = probe_video(path)["duration"]
+        except Exception as e:
+            print(f"⚠️ Clip süresi okunamadı ({e}), baştan döngüye alınıyor")
+            clip_duration = 0
+        
+        if start + wanted <= clip_duration:
+            # Döngü gerekmez: doğrudan başlangıca atla
+            return ["-ss", f"{start:.3f}", "-t", f"{wanted:.3f}"], ""
+        
+        if start >= clip_duration:
+            # Başlangıç clip'in dışında: baştan döngü
+            return ["-stream_loop", "-1", "-t", f"{wanted:.3f}"], ""
+        
+        # Döngüde zaman damgaları artmaya devam eder; clip içindeki konum t mod süre
+        loops = math.ceil(wanted / (clip_duration - start)) + 1
+        loop_filter = (
+            f"select='gte(mod(t\\,{clip_duration:.3f})\\,{start:.3f})',"
+            f"setpts=N/({self.fps}*TB),trim=duration={wanted:.3f},"
+        )
+        return ["-stream_loop", "-1", "-t", f"{loops * clip_duration:.3f}"], loop_filter
+    
+    def build_command(self, sources, audio_path, output_path, duration,
+                      subtitle_text=None, subtitle_type="word_by_word", workdir="."):
+        """
+        Tüm render planını tek bir ffmpeg komutuna çevir
+        
+        Args:
+            sources: (path, başlangıç, bitiş) listesi - path bir HTTPStreamSource da olabilir
+                (attach() çağrılmış olmalı)
+            audio_path: Ses dosyası yolu
+            output_path: Çıktı dosyası yolu
+            duration: Hedef süre (ses süresi)
+            subtitle_text: Alt yazı metni (opsiyonel)
+            subtitle_type: "word_by_word" veya "scrolling"
+            workdir: ASS ve yardımcı dosyalar için klasör
+        
+        Returns:
+            list: ffmpeg argüman listesi
+        """
+        w, h, fps = self.width, self.height, self.fps
+        cmd = [get_ffmpeg_exe(), "-y", "-hide_banner", "-loglevel", "error"]
+        filters = []
+        
+        # Kaynak videolar: her biri sonsuz döngüde, istenen süre kadar okunur
+        duration_per_video = duration / len(sources)
+        for idx, (path, start, end) in enumerate(sources):
+            start = start or 0
+            wanted = (end - start) if end is not None else duration_per_video
+            if isinstance(path, HTTPStreamSource):
+                # Pipe'ta seek ve döngü yok: başlangıç filtrede atlanır,
+                # clip kısa kalırsa son kare uzatılır
+                cmd += ["-t", f"{start + wanted:.3f}", "-i", path.input_url]
+                filters.append(
+                    f"[{idx}:v]trim=start={start:.3f},setpts=PTS-STARTPTS,"
+                    f"scale={w}:{h}:force_original_aspect_ratio=increase,"
+                    f"crop={w}:{h},setsar=1,fps={fps},"
+                    f"tpad=stop_mode=clone:stop_duration={wanted:.3f},trim=duration={wanted:.3f},"
+                    f"setpts=PTS-STARTPTS[v{idx}]"
+                )
+                continue
+            input_args, loop_filter = self._file_input(path, start, wanted)
+            cmd += input_args + ["-i", path]
+            if self.footage_cache and self.footage_cache.contains(path):
+                # Mezzanine zaten hedef boyut ve kare hızında
+                filters.append(f"[{idx}:v]{loop_filter}setpts=PTS-STARTPTS[v{idx}]")
+            else:
+                filters.append(
+                    f"[{idx}:v]fps={fps},{loop_filter}scale={w}:{h}:force_original_aspect_ratio=increase,"
+                    f"crop={w}:{h},setsar=1,setpts=PTS-STARTPTS[v{idx}]"
+                )
+        
+        labels = "".join(f"[v{idx}]" for idx in range(len(sources)))
+        filters.append(f"{labels}concat=n={len(sources)}:v=1:a=0[base]")
+        current = "base"
+        
+        audio_input = len(sources)
+        cmd += ["-i", audio_path]
+        
+        # Zoom efekti
+        if config.ENABLE_ZOOM_EFFECT:
+            zoom_effect = ZoomEffect(
+                duration,
+                zoom_amount=config.ZOOM_AMOUNT,
+                direction=getattr(config, 'ZOOM_DIRECTION', 'center'),
+                easing=getattr(config, 'ZOOM_EASING', 'linear')
+            )
+            zoompan = zoom_effect.zoompan_filter(w, h, fps, max(int(duration * fps), 1))
+            filters.append(f"[{current}]{zoompan}[zoomed]")
+            current = "zoomed"
+        
+        # Alt yazı (ASS)
+        if subtitle_text:
+            ass_path = os.path.join(workdir, "subtitles.ass")
+            with open(ass_path, "w", encoding="utf-8") as f:
+                f.write(self.build_ass_subtitles(subtitle_text, duration, subtitle_type))
+            
+            subtitle_filter = f"subtitles=filename='{escape_filter_value(ass_path)}'"
+            font_path = self.settings["fonts"]["main"]
+            if os.path.exists(font_path):
+                subtitle_filter += f":fontsdir='{escape_filter_value(os.path.dirname(font_path))}'"
+            
+            filters.append(f"[{current}]{subtitle_filter}[subbed]")
+            current = "subbed"
+        
+        # Watermark (önceden çizilmiş PNG, overlay ile)
+        if config.SHOW_WATERMARK:
+            watermark = self._watermark_image(duration, workdir)
+            if watermark:
+                image_path, x, y = watermark
+                cmd += ["-i", image_path]
+                filters.append(f"[{current}][{audio_input + 1}:v]overlay=x={x}:y={y}[wmout]")
+                current = "wmout"
+        
+        filters.append(f"[{current}]format=yuv420p[vout]")
+        
+        cmd += [
+            "-filter_complex", ";".join(filters),
+            "-map", "[vout]",
+            "-map", f"{audio_input}:a",
+            "-t", f"{duration:.3f}",
+            "-r", str(fps),
+            "-c:v", "libx264",
+            *x264_args(self.profile),
+            "-c:a", "aac",
+            "-movflags", "+faststart",
+            output_path,
+        ]
+        return cmd
+    
+    def render(self, sources, audio_path, output_path, duration,
+               subtitle_text=None, subtitle_type="word_by_word"):
+        """
+        Videoyu tek ffmpeg çağrısıyla render et
+        
+        Args:
+            sources: (path, başlangıç, bitiş) listesi
+            audio_path: Ses dosyası yolu
+            output_path: Çıktı dosyası yolu
+            duration: Hedef süre (ses süresi)
+            subtitle_text: Alt yazı metni (opsiyonel)
+            subtitle_type: "word_by_word" veya "scrolling"
+        """
+        streams = [path for path, _, _ in sources if isinstance(path, HTTPStreamSource)]
+        
+        with tempfile.TemporaryDirectory(prefix="vof_ffmpeg_") as workdir:
+            try:
+                # Akış kaynakları ffmpeg'e pipe fd'si olarak verilir, indirme decode ile örtüşür
+                pass_fds = [stream.attach() for stream in streams]
+                
+                cmd = self.build_command(
+                    sources, audio_path, output_path, duration,
+                    subtitle_text=subtitle_text,
+                    subtitle_type=subtitle_type,
+                    workdir=workdir
+                )
+                process = subprocess.Popen(
+                    cmd, stderr=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                    stdin=subprocess.DEVNULL, text=True, pass_fds=pass_fds
+                )
+                # Okuma uçları artık ffmpeg'de; ffmpeg bırakınca yazıcılar EPIPE alır
+                for stream in streams:
+                    stream.release_reader()
+                
+                _, stderr = process.communicate()
+            finally:
+                for stream in streams:
+                    stream.close()
+            
+            if process.returncode != 0:
+                errors = [f"{stream.url}: {stream.error}" for stream in streams if stream.error]
+                raise RuntimeError(f"ffmpeg hatası: {stderr.strip()[-500:]}"
+                                   + (f" (akış: {'; '.join(errors)})" if errors else ""))
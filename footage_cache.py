@@ -0,0 +1,216 @@
+"""
+VideoOtoFabrika - Stok Video Önbellek Modülü
+İndirilen Pexels videolarını bir kez 1080x1920 / 30fps / kısa GOP
+"mezzanine" dosyasına dönüştürür. Sonraki render'lar bu dosyayı
+ölçekleme/kırpma yapmadan doğrudan decode eder.
+"""
+
+import os
+import re
+import math
+import hashlib
+import tempfile
+import threading
+import subprocess
+from urllib.parse import urlsplit
+from ffmpeg_renderer import get_ffmpeg_exe
+
+
+def duration_bucket(duration, step=5):
+    """
+    Kısmi indirme süresini yukarı yuvarla (yakın süreler aynı önbellek kaydını paylaşır)
+    
+    Args:
+        duration: Gereken süre (saniye)
+        step: Yuvarlama adımı (saniye)
+    
+    Returns:
+        int: Yuvarlanmış süre
+    """
+    return int(math.ceil(duration / step) * step)
+
+
+class FootageCache:
+    def __init__(self, cache_dir="cache/footage", max_gb=20, width=1080, height=1920, fps=30, gop=15):
+        """
+        Mezzanine önbelleğini başlat
+        
+        Args:
+            cache_dir: Önbellek klasörü
+            max_gb: Disk bütçesi (GB) - aşılınca en eski kullanılanlar silinir
+            width: Hedef genişlik
+            height: Hedef yükseklik
+            fps: Hedef kare hızı
+            gop: Anahtar kare aralığı (kısa GOP = hızlı seek)
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = int(max_gb * 1024 ** 3)
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.gop = gop
+        
+        # Aynı anahtarı aynı anda dönüştürmeye çalışan thread'ler sırayla girer
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+        
+        os.makedirs(self.cache_dir, exist_ok=True)
+    
+    def _key_lock(self, path):
+        """Mezzanine yolu başına kilit"""
+        with self._locks_guard:
+            return self._locks.setdefault(path, threading.Lock())
+    
+    def key_for(self, url, duration=None):
+        """
+        Kaynak URL'den önbellek anahtarı üret (sorgu parametreleri hariç)
+        
+        Args:
+            url: Pexels video dosyası URL'i
+            duration: Kısmi indirmede alınan süre (None = tüm dosya)
+        
+        Returns:
+            str: Anahtar (sha256 hex, kısmi ise _<saniye>s ekli)
+        """
+        parts = urlsplit(url)
+        source = f"{parts.netloc}{parts.path}" if parts.netloc else url
+        key = hashlib.sha256(source.encode("utf-8")).hexdigest()[:32]
+        if duration:
+            key += f"_{duration_bucket(duration)}s"
+        return key
+    
+    def path_for(self, url, duration=None):
+        """URL'nin mezzanine dosya yolu"""
+        return os.path.join(self.cache_dir, f"{self.key_for(url, duration)}.mp4")
+    
+    def contains(self, path):
+        """Yol bu önbellekteki bir mezzanine dosyası mı?"""
+        cache_dir = os.path.abspath(self.cache_dir)
+        return os.path.dirname(os.path.abspath(path)) == cache_dir
+    
+    def _partials(self, url):
+        """
+        URL'nin önbellekteki kısmi kayıtları
+        
+        Returns:
+            list: (saniye, yol) listesi, en kısası önce
+        """
+        prefix = self.key_for(url)
+        pattern = re.compile(rf"{prefix}_(\d+)s\.mp4$")
+        partials = []
+        for name in os.listdir(self.cache_dir):
+            match = pattern.match(name)
+            if match:
+                partials.append((int(match.group(1)), os.path.join(self.cache_dir, name)))
+        return sorted(partials)
+    
+    def get(self, url, duration=None):
+        """
+        Önbellekte varsa mezzanine yolunu döndür (LRU için erişim zamanı güncellenir)
+        
+        Tüm dosya kaydı her süre isteğini karşılar; yoksa istenen süreyi
+        karşılayan en kısa kısmi kayıt kullanılır (ör. 8 sn için 15 sn'lik
+        kayıt). Tüm dosya önbelleğe alındıktan sonra kısmi kayıtlar artık
+        kullanılmaz ve LRU ile silinir.
+        
+        Args:
+            url: Kaynak URL
+            duration: Gereken süre (None = tüm dosya)
+        
+        Returns:
+            str: Mezzanine yolu veya None
+        """
+        candidates = [self.path_for(url)]
+        if duration:
+            needed = duration_bucket(duration)
+            candidates += [path for seconds, path in self._partials(url) if seconds >= needed]
+        
+        for path in candidates:
+            try:
+                os.utime(path, None)
+                return path
+            except FileNotFoundError:
+                continue  # Başka bir iş aynı anda sildi
+        return None
+    
+    def ingest(self, source_path, url, duration=None):
+        """
+        İndirilen videoyu normalize edilmiş mezzanine dosyasına dönüştür
+        
+        Args:
+            source_path: İndirilen ham video
+            url: Kaynak URL (anahtar için)
+            duration: Kısmi indirmede alınan süre (None = tüm dosya)
+        
+        Returns:
+            str: Mezzanine yolu
+        """
+        output_path = self.path_for(url, duration)
+        with self._key_lock(output_path):
+            # Başka bir iş aynı videoyu biz beklerken önbelleğe almış olabilir
+            cached = self.get(url, duration)
+            if cached:
+                return cached
+            return self._transcode(source_path, output_path)
+    
+    def _transcode(self, source_path, output_path):
+        """Ham videoyu benzersiz geçici dosyaya dönüştürüp son adla yayınla"""
+        # Geçici ad her çağrıda benzersiz: başka süreçler aynı dosyaya yazamaz
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp.mp4")
+        os.close(fd)
+        w, h = self.width, self.height
+        
+        cmd = [
+            get_ffmpeg_exe(), "-y", "-hide_banner", "-loglevel", "error",
+            "-i", source_path,
+            "-an",
+            "-vf", f"scale={w}:{h}:force_original_aspect_ratio=increase,crop={w}:{h},setsar=1,fps={self.fps}",
+            "-c:v", "libx264",
+            "-preset", "veryfast",
+            "-crf", "18",
+            "-g", str(self.gop),
+            "-keyint_min", str(self.gop),
+            "-sc_threshold", "0",
+            "-pix_fmt", "yuv420p",
+            "-movflags", "+faststart",
+            temp_path,
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        
+        if result.returncode != 0:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise RuntimeError(f"Mezzanine oluşturulamadı: {result.stderr.strip()[-300:]}")
+        
+        # Yarım dosya hiçbir zaman son adla görünmez
+        os.replace(temp_path, output_path)
+        self.evict()
+        return output_path
+    
+    def evict(self):
+        """Disk bütçesi aşılırsa en uzun süre kullanılmayan dosyaları sil"""
+        entries = []
+        total = 0
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".mp4") or name.endswith(".tmp.mp4"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue  # Başka bir iş aynı anda sildi
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        
+        if total <= self.max_bytes:
+            return
+        
+        for _, size, path in sorted(entries):
+            try:
+                os.remove(path)
+                total -= size
+                print(f"🗑️ Önbellekten silindi: {os.path.basename(path)}")
+            except OSError:
+                continue
+            if total <= self.max_bytes:
+                break
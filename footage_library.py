@@ -0,0 +1,199 @@
+"""
+VideoOtoFabrika - Yerel Stok Video Kütüphanesi Modülü
+Lisanslı yerel klipleri tarar; süre, çözünürlük, fps, codec ve etiketleri
+(yan dosya veya dosya adından) sqlite FTS5 indeksine yazar. search_video
+Pexels'ten önce burada arar - ağ ve indirme maliyeti sıfır.
+
+Etiket kaynakları (öncelik sırasıyla):
+    klip.mp4.json / klip.json : {"tags": ["ocean", "wave"], "title": "..."}
+    klip.mp4.txt / klip.txt   : virgül veya satırla ayrılmış etiketler
+    dosya adı                 : ocean_waves_sunset_04.mp4 -> ocean waves sunset
+"""
+
+import os
+import re
+import json
+import sqlite3
+import imageio_ffmpeg
+
+
+VIDEO_EXTENSIONS = (".mp4", ".mov", ".m4v", ".mkv", ".webm")
+
+
+def _filename_tags(path):
+    """Dosya adından etiket çıkar (sayılar ve tek harfler atılır)"""
+    name = os.path.splitext(os.path.basename(path))[0]
+    words = re.split(r"[^0-9A-Za-zçğıöşüÇĞİÖŞÜ]+", name)
+    return [w.lower() for w in words if len(w) > 1 and not w.isdigit()]
+
+
+def _sidecar_tags(path):
+    """Yan dosyadan etiketleri oku (yoksa None)"""
+    base = os.path.splitext(path)[0]
+    
+    for sidecar in (path + ".json", base + ".json"):
+        if os.path.exists(sidecar):
+            with open(sidecar, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            tags = list(data.get("tags", []))
+            if data.get("title"):
+                tags.append(data["title"])
+            return tags
+    
+    for sidecar in (path + ".txt", base + ".txt"):
+        if os.path.exists(sidecar):
+            with open(sidecar, "r", encoding="utf-8") as f:
+                return [t.strip() for t in re.split(r"[,\n]", f.read()) if t.strip()]
+    
+    return None
+
+
+def probe_video(path):
+    """
+    Video meta verisini oku (kare decode etmeden)
+    
+    Args:
+        path: Video dosyası
+    
+    Returns:
+        dict: duration, width, height, fps, codec
+    """
+    reader = imageio_ffmpeg.read_frames(path)
+    try:
+        meta = next(reader)
+    finally:
+        reader.close()
+    
+    width, height = meta.get("size", (0, 0))
+    return {
+        "duration": meta.get("duration") or 0.0,
+        "width": width,
+        "height": height,
+        "fps": meta.get("fps") or 0.0,
+        "codec": meta.get("codec", ""),
+    }
+
+
+class FootageLibrary:
+    def __init__(self, library_dir, db_path="cache/footage_library.sqlite"):
+        """
+        Yerel kütüphaneyi aç (indeks yoksa oluşturulur)
+        
+        Args:
+            library_dir: Klip klasörü (alt klasörler dahil taranır)
+            db_path: sqlite indeks dosyası
+        """
+        self.library_dir = library_dir
+        self.db_path = db_path
+        
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS clips (
+                path TEXT PRIMARY KEY,
+                mtime REAL NOT NULL,
+                size INTEGER NOT NULL,
+                duration REAL,
+                width INTEGER,
+                height INTEGER,
+                fps REAL,
+                codec TEXT,
+                tags TEXT
+            );
+            CREATE VIRTUAL TABLE IF NOT EXISTS clips_fts USING fts5(
+                path UNINDEXED, tags, tokenize = 'unicode61 remove_diacritics 2'
+            );
+        """)
+        self._conn.commit()
+    
+    def index(self):
+        """
+        Klasörü tara, yeni/değişen klipleri indeksle, silinenleri çıkar
+        
+        Klipler yavaş probe_video'dan sonra tek tek yazılıp commit edilir:
+        yazma kilidi probe süresince tutulmaz, aynı anda açılan diğer
+        süreçler "database is locked" almaz.
+        
+        Returns:
+            int: İndekslenen (yeni veya güncellenen) klip sayısı
+        """
+        known = {
+            path: (mtime, size)
+            for path, mtime, size in self._conn.execute("SELECT path, mtime, size FROM clips")
+        }
+        seen = set()
+        updated = 0
+        
+        for root, _, files in os.walk(self.library_dir):
+            for name in files:
+                if not name.lower().endswith(VIDEO_EXTENSIONS):
+                    continue
+                
+                path = os.path.abspath(os.path.join(root, name))
+                stat = os.stat(path)
+                seen.add(path)
+                if known.get(path) == (stat.st_mtime, stat.st_size):
+                    continue
+                
+                try:
+                    meta = probe_video(path)
+                except Exception as e:
+                    print(f"⚠️ Klip okunamadı, atlanıyor: {name} ({e})")
+                    continue
+                
+                tags = _sidecar_tags(path) or _filename_tags(path)
+                tag_text = " ".join(tags)
+                
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO clips VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (path, stat.st_mtime, stat.st_size, meta["duration"], meta["width"],
+                     meta["height"], meta["fps"], meta["codec"], tag_text)
+                )
+                self._conn.execute("DELETE FROM clips_fts WHERE path = ?", (path,))
+                self._conn.execute("INSERT INTO clips_fts (path, tags) VALUES (?, ?)", (path, tag_text))
+                self._conn.commit()
+                updated += 1
+        
+        for path in set(known) - seen:
+            self._conn.execute("DELETE FROM clips WHERE path = ?", (path,))
+            self._conn.execute("DELETE FROM clips_fts WHERE path = ?", (path,))
+        
+        self._conn.commit()
+        return updated
+    
+    def search(self, query, limit=20):
+        """
+        Etiketlerde tam metin arama
+        
+        Args:
+            query: Arama terimi ("luxury car")
+            limit: Maksimum sonuç
+        
+        Returns:
+            list: Klip dict'leri (path, duration, width, height, fps, codec, tags, relevance)
+                  - en alakalı önce; relevance küçük = daha alakalı (bm25)
+        """
+        words = re.findall(r"\w+", query.lower())
+        if not words:
+            return []
+        
+        # Her kelime tırnaklanır (FTS sözdizimi enjeksiyonu yok); herhangi biri eşleşebilir,
+        # bm25 daha çok kelime eşleşenleri öne alır
+        match = " OR ".join(f'"{w}"*' for w in words)
+        
+        rows = self._conn.execute(
+            "SELECT c.path, c.duration, c.width, c.height, c.fps, c.codec, c.tags, bm25(clips_fts) "
+            "FROM clips_fts JOIN clips c ON c.path = clips_fts.path "
+            "WHERE clips_fts MATCH ? ORDER BY bm25(clips_fts) LIMIT ?",
+            (match, limit)
+        ).fetchall()
+        
+        keys = ("path", "duration", "width", "height", "fps", "codec", "tags", "relevance")
+        return [dict(zip(keys, row)) for row in rows if os.path.exists(row[0])]
+    
+    def __len__(self):
+        return self._conn.execute("SELECT COUNT(*) FROM clips").fetchone()[0]
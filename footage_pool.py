@@ -0,0 +1,152 @@
+"""
+VideoOtoFabrika - Önceden Isıtılmış Klip Havuzu Modülü
+prewarm.py ile indirilen mezzanine klipleri arama terimi başına bir havuzda
+tutar. search_video havuzu olan terimleri ağa çıkmadan çözer; havuz her
+kullanımda döndürülür, ardışık videolar aynı görüntüleri tekrar etmez.
+
+İmleç sqlite'ta tutulur: aynı anda çalışan süreçler de sırayı paylaşır.
+"""
+
+import os
+import time
+import sqlite3
+import threading
+
+
+class FootagePool:
+    def __init__(self, db_path="cache/footage_pool.sqlite"):
+        """
+        Havuz veritabanını aç (yoksa oluşturulur)
+        
+        Args:
+            db_path: sqlite dosyası
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS pool_clips (
+                term TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                path TEXT NOT NULL,
+                PRIMARY KEY (term, position)
+            );
+            CREATE TABLE IF NOT EXISTS pool_cursors (
+                term TEXT PRIMARY KEY,
+                next_index INTEGER NOT NULL DEFAULT 0,
+                updated_at REAL NOT NULL
+            );
+        """)
+    
+    @staticmethod
+    def normalize(term):
+        """Terim anahtarı (büyük/küçük harf ve boşluklardan bağımsız)"""
+        return " ".join(term.lower().split())
+    
+    def set_pool(self, term, paths):
+        """
+        Terimin havuzunu verilen kliplerle değiştir (imleç sıfırlanır)
+        
+        Args:
+            term: Arama terimi
+            paths: Mezzanine dosya yolları
+        """
+        term = self.normalize(term)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute("DELETE FROM pool_clips WHERE term = ?", (term,))
+                self._conn.executemany(
+                    "INSERT INTO pool_clips (term, position, path) VALUES (?, ?, ?)",
+                    [(term, position, path) for position, path in enumerate(paths)]
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO pool_cursors (term, next_index, updated_at) VALUES (?, 0, ?)",
+                    (term, time.time())
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+    
+    def clips(self, term):
+        """
+        Havuzdaki hâlâ diskte olan klipler
+        
+        Args:
+            term: Arama terimi
+        
+        Returns:
+            list: Dosya yolları (havuz sırasıyla)
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path FROM pool_clips WHERE term = ? ORDER BY position",
+                (self.normalize(term),)
+            ).fetchall()
+        return [path for (path,) in rows if os.path.exists(path)]
+    
+    def take(self, term, count):
+        """
+        Havuzdan sıradaki `count` klibi al ve imleci ilerlet
+        
+        Önbellek LRU temizliği havuz kliplerini silmesin diye alınan
+        dosyaların erişim zamanı güncellenir.
+        
+        Args:
+            term: Arama terimi
+            count: İstenen klip sayısı (havuzdan büyükse havuzun tamamı)
+        
+        Returns:
+            list: Dosya yolları (havuz boşsa boş liste)
+        """
+        term = self.normalize(term)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._conn.execute(
+                    "SELECT path FROM pool_clips WHERE term = ? ORDER BY position", (term,)
+                ).fetchall()
+                paths = [path for (path,) in rows if os.path.exists(path)]
+                if not paths:
+                    self._conn.execute("COMMIT")
+                    return []
+                
+                row = self._conn.execute(
+                    "SELECT next_index FROM pool_cursors WHERE term = ?", (term,)
+                ).fetchone()
+                start = (row[0] if row else 0) % len(paths)
+                count = min(count, len(paths))
+                
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO pool_cursors (term, next_index, updated_at) VALUES (?, ?, ?)",
+                    (term, (start + count) % len(paths), time.time())
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        
+        selected = [paths[(start + i) % len(paths)] for i in range(count)]
+        for path in selected:
+            os.utime(path, None)
+        return selected
+    
+    def terms(self):
+        """
+        Havuzu olan terimler ve klip sayıları
+        
+        Returns:
+            dict: {terim: klip sayısı}
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT term, COUNT(*) FROM pool_clips GROUP BY term ORDER BY term"
+            ).fetchall()
+        return dict(rows)
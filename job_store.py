@@ -0,0 +1,312 @@
+"""
+VideoOtoFabrika - İş Kayıt Modülü
+Her video işinin durumunu ve aşama çıktılarını (senaryo, ses dosyası,
+stok videolar, çıktı yolu) sqlite'ta saklar. Render veya yükleme hata
+verirse iş "failed" kalır; yeniden başlatılan iş tamamlanmış aşamaları
+atlayıp ilk eksik aşamadan devam eder (Gemini, TTS ve indirme tekrar
+ödenmez).
+
+Çıktı numaraları (video_N.mp4) da burada ayrılır: ayırma tek bir sqlite
+yazma işleminde yapıldığı için aynı makinedeki işler ve süreçler aynı adı
+alamaz.
+
+Her iş onu çalıştıran süreci (host:pid) ve düzenli güncellenen bir
+heartbeat zamanını taşır. "running" bir iş ancak heartbeat'i kira süresini
+aştıysa (süreç çökmüş) devam ettirilebilir; devam ettiren süreç işi atomik
+olarak üstlenir, iki süreç aynı işi çalıştıramaz.
+
+Sürekli hata veren işler sonsuza kadar tutulmaz: deneme sayısı veya yaşı
+sınırı aşan işler bırakılır (discard), çıktı adı serbest kalır.
+"""
+
+import os
+import json
+import time
+import socket
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+
+def _encode(value):
+    """JSON'a çevrilemeyen değerler (ör. HTTPStreamSource) için yer tutucu"""
+    url = getattr(value, "url", None)
+    return {"stream": url} if url else str(value)
+
+
+class JobStore:
+    def __init__(self, db_path="cache/jobs.sqlite", lease=120):
+        """
+        İş kayıt veritabanını aç (yoksa oluşturulur)
+        
+        Args:
+            db_path: sqlite dosyası
+            lease: Heartbeat bu kadar saniye güncellenmezse işin sahibi ölü sayılır
+        """
+        self.db_path = db_path
+        self.lease = lease
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+        self._lock = threading.Lock()
+        
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                output TEXT NOT NULL,
+                data TEXT NOT NULL,
+                error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                owner TEXT,
+                heartbeat_at REAL
+            );
+            CREATE TABLE IF NOT EXISTS stages (
+                job_id TEXT NOT NULL,
+                stage TEXT NOT NULL,
+                status TEXT NOT NULL,
+                seconds REAL,
+                error TEXT,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (job_id, stage)
+            );
+            CREATE TABLE IF NOT EXISTS outputs (
+                path TEXT PRIMARY KEY,
+                job_id TEXT NOT NULL,
+                reserved_at REAL NOT NULL
+            );
+        """)
+        # Sahiplik sütunlarından önce oluşturulmuş veritabanları
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        for column, kind in (("owner", "TEXT"), ("heartbeat_at", "REAL")):
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {kind}")
+        
+        # Bu sürecin işleri canlı görünsün (render dakikalar sürebilir, kayıt yazılmaz)
+        self._heartbeat = threading.Thread(target=self._beat, daemon=True)
+        self._heartbeat.start()
+    
+    @contextmanager
+    def _transaction(self):
+        """Tek yazma işlemi (süreçler arası atomik)"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+    
+    def _beat(self):
+        """Heartbeat thread'i: bu sürecin çalışan işlerinin kirasını yenile"""
+        while True:
+            time.sleep(max(self.lease / 4, 1))
+            try:
+                with self._transaction() as conn:
+                    conn.execute(
+                        "UPDATE jobs SET heartbeat_at = ? WHERE owner = ? AND status = 'running'",
+                        (time.time(), self.owner)
+                    )
+            except sqlite3.Error as e:
+                print(f"⚠️ İş kaydı heartbeat hatası: {e}")
+    
+    def _write_job(self, job, status, error=None):
+        """İş satırını yaz (işlem çağırana ait)"""
+        now = time.time()
+        self._conn.execute(
+            "INSERT INTO jobs (id, status, output, data, error, created_at, updated_at, owner, heartbeat_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET status = excluded.status, output = excluded.output, "
+            "data = excluded.data, error = excluded.error, updated_at = excluded.updated_at, "
+            "owner = excluded.owner, heartbeat_at = excluded.heartbeat_at",
+            (job["id"], status, job["output"], json.dumps(job, default=_encode, ensure_ascii=False),
+             error, now, now, self.owner, now)
+        )
+    
+    def _resumable_sql(self):
+        """Devam ettirilebilir iş koşulu: hatalı veya sahibi ölmüş "running" (parametre: kira sınırı)"""
+        return ("(status = 'failed' OR (status = 'running' AND "
+                "(heartbeat_at IS NULL OR heartbeat_at < ?)))")
+    
+    def _write_stage(self, job, stage, status, seconds=None, error=None):
+        """Aşama satırını yaz (işlem çağırana ait)"""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO stages (job_id, stage, status, seconds, error, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (job["id"], stage, status, seconds, error, time.time())
+        )
+    
+    def save(self, job, status="running", error=None):
+        """
+        İşi kaydet (yeni iş veya durum güncellemesi)
+        
+        Args:
+            job: İş sözlüğü (id ve output zorunlu)
+            status: running / failed / done
+            error: Hata mesajı (failed için)
+        """
+        with self._transaction():
+            self._write_job(job, status, error=error)
+    
+    def complete_stage(self, job, stage, seconds):
+        """
+        Aşamayı tamamlandı olarak işaretle, çıktılarıyla birlikte (tek işlemde)
+        
+        Args:
+            job: İş sözlüğü (aşamanın çıktılarını içerir)
+            stage: Aşama adı
+            seconds: Aşama süresi
+        """
+        with self._transaction():
+            self._write_job(job, "running")
+            self._write_stage(job, stage, "done", seconds=seconds)
+    
+    def fail_stage(self, job, stage, error):
+        """
+        Aşamayı hatalı olarak işaretle (iş bu süreçte kalır, fail() ile bırakılır)
+        
+        Args:
+            job: İş sözlüğü
+            stage: Hata veren aşama
+            error: Hata (mesajı saklanır)
+        """
+        with self._transaction():
+            self._write_stage(job, stage, "failed", error=str(error))
+    
+    def fail(self, job, error):
+        """
+        İşi hatalı olarak işaretle (--resume ile başka süreç devam ettirebilir)
+        
+        Çağıran işin dosyalarıyla işini bitirmiş olmalı: bu çağrıdan sonra iş
+        başka bir sürece verilebilir.
+        
+        Args:
+            job: İş sözlüğü
+            error: Hata mesajı
+        """
+        job["attempts"] = job.get("attempts", 0) + 1
+        with self._transaction():
+            self._write_job(job, "failed", error=str(error))
+    
+    def finish(self, job):
+        """İşi tamamlandı olarak işaretle (çıktı diskte, ad ayırması kalkar)"""
+        with self._transaction() as conn:
+            self._write_job(job, "done")
+            conn.execute("DELETE FROM outputs WHERE path = ?", (job["output"],))
+    
+    def completed_stages(self, job_id):
+        """
+        İşin tamamlanmış aşamaları
+        
+        Args:
+            job_id: İş kimliği
+        
+        Returns:
+            set: Aşama adları
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT stage FROM stages WHERE job_id = ? AND status = 'done'", (job_id,)
+            ).fetchall()
+        return {stage for (stage,) in rows}
+    
+    def incomplete(self):
+        """
+        Devam ettirilebilecek işler (hatalı veya sahibi çökmüş), en eskisi önce
+        
+        Başka bir sürecin şu an çalıştırdığı işler dahil değildir.
+        
+        Returns:
+            list: İş sözlükleri
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT data FROM jobs WHERE {self._resumable_sql()} ORDER BY created_at",
+                (time.time() - self.lease,)
+            ).fetchall()
+        return [json.loads(data) for (data,) in rows]
+    
+    def claim(self, job_id):
+        """
+        Devam ettirilebilir işi bu süreç adına atomik olarak üstlen
+        
+        Args:
+            job_id: İş kimliği
+        
+        Returns:
+            bool: Üstlenildi mi (başka süreç önce aldıysa veya iş canlıysa False)
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                f"UPDATE jobs SET status = 'running', owner = ?, heartbeat_at = ?, updated_at = ? "
+                f"WHERE id = ? AND {self._resumable_sql()}",
+                (self.owner, now, now, job_id, now - self.lease)
+            )
+        return cursor.rowcount == 1
+    
+    def expired(self, max_attempts=3, max_age=72 * 3600):
+        """
+        Artık devam ettirilmeyecek işler (hatalı veya sahibi çökmüş)
+        
+        Args:
+            max_attempts: Bu kadar kez hata veren iş bırakılır (None = sınırsız)
+            max_age: Bu kadar saniyeden eski iş bırakılır (None = sınırsız)
+        
+        Returns:
+            list: İş sözlükleri
+        """
+        now = time.time()
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT data, created_at FROM jobs WHERE {self._resumable_sql()} ORDER BY created_at",
+                (now - self.lease,)
+            ).fetchall()
+        
+        jobs = []
+        for data, created_at in rows:
+            job = json.loads(data)
+            if (max_attempts and job.get("attempts", 0) >= max_attempts) or \
+                    (max_age and now - created_at >= max_age):
+                jobs.append(job)
+        return jobs
+    
+    def discard(self, job_id):
+        """
+        İşi bırak: bir daha devam ettirilmez, çıktı adı serbest kalır
+        
+        Args:
+            job_id: İş kimliği
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'discarded', updated_at = ? WHERE id = ?", (time.time(), job_id)
+            )
+            conn.execute("DELETE FROM outputs WHERE job_id = ?", (job_id,))
+    
+    def reserve_output(self, job_id, allocate):
+        """
+        Çıktı adını atomik olarak ayır (aynı anda çalışan süreçler aynı adı alamaz)
+        
+        Args:
+            job_id: Adı alan iş
+            allocate: Ayrılmış yollar listesini alıp yeni yolu döndüren fonksiyon
+                (işlem içinde çağrılır; diskteki dosyalara da bakmalı)
+        
+        Returns:
+            str: Ayrılan çıktı yolu (iş bitene kadar başkasına verilmez)
+        """
+        with self._transaction() as conn:
+            reserved = [path for (path,) in conn.execute("SELECT path FROM outputs").fetchall()]
+            path = allocate(reserved)
+            conn.execute(
+                "INSERT INTO outputs (path, job_id, reserved_at) VALUES (?, ?, ?)",
+                (path, job_id, time.time())
+            )
+        return path
@@ -4,15 +4,33 @@ Geliştirilmiş video üretim sistemi
 """
 
 import asyncio
+import argparse
 import os
 import glob
+import time
+import uuid
 from content_generator import ContentGenerator
 from voice_generator import VoiceGenerator
 from video_manager import VideoManager
 from uploader import VideoUploader
+from job_store import JobStore
+from workspace import create_workspace, remove_workspace, on_tmpfs, park_workspace
+from scheduler import ResourceScheduler
 import config
 
 
+# Bir videonun üretim aşamaları ve bağımlılıkları: ses ve stok video sadece
+# içeriğe bağlı, birbirini beklemeden aynı anda çalışır
+STAGES = ("content", "voice", "footage", "render", "upload")
+STAGE_DEPENDENCIES = {
+    "content": (),
+    "voice": ("content",),
+    "footage": ("content",),
+    "render": ("voice", "footage"),
+    "upload": ("render",),
+}
+
+
 class VideoOtoFabrika:
     def __init__(self):
         """
@@ -29,230 +47,560 @@ class VideoOtoFabrika:
         self.auto_upload = config.AUTO_UPLOAD
         self.upload_platforms = config.DEFAULT_UPLOAD_PLATFORMS
         
-        # Geçici dosya yolları
+        # Geçici dosya yolları (her iş kendi çalışma klasörünü alır, işler çakışmaz)
         self.temp_audio = "temp_audio.mp3"
         self.temp_video = "temp_video.mp4"
         self.output_dir = "C:/Users/aliri/Desktop"
+        
+        # Aşama kayıtları ve çıktı adı ayırmaları (yarıda kalan işler --resume ile devam eder)
+        self.job_store = JobStore(
+            getattr(config, 'JOB_STORE_DB', "cache/jobs.sqlite"),
+            lease=getattr(config, 'JOB_LEASE_SECONDS', 120)
+        )
+        
+        # Ağ ve render aşamaları ayrı havuzlarda (toplu modda işler sıraya girer, makine taşmaz)
+        self.scheduler = ResourceScheduler(
+            network_slots=getattr(config, 'NETWORK_CONCURRENCY', 8),
+            render_slots=getattr(config, 'RENDER_SLOTS', None),
+            threads_per_render=getattr(config, 'RENDER_THREADS', 4),
+            render_memory_mb=getattr(config, 'RENDER_MEMORY_MB', 1500),
+            max_active_jobs=getattr(config, 'MAX_ACTIVE_JOBS', None)
+        )
+        # Tek videoda render tüm çekirdekleri kullanır; toplu modda slotlar arasında bölünür
+        self._render_threads = None
     
-    def get_next_filename(self):
+    def get_next_filename(self, job_id):
         """
-        Masaüstünde mevcut videoları kontrol edip sonraki numarayı bul
+        Masaüstünde mevcut videoları kontrol edip sonraki numarayı ayır
+        
+        Numara iş kaydında atomik olarak ayrılır: aynı anda çalışan işler ve
+        süreçler aynı video_N.mp4 adını alamaz.
+        
+        Args:
+            job_id: Adı alan iş
         
         Returns:
             str: Yeni dosya yolu (örn: C:/Users/aliri/Desktop/video_1.mp4)
         """
-        # Mevcut video dosyalarını bul
-        pattern = os.path.join(self.output_dir, "video_*.mp4")
-        existing_files = glob.glob(pattern)
-        
-        if not existing_files:
-            # Hiç video yoksa 1'den başla
-            next_number = 1
-        else:
-            # En yüksek numarayı bul
-            numbers = []
-            for file in existing_files:
-                try:
-                    # video_5.mp4 -> 5
-                    basename = os.path.basename(file)
-                    num = int(basename.replace("video_", "").replace(".mp4", ""))
-                    numbers.append(num)
-                except:
-                    continue
+        def allocate(reserved):
+            # Mevcut video dosyalarını bul (henüz yazılmamış ayrılmış adlar dahil)
+            pattern = os.path.join(self.output_dir, "video_*.mp4")
+            existing_files = glob.glob(pattern) + reserved
             
-            next_number = max(numbers) + 1 if numbers else 1
+            if not existing_files:
+                # Hiç video yoksa 1'den başla
+                next_number = 1
+            else:
+                # En yüksek numarayı bul
+                numbers = []
+                for file in existing_files:
+                    try:
+                        # video_5.mp4 -> 5
+                        basename = os.path.basename(file)
+                        num = int(basename.replace("video_", "").replace(".mp4", ""))
+                        numbers.append(num)
+                    except:
+                        continue
+                
+                next_number = max(numbers) + 1 if numbers else 1
+            
+            filename = f"video_{next_number}.mp4"
+            return os.path.join(self.output_dir, filename)
+        
+        return self.job_store.reserve_output(job_id, allocate)
+    
+    def new_job(self):
+        """
+        Yeni video işi oluştur (çıktı adı ayrılır, geçici dosya adları işe özel)
+        
+        Returns:
+            dict: İş durumu (aşamalar bu sözlüğü doldurur)
+        """
+        # Kimlik süreçler ve yeniden başlatmalar arasında da tekil olmalı (iş kaydı anahtarı)
+        job_id = f"{time.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        
+        workspace = self._create_workspace(job_id)
         
-        filename = f"video_{next_number}.mp4"
-        return os.path.join(self.output_dir, filename)
+        job = {
+            "id": job_id,
+            "output": self.get_next_filename(job_id),
+            "workspace": workspace,
+            "audio": os.path.join(workspace, "audio.mp3"),
+            "video_base": os.path.join(workspace, "clip"),
+            "scenario": None,
+            "search_term": None,
+            "videos": [],
+            "video_urls": [],
+            "error": None,
+            "timings": {},
+        }
+        self.job_store.save(job)
+        return job
+    
+    def _create_workspace(self, job_id):
+        """İşin çalışma klasörü (config: WORKSPACE_ROOT, WORKSPACE_TMPFS, WORKSPACE_SIZE_MB)"""
+        return create_workspace(
+            job_id,
+            required_mb=getattr(config, 'WORKSPACE_SIZE_MB', 500),
+            root=getattr(config, 'WORKSPACE_ROOT', None),
+            tmpfs=getattr(config, 'WORKSPACE_TMPFS', "/dev/shm"),
+            min_free_mb=getattr(config, 'WORKSPACE_MIN_FREE_MB', 2048)
+        )
+    
+    def resume_jobs(self):
+        """
+        Kayıttaki yarıda kalmış işleri üstlenip yükle (çıktı adları kayıtta ayrılı kalmıştır)
+        
+        Başka bir sürecin çalıştırdığı veya aynı anda üstlendiği işler alınmaz.
+        
+        Returns:
+            list: İş sözlükleri (tamamlanan aşamalar run_stage'de atlanır)
+        """
+        self.expire_jobs()
+        jobs = [job for job in self.job_store.incomplete() if self.job_store.claim(job["id"])]
+        for job in jobs:
+            job["error"] = None
+            # Yeniden başlatmada tmpfs silinmiş olabilir; eksik dosyaların aşamaları tekrar çalışır
+            os.makedirs(job["workspace"], exist_ok=True)
+        return jobs
+    
+    def discard_job(self, job, reason=""):
+        """
+        İşi bırak: çalışma klasörü ve yarım çıktı silinir, çıktı adı serbest kalır
+        
+        İş önce üstlenilir; başka bir süreç çalıştırıyorsa dokunulmaz.
+        
+        Args:
+            job: İş sözlüğü
+            reason: Log için sebep
+        
+        Returns:
+            bool: İş bırakıldı mı
+        """
+        if not self.job_store.claim(job["id"]):
+            print(f"⚠️ İş başka bir süreçte çalışıyor, bırakılmadı: {job['id']}")
+            return False
+        
+        remove_workspace(job["workspace"])
+        if "render" not in self.job_store.completed_stages(job["id"]) and os.path.exists(job["output"]):
+            # Render yarıda kaldıysa masaüstündeki dosya bozuktur
+            os.remove(job["output"])
+        self.job_store.discard(job["id"])
+        print(f"🗑️ İş bırakıldı: {job['id']} ({os.path.basename(job['output'])}){f' - {reason}' if reason else ''}")
+        return True
+    
+    def expire_jobs(self):
+        """Deneme sayısı (JOB_MAX_ATTEMPTS) veya yaşı (JOB_MAX_AGE_HOURS) sınırı aşan hatalı işleri bırak"""
+        max_age_hours = getattr(config, 'JOB_MAX_AGE_HOURS', 72)
+        for job in self.job_store.expired(
+            max_attempts=getattr(config, 'JOB_MAX_ATTEMPTS', 3),
+            max_age=max_age_hours * 3600 if max_age_hours else None
+        ):
+            self.discard_job(job, f"{job.get('attempts', 0)} deneme, süre/deneme sınırı aşıldı")
+    
+    def _fail_job(self, job):
+        """
+        Hata veren işi kayda "failed" olarak bırak (--resume ile devam ettirilebilir)
+        
+        tmpfs'teki çalışma klasörü önce diske taşınır (--resume'a kadar RAM'i
+        tutmasın); iş ancak dosyaları yerine oturduktan sonra başka süreçlere açılır.
+        
+        Args:
+            job: Hata veren iş ("error" alanı dolu)
+        """
+        old = job["workspace"]
+        if on_tmpfs(old, getattr(config, 'WORKSPACE_TMPFS', "/dev/shm")):
+            try:
+                new = park_workspace(old, getattr(config, 'WORKSPACE_PARK_DIR', "cache/failed_jobs"))
+                
+                def moved(path):
+                    return new + path[len(old):] if isinstance(path, str) and path.startswith(old) else path
+                
+                job["workspace"] = new
+                job["audio"] = moved(job["audio"])
+                job["video_base"] = moved(job["video_base"])
+                job["videos"] = [moved(path) for path in job["videos"]]
+            except Exception as e:
+                print(f"⚠️ Çalışma klasörü taşınamadı: {e}")
+        
+        self.job_store.fail(job, job["error"])
+    
+    def _stage_outputs_ready(self, job, stage):
+        """
+        Kayıtta tamamlanmış görünen aşamanın çıktıları hâlâ kullanılabilir mi
+        
+        Dosyalar silinmişse (ör. önbellek temizliği) veya klipler tek seferlik
+        akışsa aşama yeniden çalıştırılır.
+        """
+        if stage == "content":
+            return bool(job["scenario"] and job["search_term"])
+        if stage == "voice":
+            return os.path.exists(job["audio"])
+        if stage == "footage":
+            return bool(job["videos"]) and all(
+                isinstance(path, str) and os.path.exists(path) for path in job["videos"]
+            )
+        if stage == "render":
+            return os.path.exists(job["output"])
+        return True
+    
+    def stage_content(self, job):
+        """1. İçerik üret (senaryo + arama terimi)"""
+        print("📝 ADIM 1: İçerik Üretimi")
+        print("-" * 60)
+        job["scenario"], job["search_term"] = self.content_gen.generate_content()
+        print(f"\n📄 Senaryo:\n{job['scenario']}\n")
+        print(f"🔍 Video arama terimi: '{job['search_term']}'\n")
+    
+    async def stage_voice(self, job):
+        """2. Sesi oluştur"""
+        print("🎤 ADIM 2: Ses Üretimi")
+        print("-" * 60)
+        await self.voice_gen.generate_voice(job["scenario"], job["audio"])
+    
+    def stage_footage(self, job):
+        """3. Video bul ve indir - KONUYLA ALAKALI BIRDEN FAZLA VIDEO"""
+        print("\n🎥 ADIM 3: Konuyla Alakalı Videolar Arama")
+        print("-" * 60)
+        search_term = job["search_term"]
+        print(f"🔍 '{search_term}' ile ilgili videolar aranıyor...")
+        # Her video ses süresinin eşit bir parçasında kullanılır (süre uyumu için).
+        # Ses henüz üretiliyor olabilir; süre metinden tahmin edilir
+        audio_duration = self.voice_gen.estimate_duration(job["scenario"])
+        video_urls = self.video_mgr.search_video(
+            search_term,
+            segment_duration=audio_duration / self.video_mgr.MAX_VIDEOS
+        )
+        
+        # Birden fazla video indir
+        # Her videodan sadece kullanılacak kadarı indirilir (config.PARTIAL_DOWNLOAD);
+        # tahmin kısa kalırsa render öncesinde fit_footage tamamlar
+        footage = self.video_mgr.download_multiple_videos(
+            video_urls,
+            job["video_base"],
+            duration=audio_duration / len(video_urls),
+            with_urls=True
+        )
+        
+        if not footage:
+            print("⚠️ Video indirilemedi, tek video ile devam ediliyor...")
+            video_url = video_urls[0] if video_urls else None
+            if video_url:
+                footage = [(video_url, self.video_mgr.download_video(video_url, f"{job['video_base']}.mp4"))]
+        
+        print(f"✅ Toplam {len(footage)} video hazır")
+        job["video_urls"] = [url for url, _ in footage]
+        job["videos"] = [path for _, path in footage]
+    
+    def fit_footage(self, job):
+        """
+        Render öncesi: klipleri gerçek ses süresine ve indirilebilen video sayısına göre kontrol et
+        
+        Footage aşaması sesle aynı anda çalışır ve süreyi tahminle belirler;
+        kısa kalan klipler burada yeniden indirilir. Hata render'ı durdurmaz
+        (en kötü ihtimalle klip döngüye girer).
+        """
+        if len(job.get("video_urls", [])) != len(job["videos"]):
+            return
+        try:
+            audio_duration = self.video_mgr.get_audio_duration(job["audio"])
+            footage = self.video_mgr.extend_short_clips(
+                list(zip(job["video_urls"], job["videos"])), audio_duration, job["video_base"]
+            )
+            job["videos"] = [path for _, path in footage]
+        except Exception as e:
+            print(f"⚠️ Klip süreleri kontrol edilemedi: {e}")
+    
+    def stage_render(self, job):
+        """4. Final videoyu oluştur (geliştirilmiş alt yazı ile + birden fazla video)"""
+        print("\n🎬 ADIM 4: Final Video Oluşturma")
+        print("-" * 60)
+        print("✨ Geliştirilmiş alt yazı sistemi kullanılıyor...")
+        
+        # Tüm videolar tek zaman çizelgesinde, tek encode ile işlenir
+        if len(job["videos"]) > 1:
+            print(f"✨ {len(job['videos'])} farklı video kullanılıyor (tek geçişte render)...")
+        
+        self.video_mgr.create_final_video(
+            job["videos"],
+            job["audio"],
+            job["output"],
+            subtitle_text=job["scenario"],
+            audio_speed=self.voice_gen.speed_multiplier,
+            workdir=job["workspace"],
+            threads=self._render_threads
+        )
+    
+    def stage_upload(self, job):
+        """5. Otomatik yükleme (eğer aktifse)"""
+        if not (self.auto_upload and self.uploader):
+            return
+        
+        print("\n📤 ADIM 5: Otomatik Yükleme")
+        print("-" * 60)
+        try:
+            self.uploader.upload_video(
+                job["output"],
+                job["scenario"],
+                platforms=self.upload_platforms
+            )
+        except Exception as e:
+            print(f"⚠️ Yükleme hatası: {e}")
+            print("💾 Video yine de kaydedildi, manuel yükleyebilirsin")
+    
+    async def _run_in_thread(self, func, job):
+        """
+        Bloklayan aşamayı ayrı thread'de çalıştır; iptal edilse de thread bitene kadar bekle
+        
+        Görevi iptal etmek thread'i durdurmaz. Beklenmezse iş hatalı sayılıp
+        çalışma klasörü taşınırken (park_workspace) thread hâlâ eski klasöre
+        yazıyor olurdu.
+        """
+        future = asyncio.ensure_future(asyncio.to_thread(func, job))
+        try:
+            await asyncio.shield(future)
+        except asyncio.CancelledError:
+            await asyncio.wait({future})
+            raise
+    
+    async def run_stage(self, job, stage):
+        """
+        İşin bir aşamasını çalıştır (bloklayan aşamalar ayrı thread'de, event loop serbest kalır)
+        
+        Aşama önce zamanlayıcıdan kendi havuzunun slotunu alır (ağ veya render);
+        slot yoksa sırada bekler.
+        
+        Args:
+            job: new_job() sonucu
+            stage: STAGES içinden aşama adı
+        """
+        name = os.path.basename(job["output"])
+        if stage in self.job_store.completed_stages(job["id"]) and self._stage_outputs_ready(job, stage):
+            print(f"⏭️ [{name}] {stage} daha önce tamamlanmış, atlanıyor")
+            return
+        
+        if stage == "render":
+            # Ses artık hazır: kısa kalan klipler ağ slotunda tamamlanır (render slotu tutulmaz)
+            async with self.scheduler.slot("footage", name):
+                await self._run_in_thread(self.fit_footage, job)
+        
+        async with self.scheduler.slot(stage, name):
+            print(f"▶️ [{name}] {stage} başladı")
+            start = time.perf_counter()
+            try:
+                if stage == "voice":
+                    await self.stage_voice(job)
+                else:
+                    await self._run_in_thread(getattr(self, f"stage_{stage}"), job)
+            except Exception as e:
+                job["error"] = f"{stage}: {e}"
+                self.job_store.fail_stage(job, stage, e)
+                raise
+            job["timings"][stage] = time.perf_counter() - start
+        
+        print(f"⏱️ [{name}] {stage}: {job['timings'][stage]:.1f} sn")
+        self.job_store.complete_stage(job, stage, job["timings"][stage])
+    
+    async def run_job(self, job, stages=STAGES):
+        """
+        İşin aşamalarını bağımlılık grafiğine göre çalıştır
+        
+        Bağımlılıkları biten aşama hemen başlar (ör. içerik bitince ses ve
+        stok video araması/indirmesi aynı anda). `stages` dışındaki
+        bağımlılıkların zaten tamamlandığı varsayılır.
+        
+        Args:
+            job: new_job() sonucu
+            stages: Çalıştırılacak aşamalar
+        """
+        tasks = {}
+        
+        async def run(stage):
+            await asyncio.gather(*(tasks[dep] for dep in STAGE_DEPENDENCIES[stage] if dep in tasks))
+            await self.run_stage(job, stage)
+        
+        for stage in stages:
+            tasks[stage] = asyncio.ensure_future(run(stage))
+        
+        try:
+            await asyncio.gather(*tasks.values())
+        except Exception:
+            # Bir aşama hata verdiyse ona bağlı olanlar başlamasın
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
     
     async def create_video(self):
         """
         Geliştirilmiş tam otomatik video oluşturma süreci
         """
+        job = None
         try:
             print("\n" + "="*60)
             print("🚀 VideoOtoFabrika Başlatılıyor...")
             print("="*60 + "\n")
             
-            # Dosya adını belirle
-            final_output = self.get_next_filename()
-            print(f"📁 Hedef dosya: {os.path.basename(final_output)}\n")
-            
-            # 1. İçerik üret
-            print("📝 ADIM 1: İçerik Üretimi")
-            print("-" * 60)
-            scenario, search_term = self.content_gen.generate_content()
-            print(f"\n📄 Senaryo:\n{scenario}\n")
-            print(f"🔍 Video arama terimi: '{search_term}'\n")
-            
-            # 2. Sesi oluştur
-            print("🎤 ADIM 2: Ses Üretimi")
-            print("-" * 60)
-            await self.voice_gen.generate_voice(scenario, self.temp_audio)
-            
-            # 3. Video bul ve indir - KONUYLA ALAKALI BIRDEN FAZLA VIDEO
-            print("\n🎥 ADIM 3: Konuyla Alakalı Videolar Arama")
-            print("-" * 60)
-            print(f"🔍 '{search_term}' ile ilgili videolar aranıyor...")
-            video_urls = self.video_mgr.search_video(search_term)
-            
-            # Birden fazla video indir
-            downloaded_videos = self.video_mgr.download_multiple_videos(video_urls, "temp_video")
-            
-            if not downloaded_videos:
-                print("⚠️ Video indirilemedi, tek video ile devam ediliyor...")
-                video_url = video_urls[0] if video_urls else None
-                if video_url:
-                    self.video_mgr.download_video(video_url, self.temp_video)
-                    downloaded_videos = [self.temp_video]
-            
-            print(f"✅ Toplam {len(downloaded_videos)} video hazır")
-            
-            # 4. Final videoyu oluştur (geliştirilmiş alt yazı ile + birden fazla video)
-            print("\n🎬 ADIM 4: Final Video Oluşturma")
-            print("-" * 60)
-            print("✨ Geliştirilmiş alt yazı sistemi kullanılıyor...")
-            
-            # Eğer birden fazla video varsa, önce birleştir
-            if len(downloaded_videos) > 1:
-                print(f"✨ {len(downloaded_videos)} farklı video birleştiriliyor...")
-                from moviepy import VideoFileClip, concatenate_videoclips
-                
-                # Ses süresini al
-                from moviepy import AudioFileClip
-                audio_temp = AudioFileClip(self.temp_audio)
-                audio_duration = audio_temp.duration
-                audio_temp.close()
-                
-                # Hedef boyut: 1080x1920 (YouTube Shorts)
-                target_width = 1080
-                target_height = 1920
-                
-                # Her videoyu yükle ve eşit süreye böl
-                clips = []
-                duration_per_video = audio_duration / len(downloaded_videos)
-                
-                for idx, video_path in enumerate(downloaded_videos):
-                    clip = VideoFileClip(video_path)
-                    
-                    # ÖNCE BOYUTU AYARLA (tüm videolar aynı boyutta olmalı)
-                    if clip.w != target_width or clip.h != target_height:
-                        # Aspect ratio'yu koru ve crop et
-                        clip = clip.resized(height=target_height)
-                        if clip.w < target_width:
-                            clip = clip.resized(width=target_width)
-                        # Ortadan crop et
-                        x_center = clip.w / 2
-                        y_center = clip.h / 2
-                        clip = clip.cropped(
-                            x_center=x_center,
-                            y_center=y_center,
-                            width=target_width,
-                            height=target_height
-                        )
-                    
-                    # Videoyu hedef süreye göre ayarla
-                    if clip.duration < duration_per_video:
-                        # Kısaysa döngüye al
-                        loops = int(duration_per_video / clip.duration) + 1
-                        clip = concatenate_videoclips([clip] * loops)
-                    
-                    # Kes
-                    clip = clip.subclipped(0, min(duration_per_video, clip.duration))
-                    clips.append(clip)
-                
-                # Birleştir ve kaydet (method="chain" kullan - ard arda)
-                combined = concatenate_videoclips(clips, method="chain")
-                combined_path = "temp_combined_video.mp4"
-                combined.write_videofile(combined_path, codec='libx264', audio=False, fps=30, preset='fast', threads=4, logger=None)
-                combined.close()
-                
-                # Clip'leri kapat
-                for clip in clips:
-                    clip.close()
-                
-                print(f"✅ Videolar birleştirildi: {combined_path}")
-                final_video_path = combined_path
-            else:
-                final_video_path = downloaded_videos[0]
-            
-            # Şimdi tek video olarak işle
-            self.video_mgr.create_final_video(
-                final_video_path,
-                self.temp_audio,
-                final_output,
-                subtitle_text=scenario,
-                audio_speed=self.voice_gen.speed_multiplier
-            )
+            # Sınırı aşmış hatalı işleri bırak, sonra dosya adını belirle
+            self.expire_jobs()
+            job = self.new_job()
+            print(f"📁 Hedef dosya: {os.path.basename(job['output'])}\n")
             
-            # 5. Otomatik yükleme (eğer aktifse)
-            if self.auto_upload and self.uploader:
-                print("\n📤 ADIM 5: Otomatik Yükleme")
-                print("-" * 60)
-                try:
-                    self.uploader.upload_video(
-                        final_output,
-                        scenario,
-                        platforms=self.upload_platforms
-                    )
-                except Exception as e:
-                    print(f"⚠️ Yükleme hatası: {e}")
-                    print("💾 Video yine de kaydedildi, manuel yükleyebilirsin")
+            await self.run_job(job)
+            self.job_store.finish(job)
             
             # 6. Geçici dosyaları temizle
             print("\n🧹 ADIM 6: Temizlik")
             print("-" * 60)
-            self._cleanup()
+            self._cleanup(job)
             
             print("\n" + "="*60)
             print("✅ İŞLEM TAMAMLANDI!")
-            print(f"📁 Video konumu: {final_output}")
+            print(f"📁 Video konumu: {job['output']}")
             print("="*60 + "\n")
             
         except Exception as e:
             print(f"\n❌ HATA: {e}")
-            self._cleanup()
+            if job is None:
+                self._cleanup()
+            else:
+                # Senaryo, ses ve klipler silinmez; tekrar denemede baştan üretilmez
+                job["error"] = job["error"] or str(e)
+                self._fail_job(job)
+                print("💾 Tamamlanan aşamalar kaydedildi, devam etmek için: python main.py --resume")
             raise
     
-    def _cleanup(self):
+    async def create_batch(self, count, resume=()):
+        """
+        N videoyu soru sormadan, kaynak zamanlayıcısıyla aynı anda üret
+        
+        Her iş kendi aşama grafiğini (run_job) çalıştırır; aşamalar
+        zamanlayıcının havuzlarından slot alır: ağ aşamaları (içerik, ses, stok
+        video, yükleme) çok sayıda aynı anda, render'lar çekirdek ve belleğe
+        göre ayrılmış slotlarda. Bir videonun render'ı sürerken diğerlerinin
+        içerik/ses/indirmesi ilerler; slot yoksa iş sırada bekler. Hata veren iş
+        atlanır, diğerleri sürer; dosyaları silinmez, --resume ile kaldığı
+        yerden devam ettirilebilir.
+        
+        Args:
+            count: Üretilecek yeni video sayısı
+            resume: Önce devam ettirilecek yarım işler (resume_jobs() sonucu)
+            
+        Returns:
+            list: Tamamlanan işler (hatalılar dahil, "error" alanıyla)
+        """
+        resumed = f" + {len(resume)} yarım iş" if resume else ""
+        print(f"\n🏭 Toplu mod: {count} video{resumed}")
+        print(f"⚙️ {self.scheduler.describe()}\n")
+        self.expire_jobs()
+        batch_start = time.perf_counter()
+        self._render_threads = self.scheduler.render_threads
+        finished = []
+        
+        async def process(job=None):
+            # İş kabulü: aktif iş sayısı sınırlı, yeni işin adı ve klasörü sırası gelince ayrılır
+            async with self.scheduler.job_slot():
+                if job is None:
+                    job = self.new_job()
+                try:
+                    await self.run_job(job)
+                    self.job_store.finish(job)
+                    self._cleanup(job)
+                except Exception as e:
+                    job["error"] = job["error"] or str(e)
+                    self._fail_job(job)
+                    print(f"❌ [{os.path.basename(job['output'])}] hata, video atlanıyor: {job['error']}")
+            finished.append(job)
+        
+        # Semaphore'lar sırayı korur: yarım işler yenilerden önce başlar
+        await asyncio.gather(*(process(job) for job in resume), *(process() for _ in range(count)))
+        
+        self._print_batch_summary(finished, time.perf_counter() - batch_start)
+        return finished
+    
+    def _print_batch_summary(self, jobs, elapsed):
+        """Toplu mod özeti: başarı sayısı, aşama süreleri ve darboğaz"""
+        succeeded = [job for job in jobs if job["error"] is None]
+        
+        print("\n" + "="*60)
+        print(f"🏁 TOPLU MOD BİTTİ: {len(succeeded)}/{len(jobs)} video ({elapsed:.1f} sn)")
+        
+        totals = {stage: sum(job["timings"].get(stage, 0) for job in jobs) for stage in STAGES}
+        sequential = sum(totals.values())
+        for stage in STAGES:
+            print(f"   {stage:<8} toplam {totals[stage]:7.1f} sn")
+        if sequential and elapsed:
+            bottleneck = max(totals, key=totals.get)
+            print(f"⚡ Sıralı çalışsaydı ~{sequential:.1f} sn sürerdi (x{sequential / elapsed:.2f} hız), "
+                  f"darboğaz: {bottleneck}")
+        
+        for job in jobs:
+            if job["error"]:
+                print(f"   ❌ {os.path.basename(job['output'])}: {job['error']}")
+            else:
+                print(f"   ✅ {job['output']}")
+        if len(succeeded) < len(jobs):
+            print("💾 Hatalı işler kaydedildi, devam etmek için: python main.py --resume")
+        print("="*60 + "\n")
+    
+    def _cleanup(self, job=None):
         """Geçici dosyaları temizle"""
-        # Tek temp_video.mp4
-        if os.path.exists(self.temp_video):
-            try:
-                os.remove(self.temp_video)
-                print(f"🗑️ Silindi: {self.temp_video}")
-            except Exception as e:
-                print(f"⚠️ Silinemedi {self.temp_video}: {e}")
+        if job is not None:
+            # Bu işin çalışma klasörü (diğer işlere dokunulmaz)
+            remove_workspace(job["workspace"])
+            return
         
-        # Birleştirilmiş video
-        if os.path.exists("temp_combined_video.mp4"):
-            try:
-                os.remove("temp_combined_video.mp4")
-                print(f"🗑️ Silindi: temp_combined_video.mp4")
-            except Exception as e:
-                print(f"⚠️ Silinemedi temp_combined_video.mp4: {e}")
+        temp_files = [self.temp_audio, self.temp_video]
+        temp_files += [f"temp_video_{i}.mp4" for i in range(1, 10)]
         
-        # Birden fazla temp_video_X.mp4
-        for i in range(1, 10):
-            temp_file = f"temp_video_{i}.mp4"
+        for temp_file in temp_files:
             if os.path.exists(temp_file):
                 try:
                     os.remove(temp_file)
                     print(f"🗑️ Silindi: {temp_file}")
                 except Exception as e:
                     print(f"⚠️ Silinemedi {temp_file}: {e}")
-        
-        # Ses dosyası
-        if os.path.exists(self.temp_audio):
-            try:
-                os.remove(self.temp_audio)
-                print(f"🗑️ Silindi: {self.temp_audio}")
-            except Exception as e:
-                print(f"⚠️ Silinemedi {self.temp_audio}: {e}")
 
 
 async def main():
     """Ana fonksiyon"""
+    parser = argparse.ArgumentParser(description="VideoOtoFabrika")
+    parser.add_argument("--batch", type=int, metavar="N",
+                        help="N videoyu soru sormadan, ağ ve render aşamalarını ayrı havuzlarda üret")
+    parser.add_argument("--resume", action="store_true",
+                        help="Hata veren/yarıda kalan işlere ilk eksik aşamadan devam et")
+    parser.add_argument("--jobs", action="store_true", help="Devam bekleyen işleri listele")
+    parser.add_argument("--discard", nargs="+", metavar="JOB_ID",
+                        help="İşleri bırak (dosyaları silinir, çıktı adı serbest kalır); 'all' = tümü")
+    args = parser.parse_args()
+    
+    if args.jobs or args.discard:
+        fabrika = VideoOtoFabrika()
+        pending = fabrika.job_store.incomplete()
+        if args.jobs:
+            if not pending:
+                print("✅ Devam edilecek yarım iş yok")
+            for job in pending:
+                print(f"   {job['id']}  {os.path.basename(job['output']):<14} "
+                      f"{job.get('attempts', 0)} deneme  {job.get('error') or ''}")
+        if args.discard:
+            by_id = {job["id"]: job for job in pending}
+            for job_id in (list(by_id) if "all" in args.discard else args.discard):
+                if job_id not in by_id:
+                    print(f"⚠️ Devam bekleyen iş bulunamadı (veya başka süreçte çalışıyor): {job_id}")
+                    continue
+                fabrika.discard_job(by_id[job_id], "elle bırakıldı")
+        return
+    
+    if args.batch or args.resume:
+        fabrika = VideoOtoFabrika()
+        resume = fabrika.resume_jobs() if args.resume else []
+        if args.resume and not resume and not args.batch:
+            print("✅ Devam edilecek yarım iş yok")
+            return
+        await fabrika.create_batch(args.batch or 0, resume=resume)
+        return
+    
     print("""
     ╔══════════════════════════════════════════════════════════╗
     ║                                                          ║
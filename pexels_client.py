@@ -0,0 +1,241 @@
+"""
+VideoOtoFabrika - Pexels API İstemcisi
+Tüm Pexels API istekleri bu istemciden geçer. İstek hakları sqlite'ta
+tutulan bir token bucket'tan alınır; aynı makinedeki tüm süreçler ve
+thread'ler aynı kovayı paylaşır.
+
+Pexels yanıtlarındaki X-Ratelimit-Remaining / X-Ratelimit-Reset başlıkları
+kovayı sunucunun gerçek durumuna çeker: kalan hak azsa istekler reset
+zamanına kadar yayılır, hak bittiyse veya 429 gelirse herkes birlikte
+bekler. İstekler başarısız olmak yerine sıraya girer.
+"""
+
+import os
+import time
+import random
+import sqlite3
+import threading
+import requests
+
+
+class RateLimitTimeout(Exception):
+    """İzin verilen bekleme süresi içinde istek hakkı alınamadı"""
+
+
+class TokenBucket:
+    def __init__(self, db_path="cache/pexels_rate.sqlite", name="pexels", capacity=20, per_hour=200, reserve=500):
+        """
+        Süreçler arası paylaşılan token bucket
+        
+        Args:
+            db_path: sqlite dosyası (aynı dosyayı kullanan süreçler kovayı paylaşır)
+            name: Kova adı
+            capacity: Art arda yapılabilecek maksimum istek (patlama)
+            per_hour: Saatlik istek hakkı (kova dolum hızı)
+            reserve: Kalan aylık hak bunun altına inince istekler reset'e kadar yayılır
+        """
+        self.db_path = db_path
+        self.name = name
+        self.capacity = capacity
+        self.default_rate = per_hour / 3600.0
+        self.reserve = reserve
+        self._lock = threading.Lock()
+        
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS buckets (
+                name TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                rate REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                blocked_until REAL NOT NULL DEFAULT 0,
+                failures INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        self._conn.execute(
+            "INSERT OR IGNORE INTO buckets (name, tokens, rate, updated_at) VALUES (?, ?, ?, ?)",
+            (name, float(capacity), self.default_rate, time.time())
+        )
+    
+    def _update(self, fn):
+        """Satırı tek bir yazma işleminde oku-değiştir-yaz (süreçler arası atomik)"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT tokens, rate, updated_at, blocked_until, failures FROM buckets WHERE name = ?",
+                    (self.name,)
+                ).fetchone()
+                now = time.time()
+                tokens, rate, updated_at, blocked_until, failures = row
+                tokens = min(self.capacity, tokens + max(now - updated_at, 0) * rate)
+                
+                result, (tokens, rate, blocked_until, failures) = fn(now, tokens, rate, blocked_until, failures)
+                
+                self._conn.execute(
+                    "UPDATE buckets SET tokens = ?, rate = ?, updated_at = ?, blocked_until = ?, failures = ? "
+                    "WHERE name = ?",
+                    (tokens, rate, now, blocked_until, failures, self.name)
+                )
+                self._conn.execute("COMMIT")
+                return result
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+    
+    def acquire(self, max_wait=600):
+        """
+        Bir istek hakkı al, gerekirse hak gelene kadar bekle
+        
+        Args:
+            max_wait: Maksimum bekleme (saniye)
+        
+        Returns:
+            float: Beklenen süre (saniye)
+        """
+        start = time.time()
+        
+        def take(now, tokens, rate, blocked_until, failures):
+            if now < blocked_until:
+                return blocked_until - now, (tokens, rate, blocked_until, failures)
+            if tokens >= 1:
+                return 0.0, (tokens - 1, rate, blocked_until, failures)
+            return (1 - tokens) / rate, (tokens, rate, blocked_until, failures)
+        
+        while True:
+            wait = self._update(take)
+            if wait <= 0:
+                return time.time() - start
+            if time.time() - start + wait > max_wait:
+                raise RateLimitTimeout(f"Pexels istek hakkı {max_wait} sn içinde alınamadı")
+            # Bekleyen süreçler aynı anda uyanıp yarışmasın
+            time.sleep(min(wait, 5) + random.uniform(0, 0.25))
+    
+    def observe(self, remaining, reset_at, ok=True):
+        """
+        Sunucunun bildirdiği kalan hakla kovayı eşitle
+        
+        Pexels başlıkları aylık kotayı bildirir; kalan hak azaldığında
+        (yedek eşiğinin altında) istekler reset zamanına kadar eşit yayılır.
+        
+        Args:
+            remaining: X-Ratelimit-Remaining
+            reset_at: X-Ratelimit-Reset (UNIX zamanı, None = bilinmiyor)
+            ok: İstek başarılı mı (başarılıysa ardışık hata sayacı sıfırlanır)
+        """
+        def sync(now, tokens, rate, blocked_until, failures):
+            tokens = min(tokens, float(remaining))
+            rate = self.default_rate
+            if reset_at and reset_at > now:
+                if remaining <= 0:
+                    blocked_until = max(blocked_until, reset_at)
+                elif remaining < self.reserve:
+                    rate = min(rate, remaining / (reset_at - now))
+            return None, (tokens, max(rate, 1e-4), blocked_until, 0 if ok else failures)
+        
+        self._update(sync)
+    
+    def backoff(self, retry_after=None):
+        """
+        Throttle (429) sonrası tüm istemcileri beklet
+        
+        Retry-After yoksa ardışık hatalarda üstel artan süre (en fazla 5 dk) kullanılır.
+        
+        Args:
+            retry_after: Sunucunun önerdiği bekleme (saniye, opsiyonel)
+        
+        Returns:
+            float: Uygulanan bekleme (saniye)
+        """
+        def block(now, tokens, rate, blocked_until, failures):
+            failures += 1
+            delay = retry_after if retry_after else min(2 ** failures, 300)
+            return delay, (0.0, rate, max(blocked_until, now + delay), failures)
+        
+        return self._update(block)
+
+
+class PexelsClient:
+    BASE_URL = 'https://api.pexels.com/videos'
+    
+    def __init__(self, api_key, session=None, bucket=None, max_wait=600, max_retries=5):
+        """
+        Pexels API istemcisi
+        
+        Args:
+            api_key: Pexels API anahtarı
+            session: requests.Session (None = yeni oturum)
+            bucket: TokenBucket (None = varsayılan paylaşılan kova)
+            max_wait: Bir isteğin sırada bekleyebileceği maksimum süre (saniye)
+            max_retries: 429 / 5xx sonrası tekrar deneme sayısı
+        """
+        self.api_key = api_key
+        self.session = session or requests.Session()
+        self.bucket = bucket or TokenBucket()
+        self.max_wait = max_wait
+        self.max_retries = max_retries
+    
+    def _observe_headers(self, response):
+        """X-Ratelimit-* başlıkları varsa kovayı güncelle"""
+        headers = response.headers
+        remaining = headers.get('X-Ratelimit-Remaining')
+        if remaining is None or not remaining.lstrip('-').isdigit():
+            return
+        reset = headers.get('X-Ratelimit-Reset')
+        reset_at = float(reset) if reset and reset.isdigit() else None
+        self.bucket.observe(int(remaining), reset_at, ok=response.ok)
+    
+    def get(self, path, params=None):
+        """
+        API isteği: hak alınır, 429 ve 5xx'te bekleyip tekrar denenir
+        
+        Args:
+            path: Uç nokta (ör. "/search")
+            params: Sorgu parametreleri
+        
+        Returns:
+            dict: JSON yanıtı
+        """
+        attempt = 0
+        while True:
+            waited = self.bucket.acquire(self.max_wait)
+            if waited >= 1:
+                print(f"⏳ Pexels istek sırası: {waited:.1f} sn beklendi")
+            
+            response = self.session.get(
+                f'{self.BASE_URL}{path}',
+                headers={'Authorization': self.api_key},
+                params=params,
+                timeout=10
+            )
+            self._observe_headers(response)
+            
+            if response.status_code == 429 or response.status_code >= 500:
+                attempt += 1
+                if attempt > self.max_retries:
+                    response.raise_for_status()
+                retry_after = response.headers.get('Retry-After')
+                delay = self.bucket.backoff(float(retry_after) if retry_after and retry_after.isdigit() else None)
+                print(f"🐢 Pexels {response.status_code}, {delay:.0f} sn sonra tekrar denenecek "
+                      f"({attempt}/{self.max_retries})")
+                continue
+            
+            response.raise_for_status()
+            return response.json()
+    
+    def search_videos(self, params):
+        """
+        /videos/search
+        
+        Args:
+            params: query, per_page, page, orientation
+        
+        Returns:
+            dict: Pexels JSON yanıtı
+        """
+        return self.get('/search', params)
@@ -0,0 +1,159 @@
+"""
+VideoOtoFabrika - Önbellek Isıtma Komutu
+Gemini prompt'undaki arama terimi sözlüğünü (veya config.PREWARM_TERMS)
+önceden arar ve her terim için K klibi indirip mezzanine önbelleğine alır.
+Çalışma anında bu terimler için arama ve indirme beklemesi olmaz; havuz
+her videoda döndürülür, ardışık videolar aynı görüntüleri kullanmaz.
+
+Kullanım:
+    python prewarm.py                          # tüm sözlük
+    python prewarm.py --terms "money" "yacht"  # sadece verilen terimler
+    python prewarm.py --pool-size 20 --refresh # havuzları yeniden doldur
+    python prewarm.py --list                   # mevcut havuzları göster
+"""
+
+import os
+import sys
+import argparse
+import tempfile
+import config
+from video_manager import VideoManager
+
+
+def vocabulary():
+    """
+    Isıtılacak terimler: config.PREWARM_TERMS, yoksa prompt sözlüğü
+    
+    Returns:
+        list: Arama terimleri
+    """
+    terms = getattr(config, 'PREWARM_TERMS', None)
+    if terms:
+        return list(terms)
+    
+    from content_generator import search_terms
+    return search_terms()
+
+
+def _candidate_urls(video_mgr, term, pool_size, clip_duration):
+    """
+    Terim için en uygun `pool_size` videonun dosya URL'leri
+    
+    İlk sayfa search_video ile aynı anahtarla aranır (arama önbelleği de
+    ısınır); yetmezse sonraki sayfa ve yatay videolar eklenir.
+    
+    Args:
+        video_mgr: VideoManager
+        term: Arama terimi
+        pool_size: İstenen klip sayısı
+        clip_duration: Klip süresi (süre uyumu puanı için)
+    
+    Returns:
+        list: Video dosyası URL'leri (en iyi önce)
+    """
+    videos = []
+    urls = []
+    for page in (1, 2):
+        videos += video_mgr._search_api(term, per_page=15, page=page).get('videos', [])
+        
+        urls = []
+        seen = set()
+        for portrait_only in (True, False):
+            for video, file in video_mgr._rank_videos(videos, 1080, 1920, clip_duration, portrait_only):
+                if video.get('id') in seen:
+                    continue
+                seen.add(video.get('id'))
+                urls.append(file['link'])
+            if len(urls) >= pool_size:
+                break
+        
+        if len(urls) >= pool_size:
+            break
+    
+    return urls[:pool_size]
+
+
+def prewarm_term(video_mgr, term, pool_size, clip_duration, refresh=False):
+    """
+    Bir terimin havuzunu doldur
+    
+    Args:
+        video_mgr: VideoManager (önbellek açık)
+        term: Arama terimi
+        pool_size: Havuzdaki klip sayısı
+        clip_duration: Her klipten indirilecek süre (saniye)
+        refresh: Havuz doluysa da yeniden ara ve doldur
+    
+    Returns:
+        int: Havuzdaki klip sayısı
+    """
+    existing = video_mgr.footage_pool.clips(term)
+    if len(existing) >= pool_size and not refresh:
+        print(f"✅ '{term}': havuz dolu ({len(existing)} klip)")
+        return len(existing)
+    
+    print(f"\n🔥 '{term}' ısıtılıyor...")
+    urls = _candidate_urls(video_mgr, term, pool_size, clip_duration)
+    if not urls:
+        print(f"⚠️ '{term}' için video bulunamadı")
+        return len(existing)
+    
+    with tempfile.TemporaryDirectory(prefix="prewarm_") as workdir:
+        base_name = os.path.join(workdir, "clip")
+        # Havuz önbellekteki mezzanine'lerden oluşur: akış kaynağı değil dosya gerekir
+        paths = video_mgr.download_multiple_videos(urls, base_name, duration=clip_duration, stream=False)
+    
+    # Önbelleğe alınamayan ham dosyalar geçici klasörle birlikte silindi
+    paths = [path for path in paths if isinstance(path, str) and video_mgr.footage_cache.contains(path)]
+    video_mgr.footage_pool.set_pool(term, paths)
+    print(f"✅ '{term}': {len(paths)} klip havuzda")
+    return len(paths)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stok video önbelleğini arama terimi sözlüğüyle ısıt")
+    parser.add_argument("--terms", nargs="+", help="Isıtılacak terimler (varsayılan: sözlük)")
+    parser.add_argument("--pool-size", type=int, default=getattr(config, 'PREWARM_POOL_SIZE', 12),
+                        help="Terim başına klip sayısı")
+    parser.add_argument("--duration", type=float, default=getattr(config, 'PREWARM_CLIP_DURATION', 12),
+                        help="Her klipten indirilecek süre (saniye)")
+    parser.add_argument("--refresh", action="store_true", help="Dolu havuzları da yeniden doldur")
+    parser.add_argument("--list", action="store_true", help="Mevcut havuzları listele")
+    args = parser.parse_args()
+    
+    video_mgr = VideoManager()
+    if not video_mgr.footage_pool:
+        print("❌ FOOTAGE_CACHE_ENABLED kapalı, havuzlar önbellekte tutuluyor")
+        return 1
+    
+    if args.list:
+        for term, count in video_mgr.footage_pool.terms().items():
+            print(f"   {term:<20} {count} klip")
+        return 0
+    
+    if not video_mgr.api_key:
+        print("❌ PEXELS_API_KEY bulunamadı! Isıtma için Pexels gerekli.")
+        return 1
+    
+    terms = args.terms or vocabulary()
+    print(f"🔥 {len(terms)} terim ısıtılacak (terim başına {args.pool_size} klip, {args.duration:g} sn)")
+    
+    failed = []
+    for term in terms:
+        try:
+            if not prewarm_term(video_mgr, term, args.pool_size, args.duration, args.refresh):
+                failed.append(term)
+        except Exception as e:
+            print(f"❌ '{term}' ısıtılamadı: {e}")
+            failed.append(term)
+    
+    if failed:
+        print(f"\n⚠️ Havuzu boş kalan terimler: {', '.join(failed)}")
+        return 1
+    
+    print(f"\n✅ {len(terms)} terim hazır")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
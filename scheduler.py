@@ -0,0 +1,135 @@
+"""
+VideoOtoFabrika - Kaynak Zamanlayıcı Modülü
+Aşamaları kaynak türüne göre ayrı havuzlarda çalıştırır:
+- Ağ aşamaları (Gemini, edge-tts, Pexels indirme, yükleme) bekleyerek
+  geçer; çok sayıda aynı anda çalışabilir.
+- Render (MoviePy/x264) CPU ve bellek tüketir; slot sayısı çekirdek
+  sayısından ve kullanılabilir bellekten hesaplanır, her render'a çekirdek
+  payı kadar thread verilir.
+
+Render slotu boşalsa bile bellek yetmiyorsa render başlamaz (giriş
+kontrolü); işler sırada bekler, makine aşırı yüklenip OOM ile render
+öldürülmez. Bu süreçte çalışan render yoksa beklenmez: belleği
+boşaltacak bir şey yoktur.
+"""
+
+import os
+import time
+import asyncio
+from contextlib import asynccontextmanager
+from workspace import mem_available_mb
+
+
+NETWORK_STAGES = ("content", "voice", "footage", "upload")
+CPU_STAGES = ("render",)
+
+
+def render_capacity(threads_per_render=4, memory_mb=1500):
+    """
+    Makinenin kaldırabileceği eşzamanlı render sayısı
+    
+    Args:
+        threads_per_render: Bir render'a ayrılacak çekirdek sayısı
+        memory_mb: Bir render'ın tepe bellek kullanımı (MB)
+    
+    Returns:
+        int: Render slotu (en az 1)
+    """
+    cores = os.cpu_count() or 1
+    slots = max(cores // max(threads_per_render, 1), 1)
+    
+    available = mem_available_mb()
+    if available is not None:
+        slots = min(slots, max(int(available // memory_mb), 1))
+    return slots
+
+
+class ResourceScheduler:
+    # Yeni başlayan render belleğini henüz ayırmamış olabilir; bu süre boyunca
+    # tahmini kullanımı giriş kontrolünde hesaba katılır
+    RAMP_SECONDS = 15
+    
+    def __init__(self, network_slots=8, render_slots=None, threads_per_render=4,
+                 render_memory_mb=1500, max_active_jobs=None, poll_interval=2.0):
+        """
+        Kaynak zamanlayıcı (asyncio; tek event loop içinde kullanılır)
+        
+        Args:
+            network_slots: Aynı anda çalışabilecek ağ aşaması
+            render_slots: Eşzamanlı render (None = çekirdek ve belleğe göre)
+            threads_per_render: Slot hesabında bir render'ın çekirdek payı
+            render_memory_mb: Bir render'ın tepe bellek kullanımı (MB)
+            max_active_jobs: Aynı anda işlenen iş (None = ağ + 2 × render slotu)
+            poll_interval: Bellek kontrol aralığı (saniye)
+        """
+        self.network_slots = network_slots
+        self.render_slots = render_slots or render_capacity(threads_per_render, render_memory_mb)
+        self.render_threads = max((os.cpu_count() or 1) // self.render_slots, 1)
+        self.render_memory_mb = render_memory_mb
+        self.max_active_jobs = max_active_jobs or network_slots + 2 * self.render_slots
+        self.poll_interval = poll_interval
+        
+        self._network = asyncio.Semaphore(network_slots)
+        self._render = asyncio.Semaphore(self.render_slots)
+        self._jobs = asyncio.Semaphore(self.max_active_jobs)
+        self._active_renders = 0
+        self._render_starts = []
+    
+    @asynccontextmanager
+    async def job_slot(self):
+        """İş kabulü: aynı anda en fazla max_active_jobs iş (disk ve bellek sınırlı kalır)"""
+        async with self._jobs:
+            yield
+    
+    @asynccontextmanager
+    async def slot(self, stage, label=""):
+        """
+        Aşamanın havuzundan slot al, gerekirse sırada bekle
+        
+        Args:
+            stage: Aşama adı (NETWORK_STAGES veya CPU_STAGES)
+            label: Log için iş adı
+        """
+        if stage not in CPU_STAGES:
+            async with self._network:
+                yield
+            return
+        
+        async with self._render:
+            await self._admit(label)
+            self._active_renders += 1
+            self._render_starts.append(time.monotonic())
+            try:
+                yield
+            finally:
+                self._active_renders -= 1
+    
+    def _reserved_mb(self):
+        """Belleği henüz görünmeyen (yeni başlamış) render'ların tahmini kullanımı"""
+        now = time.monotonic()
+        self._render_starts = [t for t in self._render_starts if now - t < self.RAMP_SECONDS]
+        return len(self._render_starts) * self.render_memory_mb
+    
+    async def _admit(self, label):
+        """Render'ı ancak bellek yeterliyse başlat (diğer süreçlerin kullanımı da hesaba katılır)"""
+        announced = False
+        while True:
+            # Bu süreçte render yoksa beklemek belleği boşaltmaz: hemen başla
+            if self._active_renders == 0:
+                break
+            
+            available = mem_available_mb()
+            if available is None or available - self._reserved_mb() >= self.render_memory_mb:
+                break
+            
+            if not announced:
+                print(f"⏳ [{label}] render için bellek bekleniyor "
+                      f"({available:.0f} MB boş, {self.render_memory_mb} MB gerekli)")
+                announced = True
+            await asyncio.sleep(self.poll_interval)
+    
+    def describe(self):
+        """Kapasite özeti (log için)"""
+        return (f"ağ: {self.network_slots} eşzamanlı, render: {self.render_slots} slot "
+                f"(× {self.render_threads} thread, ~{self.render_memory_mb} MB), "
+                f"aynı anda en fazla {self.max_active_jobs} iş")
@@ -0,0 +1,111 @@
+"""
+VideoOtoFabrika - Pexels Arama Önbelleği Modülü
+/videos/search yanıtlarını (query, orientation, per_page, page) anahtarıyla
+sqlite'ta saklar. TTL dolan kayıtlar bir süre daha "bayat" olarak
+döndürülür ve arka planda yenilenir (stale-while-revalidate).
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+
+
+class SearchCache:
+    def __init__(self, db_path="cache/search_cache.sqlite", ttl=86400, stale_ttl=604800):
+        """
+        Arama önbelleğini başlat
+        
+        Args:
+            db_path: sqlite dosyası
+            ttl: Kaydın taze sayıldığı süre (saniye)
+            stale_ttl: TTL'den sonra bayat kaydın hâlâ kullanılabildiği süre (saniye)
+        """
+        self.db_path = db_path
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._memory = {}
+        self._lock = threading.Lock()
+        
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS searches (
+                query TEXT NOT NULL,
+                orientation TEXT NOT NULL,
+                per_page INTEGER NOT NULL,
+                page INTEGER NOT NULL,
+                response TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (query, orientation, per_page, page)
+            )
+        """)
+        self._conn.commit()
+        self.purge()
+    
+    @staticmethod
+    def make_key(query, orientation=None, per_page=15, page=1):
+        """Önbellek anahtarı (sorgu büyük/küçük harf ve boşluklardan bağımsız)"""
+        return (" ".join(query.lower().split()), orientation or "", int(per_page), int(page))
+    
+    def get(self, key):
+        """
+        Önbellekteki yanıtı döndür
+        
+        Args:
+            key: make_key() sonucu
+        
+        Returns:
+            tuple: (yanıt dict veya None, taze mi)
+        """
+        entry = self._memory.get(key)
+        if entry is None:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT response, fetched_at FROM searches "
+                    "WHERE query=? AND orientation=? AND per_page=? AND page=?",
+                    key
+                ).fetchone()
+            if row is None:
+                return None, False
+            entry = (json.loads(row[0]), row[1])
+            self._memory[key] = entry
+        
+        data, fetched_at = entry
+        age = time.time() - fetched_at
+        if age <= self.ttl:
+            return data, True
+        if age <= self.ttl + self.stale_ttl:
+            return data, False
+        return None, False
+    
+    def set(self, key, data):
+        """
+        Yanıtı önbelleğe yaz
+        
+        Args:
+            key: make_key() sonucu
+            data: Pexels JSON yanıtı (dict)
+        """
+        fetched_at = time.time()
+        self._memory[key] = (data, fetched_at)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO searches "
+                "(query, orientation, per_page, page, response, fetched_at) VALUES (?, ?, ?, ?, ?, ?)",
+                key + (json.dumps(data), fetched_at)
+            )
+            self._conn.commit()
+    
+    def purge(self):
+        """Bayat süresi de dolmuş kayıtları sil"""
+        cutoff = time.time() - self.ttl - self.stale_ttl
+        with self._lock:
+            self._conn.execute("DELETE FROM searches WHERE fetched_at < ?", (cutoff,))
+            self._conn.commit()
+        self._memory = {k: v for k, v in self._memory.items() if v[1] >= cutoff}
@@ -0,0 +1,192 @@
+"""
+VideoOtoFabrika - Paralel Parça Render Modülü
+Zaman çizelgesini GOP sınırlarına hizalı N parçaya böler, parçaları
+ayrı süreçlerde encode eder ve ffmpeg concat demuxer ile yeniden
+encode etmeden birleştirir. Ses en sonda bir kez eklenir.
+"""
+
+import os
+import subprocess
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import config
+from ffmpeg_renderer import get_ffmpeg_exe
+from encoding_profiles import get_profile, moviepy_kwargs
+
+
+def plan_segments(duration, segments, fps=30, gop=15):
+    """
+    Süreyi GOP sınırlarına hizalı parçalara böl
+    
+    Args:
+        duration: Toplam süre (saniye)
+        segments: İstenen parça sayısı
+        fps: Kare hızı
+        gop: Anahtar kare aralığı (kare)
+    
+    Returns:
+        list: (başlangıç, bitiş) saniye listesi - her parça anahtar kareyle başlar
+    """
+    total_frames = max(int(round(duration * fps)), 1)
+    
+    # Parça boyu GOP'un katı (son parça kalanı alır)
+    gops = -(-total_frames // gop)
+    gops_per_segment = max(-(-gops // max(segments, 1)), 1)
+    frames_per_segment = gops_per_segment * gop
+    
+    plan = []
+    for first in range(0, total_frames, frames_per_segment):
+        last = min(first + frames_per_segment, total_frames)
+        plan.append((first / fps, last / fps))
+    return plan
+
+
+def _config_snapshot():
+    """
+    config'in çalışma anındaki değerleri (işçiler spawn ile başlar, config'i dosyadan okur)
+    
+    Returns:
+        dict: Büyük harfli ayarlar (sadece basit değerler)
+    """
+    simple = (str, int, float, bool, list, tuple, dict, type(None))
+    return {
+        name: value for name, value in vars(config).items()
+        if name.isupper() and isinstance(value, simple)
+    }
+
+
+def _init_worker(settings):
+    """İşçi süreç başlangıcı: ana süreçteki config değerlerini uygula"""
+    for name, value in settings.items():
+        setattr(config, name, value)
+
+
+def _render_segment(template_name, sources, audio_duration, subtitle_text,
+                    start, end, output_path, fps, profile, threads):
+    """
+    Tek parçayı render et (işçi süreçte çalışır, pipeline burada yeniden kurulur)
+    
+    Args:
+        template_name: Şablon adı
+        sources: (path, başlangıç, bitiş) listesi
+        audio_duration: Toplam süre (zoom ve alt yazı zamanlaması için)
+        subtitle_text: Alt yazı metni
+        start: Parça başlangıcı (saniye)
+        end: Parça bitişi (saniye)
+        output_path: Parça dosyası
+        fps: Kare hızı
+        profile: Encode profili (get_profile() sonucu)
+        threads: x264 thread sayısı
+    
+    Returns:
+        str: Parça dosyası
+    """
+    # Sadece şablon ve config: Pexels, sqlite ve kütüphane açılmaz
+    from video_manager import compose_main_video
+    
+    video, source_clips = compose_main_video(template_name, sources, audio_duration, subtitle_text)
+    
+    try:
+        # Efektler tüm zaman çizelgesine göre kurulduğu için kesme en sonda yapılır
+        # Son parça videonun sonuna kadar (kayan nokta yuvarlaması süreyi aşmasın)
+        segment = video.subclipped(start, end if end < video.duration else None)
+        segment.write_videofile(
+            output_path,
+            codec='libx264',
+            audio=False,
+            fps=fps,
+            logger=None,
+            **moviepy_kwargs(profile, threads)
+        )
+    finally:
+        for clip in source_clips:
+            clip.close()
+    
+    return output_path
+
+
+def concat_segments(segment_paths, audio_path, output_path, duration):
+    """
+    Parçaları yeniden encode etmeden birleştir ve sesi bir kez ekle
+    
+    Args:
+        segment_paths: Sıralı parça dosyaları
+        audio_path: Ses dosyası
+        output_path: Çıktı dosyası
+        duration: Çıktı süresi (saniye)
+    """
+    list_path = os.path.join(os.path.dirname(segment_paths[0]), "segments.txt")
+    with open(list_path, "w", encoding="utf-8") as f:
+        for path in segment_paths:
+            escaped = os.path.abspath(path).replace("\\", "/").replace("'", "'\\''")
+            f.write(f"file '{escaped}'\n")
+    
+    cmd = [
+        get_ffmpeg_exe(), "-y", "-hide_banner", "-loglevel", "error",
+        "-f", "concat", "-safe", "0", "-i", list_path,
+        "-i", audio_path,
+        "-map", "0:v:0", "-map", "1:a:0",
+        "-c:v", "copy",
+        "-c:a", "aac",
+        "-t", f"{duration:.3f}",
+        "-movflags", "+faststart",
+        output_path,
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Parçalar birleştirilemedi: {result.stderr.strip()[-500:]}")
+
+
+def render_segmented(template_name, sources, audio_path, output_path, audio_duration,
+                     subtitle_text=None, segments=4, workers=None, fps=30, profile=None):
+    """
+    Videoyu paralel parçalar halinde render et
+    
+    Args:
+        template_name: Şablon adı (işçiler pipeline'ı yeniden kurar)
+        sources: (path, başlangıç, bitiş) listesi
+        audio_path: Ses dosyası
+        output_path: Çıktı dosyası
+        audio_duration: Video süresi (saniye)
+        subtitle_text: Alt yazı metni (opsiyonel)
+        segments: Parça sayısı
+        workers: Süreç sayısı (None = çekirdek sayısı; en fazla profildeki thread sayısı)
+        fps: Kare hızı
+        profile: Encode profili (None = config'deki; parça sınırları GOP'un katı)
+    """
+    profile = profile or get_profile()
+    plan = plan_segments(audio_duration, segments, fps, profile["gop"])
+    # Süreç sayısı render'ın thread bütçesini aşmaz (aynı anda birden fazla
+    # render varsa zamanlayıcı bütçeyi çekirdek payıyla sınırlar)
+    workers = min(workers or os.cpu_count() or 1, profile["threads"], len(plan))
+    
+    # Profilin thread bütçesi süreçler arasında paylaştırılır
+    threads = max(profile["threads"] // workers, 1)
+    
+    print(f"🧩 {len(plan)} parça, {workers} süreçte render ediliyor...")
+    
+    with tempfile.TemporaryDirectory(prefix="segments_") as workdir:
+        segment_paths = [os.path.join(workdir, f"segment_{idx:03d}.mp4") for idx in range(len(plan))]
+        
+        # fork değil spawn: ana süreç çok thread'li (zamanlayıcı, heartbeat, sqlite),
+        # fork edilen çocuk kopyalanmış bir kilitte kilitlenebilir
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(_config_snapshot(),)
+        ) as pool:
+            futures = [
+                pool.submit(
+                    _render_segment, template_name, sources, audio_duration, subtitle_text,
+                    start, end, path, fps, profile, threads
+                )
+                for (start, end), path in zip(plan, segment_paths)
+            ]
+            for idx, future in enumerate(futures):
+                future.result()
+                print(f"✅ Parça {idx+1}/{len(plan)} hazır")
+        
+        print("🔗 Parçalar birleştiriliyor (yeniden encode yok)...")
+        concat_segments(segment_paths, audio_path, output_path, audio_duration)
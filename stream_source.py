@@ -0,0 +1,209 @@
+"""
+VideoOtoFabrika - HTTP Akış Kaynağı Modülü
+Önbelleğe alınmayacak stok videoları diske yazmadan doğrudan ffmpeg'e
+besler: HTTP yanıtı sınırlı bir okuma-önü kuyruğuna alınır, ayrı bir
+thread kuyruktan ffmpeg'in pipe girişine yazar. Render indirme bitmeden
+decode etmeye başlar, ağ ve CPU süresi örtüşür.
+
+Pipe'ta geri sarma yoktur; sadece moov atom'u başta olan (faststart) MP4
+dosyaları akıtılabilir. Diğerleri NotStreamable ile reddedilir ve
+çağıran normal indirmeye döner.
+"""
+
+import os
+import queue
+import struct
+import threading
+
+
+class NotStreamable(Exception):
+    """Dosya pipe üzerinden decode edilemez (moov sonda veya bilinmeyen format)"""
+
+
+def mp4_streamable(head):
+    """
+    MP4 üst seviye kutularına bakarak moov'un mdat'tan önce gelip gelmediğini bul
+    
+    Args:
+        head: Dosyanın ilk baytları
+    
+    Returns:
+        bool veya None: True = akıtılabilir, False = değil, None = karar için veri yetersiz
+    """
+    offset = 0
+    while offset + 8 <= len(head):
+        size, box_type = struct.unpack(">I4s", head[offset:offset + 8])
+        if size == 1:
+            if offset + 16 > len(head):
+                return None
+            size = struct.unpack(">Q", head[offset + 8:offset + 16])[0]
+        elif size == 0:
+            size = None  # Dosya sonuna kadar
+        
+        if box_type == b"moov":
+            return True
+        if box_type == b"mdat" or size is None or size < 8:
+            return False
+        
+        offset += size
+    return None
+
+
+class HTTPStreamSource:
+    def __init__(self, url, session, read_ahead_mb=16, chunk_size=256 * 1024, max_head_mb=4, fallback_path=None):
+        """
+        HTTP'den ffmpeg'e akış kaynağı
+        
+        Args:
+            url: Video URL'i
+            session: requests.Session (bağlantı havuzu paylaşılır)
+            read_ahead_mb: Ağdan okunup decode'u bekleyebilecek maksimum veri (MB)
+            chunk_size: Okuma parça boyutu (bayt)
+            max_head_mb: moov aranırken okunacak maksimum baş kısmı (MB)
+            fallback_path: Akış kullanılamazsa dosyanın indirileceği yol (opsiyonel)
+        """
+        self.url = url
+        self.session = session
+        self.fallback_path = fallback_path
+        self.chunk_size = chunk_size
+        self.max_head = int(max_head_mb * 1024 * 1024)
+        self.input_url = None
+        self.bytes_read = 0
+        
+        self._queue = queue.Queue(maxsize=max(int(read_ahead_mb * 1024 * 1024 // chunk_size), 1))
+        self._stop = threading.Event()
+        self._response = None
+        self._chunks = None
+        self._head = []
+        self._read_fd = None
+        self._write_fd = None
+        self._threads = []
+        self.error = None
+    
+    def open(self):
+        """
+        İsteği başlat ve baş kısmı oku; akıtılamıyorsa NotStreamable
+        
+        Returns:
+            HTTPStreamSource: self
+        """
+        self._response = self.session.get(self.url, stream=True, timeout=30)
+        try:
+            self._response.raise_for_status()
+            self._chunks = self._response.iter_content(chunk_size=self.chunk_size)
+            
+            head = b""
+            decision = None
+            while decision is None and len(head) < self.max_head:
+                chunk = next(self._chunks, None)
+                if not chunk:
+                    break
+                self._head.append(chunk)
+                head += chunk
+                decision = mp4_streamable(head)
+            
+            if not decision:
+                raise NotStreamable("moov atom'u dosya başında değil")
+            
+            self.bytes_read = len(head)
+            return self
+        except Exception:
+            self._response.close()
+            raise
+    
+    def attach(self):
+        """
+        ffmpeg için pipe oluştur ve akışı başlat
+        
+        Returns:
+            int: ffmpeg'e verilecek okuma fd'si (girdi adı: self.input_url)
+        """
+        self._read_fd, self._write_fd = os.pipe()
+        self.input_url = f"pipe:{self._read_fd}"
+        
+        self._threads = [
+            threading.Thread(target=self._fetch, daemon=True),
+            threading.Thread(target=self._feed, daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+        return self._read_fd
+    
+    def release_reader(self):
+        """ffmpeg başladıktan sonra okuma ucunun bu süreçteki kopyasını kapat"""
+        if self._read_fd is not None:
+            os.close(self._read_fd)
+            self._read_fd = None
+    
+    def _put(self, chunk):
+        """Kuyruğa ekle (dolu ise decode yetişene kadar bekle = ağ geri basıncı)"""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(chunk, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _fetch(self):
+        """Ağ thread'i: yanıtı sınırlı kuyruğa oku"""
+        try:
+            for chunk in self._head:
+                if not self._put(chunk):
+                    return
+            self._head = []
+            
+            for chunk in self._chunks:
+                if not chunk:
+                    continue
+                self.bytes_read += len(chunk)
+                if not self._put(chunk):
+                    return
+        except Exception as e:
+            self.error = e
+        finally:
+            self._response.close()
+            self._put(None)
+    
+    def _feed(self):
+        """Besleme thread'i: kuyruktan ffmpeg'in pipe'ına yaz"""
+        try:
+            while True:
+                try:
+                    chunk = self._queue.get(timeout=0.5)
+                except queue.Empty:
+                    if self._stop.is_set():
+                        return
+                    continue
+                if chunk is None:
+                    return
+                
+                view = memoryview(chunk)
+                while view:
+                    written = os.write(self._write_fd, view)
+                    view = view[written:]
+        except BrokenPipeError:
+            pass  # ffmpeg ihtiyacı kadarını okudu (-t), kalanı indirilmez
+        except OSError as e:
+            self.error = e
+        finally:
+            self._stop.set()
+            os.close(self._write_fd)
+    
+    def close(self):
+        """Akışı durdur, thread'leri bekle, bağlantıyı kapat"""
+        self._stop.set()
+        self.release_reader()
+        for thread in self._threads:
+            thread.join(timeout=5)
+        if self._response is not None:
+            self._response.close()
+    
+    def __enter__(self):
+        return self.open()
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def __repr__(self):
+        return f"HTTPStreamSource({self.url})"
@@ -0,0 +1,327 @@
+"""
+VideoOtoFabrika - Alt Yazı Rasterizer Modülü
+Alt yazıları bir kez premultiplied RGBA numpy sprite'larına çizer,
+bellekte LRU (ve isteğe bağlı diskte) saklar ve karelere doğrudan blit eder.
+"""
+
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+import cv2
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont, ImageColor
+
+
+def blit_premultiplied(frame, rgb, inv_alpha, x, y):
+    """
+    Premultiplied sprite'ı RGB kareye yerinde uygula (sadece sprite alanı)
+    
+    out = rgb + frame * (255 - a) / 255
+    
+    Args:
+        frame: Yazılabilir RGB kare (H, W, 3) uint8
+        rgb: Premultiplied renk (h, w, 3) uint8
+        inv_alpha: 255 - alfa, 3 kanala kopyalanmış (h, w, 3) uint8
+        x: Sol üst köşe x (negatif olabilir)
+        y: Sol üst köşe y (negatif olabilir)
+    """
+    frame_h, frame_w = frame.shape[:2]
+    sprite_h, sprite_w = rgb.shape[:2]
+    
+    # Kare sınırlarına kırp
+    fx0, fy0 = max(x, 0), max(y, 0)
+    fx1, fy1 = min(x + sprite_w, frame_w), min(y + sprite_h, frame_h)
+    if fx0 >= fx1 or fy0 >= fy1:
+        return
+    
+    region = frame[fy0:fy1, fx0:fx1]
+    src_rgb = rgb[fy0 - y:fy1 - y, fx0 - x:fx1 - x]
+    src_inv = inv_alpha[fy0 - y:fy1 - y, fx0 - x:fx1 - x]
+    
+    # cv2 SIMD ile: region = region * inv / 255 + rgb (doyumlu)
+    cv2.multiply(region, src_inv, dst=region, scale=1 / 255.0)
+    cv2.add(region, src_rgb, dst=region)
+
+
+class Sprite:
+    def __init__(self, rgba):
+        """
+        Premultiplied RGBA sprite ve blit için hazır düzlemleri
+        
+        Args:
+            rgba: Premultiplied RGBA dizi (h, w, 4) uint8
+        """
+        self.rgba = rgba
+        self.rgb = np.ascontiguousarray(rgba[..., :3])
+        self.inv_alpha = np.ascontiguousarray(np.repeat(255 - rgba[..., 3:4], 3, axis=2))
+    
+    @property
+    def width(self):
+        """Sprite genişliği (piksel)"""
+        return self.rgba.shape[1]
+    
+    @property
+    def height(self):
+        """Sprite yüksekliği (piksel)"""
+        return self.rgba.shape[0]
+    
+    def blit(self, frame, x, y):
+        """Sprite'ı kareye (x, y) konumunda uygula"""
+        blit_premultiplied(frame, self.rgb, self.inv_alpha, x, y)
+
+
+def split_lines(text, max_chars_per_line=25):
+    """
+    Metni karakter sınırına göre satırlara böl (kayan alt yazı için)
+    
+    Args:
+        text: Metin
+        max_chars_per_line: Satır başına maksimum karakter
+    
+    Returns:
+        list: Satırlar
+    """
+    lines = []
+    current_line = ""
+    
+    for word in text.split():
+        test_line = current_line + (" " + word if current_line else word)
+        if len(test_line) <= max_chars_per_line:
+            current_line = test_line
+        else:
+            if current_line:
+                lines.append(current_line)
+            current_line = word
+    
+    if current_line:
+        lines.append(current_line)
+    
+    return lines
+
+class SubtitleRasterizer:
+    def __init__(self, max_items=256, cache_dir=None):
+        """
+        Alt yazı rasterizer'ını başlat
+        
+        Args:
+            max_items: Bellekte tutulacak maksimum sprite sayısı (LRU)
+            cache_dir: Disk önbellek klasörü (None = sadece bellek)
+        """
+        self.max_items = max_items
+        self.cache_dir = cache_dir
+        self._cache = OrderedDict()
+        self._fonts = {}
+        # Segment ve zamanlayıcı render'ları aynı rasterizer'ı thread'lerden kullanır
+        self._lock = threading.Lock()
+        
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+    
+    def _load_font(self, font, font_size):
+        """Font nesnesini yükle (yüklenenler tekrar kullanılır)"""
+        key = (font, font_size)
+        with self._lock:
+            if key not in self._fonts:
+                try:
+                    self._fonts[key] = ImageFont.truetype(font, font_size)
+                except Exception:
+                    print(f"⚠️ Font yüklenemedi: {font}, varsayılan font kullanılıyor")
+                    self._fonts[key] = ImageFont.load_default(font_size)
+            return self._fonts[key]
+    
+    def _wrap_text(self, draw, text, font, max_width, stroke_width):
+        """Metni verilen genişliğe sığacak şekilde satırlara böl (caption davranışı)"""
+        lines = []
+        for paragraph in text.split("\n"):
+            current_line = ""
+            for word in paragraph.split():
+                test_line = current_line + (" " + word if current_line else word)
+                if draw.textlength(test_line, font=font) + 2 * stroke_width <= max_width or not current_line:
+                    current_line = test_line
+                else:
+                    lines.append(current_line)
+                    current_line = word
+            lines.append(current_line)
+        return "\n".join(lines)
+    
+    def _rasterize(self, text, font, font_size, color, stroke_color, stroke_width, width, interline):
+        """Metni premultiplied RGBA numpy dizisine çiz"""
+        pil_font = self._load_font(font, font_size)
+        measure = ImageDraw.Draw(Image.new("L", (1, 1)))
+        
+        wrapped = self._wrap_text(measure, text, pil_font, width, stroke_width)
+        left, top, right, bottom = measure.multiline_textbbox(
+            (0, 0), wrapped, font=pil_font, spacing=interline,
+            align="center", stroke_width=stroke_width
+        )
+        height = max(int(bottom - top) + 2, 1)
+        origin = (width / 2, -top + 1)
+        
+        # Kontur ve dolgu maskeleri ayrı çizilir, sonra renklerle birleştirilir
+        stroke_mask = Image.new("L", (width, height), 0)
+        fill_mask = Image.new("L", (width, height), 0)
+        ImageDraw.Draw(stroke_mask).multiline_text(
+            origin, wrapped, font=pil_font, fill=255, anchor="ma", spacing=interline,
+            align="center", stroke_width=stroke_width, stroke_fill=255
+        )
+        # Aynı stroke_width ile çizilir (Pillow satır aralığı stroke'a bağlı), kontur 0 ile
+        ImageDraw.Draw(fill_mask).multiline_text(
+            origin, wrapped, font=pil_font, fill=255, anchor="ma", spacing=interline,
+            align="center", stroke_width=stroke_width, stroke_fill=0
+        )
+        
+        fill_a = np.asarray(fill_mask, dtype=np.float32)[..., None] / 255.0
+        stroke_a = np.asarray(stroke_mask, dtype=np.float32)[..., None] / 255.0
+        stroke_a = stroke_a * (1.0 - fill_a)
+        
+        fill_rgb = np.array(ImageColor.getrgb(color)[:3], dtype=np.float32)
+        stroke_rgb = np.array(ImageColor.getrgb(stroke_color)[:3], dtype=np.float32)
+        
+        sprite = np.empty((height, width, 4), dtype=np.uint8)
+        sprite[..., :3] = np.rint(fill_rgb * fill_a + stroke_rgb * stroke_a)
+        sprite[..., 3:] = np.rint((fill_a + stroke_a) * 255.0)
+        return sprite
+    
+    def _disk_path(self, key):
+        """Sprite anahtarının disk önbellek yolu"""
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.npy")
+    
+    def render(self, text, font, font_size, color, stroke_color="black", stroke_width=0,
+               width=1000, interline=10, cache=True):
+        """
+        Metin sprite'ını döndür (önbellekte varsa yeniden çizilmez)
+        
+        Büyük, tek kullanımlık sprite'lar (ör. senaryonun tamamını taşıyan kayan
+        şerit, ~50 MB) cache=False ile çizilmeli; yoksa LRU öğe sayısıyla
+        sınırlı olduğu için bellek ve disk sınırsız büyür.
+        
+        Args:
+            text: Metin (\\n ile satır ayrılabilir)
+            font: Font dosyası yolu veya adı
+            font_size: Font boyutu
+            color: Yazı rengi
+            stroke_color: Kontur rengi
+            stroke_width: Kontur kalınlığı
+            width: Sprite genişliği (metin bu genişlikte sarılır ve ortalanır)
+            interline: Satır arası boşluk
+            cache: Bellek ve disk önbelleği kullanılsın mı
+        
+        Returns:
+            Sprite: Premultiplied RGBA sprite (h, width)
+        """
+        if not cache:
+            return Sprite(self._rasterize(text, font, font_size, color, stroke_color,
+                                          stroke_width, width, interline))
+        
+        key = (text, font, font_size, color, stroke_color, stroke_width, width, interline)
+        
+        with self._lock:
+            sprite = self._cache.get(key)
+            if sprite is not None:
+                self._cache.move_to_end(key)
+                return sprite
+        
+        disk_path = self._disk_path(key) if self.cache_dir else None
+        rgba = None
+        if disk_path and os.path.exists(disk_path):
+            try:
+                rgba = np.load(disk_path)
+            except Exception:
+                rgba = None
+        
+        if rgba is None:
+            rgba = self._rasterize(text, font, font_size, color, stroke_color,
+                                   stroke_width, width, interline)
+            if disk_path:
+                try:
+                    # Geçici dosyaya yazılıp taşınır: aynı anda okuyan yarım dosya görmez
+                    temp_path = f"{disk_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                    with open(temp_path, "wb") as f:
+                        np.save(f, rgba)
+                    os.replace(temp_path, disk_path)
+                except Exception as e:
+                    print(f"⚠️ Alt yazı önbelleğe yazılamadı: {e}")
+        
+        sprite = Sprite(rgba)
+        with self._lock:
+            # Başka thread aynı anda çizdiyse onunki kullanılır
+            sprite = self._cache.setdefault(key, sprite)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_items:
+                self._cache.popitem(last=False)
+        
+        return sprite
+
+
+class ScrollingSubtitle:
+    def __init__(self, sprite, x, frame_height, start_y, end_y, scroll_duration):
+        """
+        Kayan alt yazı - metin şeridi bir kez çizilir, her karede sadece görünen dilim işlenir
+        
+        Args:
+            sprite: Metin şeridi (Sprite)
+            x: Şeridin kare içindeki x konumu
+            frame_height: Kare yüksekliği
+            start_y: Başlangıç y konumu
+            end_y: Bitiş y konumu
+            scroll_duration: start_y'den end_y'ye kayma süresi
+        """
+        strip_h, strip_w = sprite.height, sprite.width
+        
+        # Alt piksel interpolasyonu için üst/alt birer boş satırla doldurulmuş bitişik şeritler
+        self.rgb = np.zeros((strip_h + 2, strip_w, 3), dtype=np.uint8)
+        self.rgb[1:-1] = sprite.rgb
+        self.inv_alpha = np.full((strip_h + 2, strip_w, 3), 255, dtype=np.uint8)
+        self.inv_alpha[1:-1] = sprite.inv_alpha
+        
+        self.h = strip_h
+        self.x = x
+        self.frame_height = frame_height
+        self.start_y = start_y
+        self.end_y = end_y
+        self.scroll_duration = scroll_duration
+        
+        # Pencere boyutunda tekrar kullanılan tamponlar (şerit uzunluğundan bağımsız)
+        window = min(frame_height, strip_h) + 1
+        self._rgb_out = np.empty((window, strip_w, 3), dtype=np.uint8)
+        self._inv_out = np.empty((window, strip_w, 3), dtype=np.uint8)
+    
+    def position(self, t):
+        """t anında şeridin üst kenarının y konumu (float)"""
+        progress = t / self.scroll_duration if self.scroll_duration > 0 else 1
+        if progress > 1:
+            progress = 1
+        return self.start_y + (self.end_y - self.start_y) * progress
+    
+    def apply(self, frame, t):
+        """Görünen dilimi alt piksel kaydırmayla kareye blit et"""
+        if not frame.flags.writeable:
+            frame = frame.copy()
+        
+        y = self.position(t)
+        yi = int(np.floor(y))
+        frac = y - yi
+        
+        # Kare satırı r, dolgulu şeritte (r - yi) ile (r - yi + 1) arasına düşer
+        r0 = max(yi, 0)
+        r1 = min(self.frame_height, yi + self.h + 1)
+        n = r1 - r0
+        if n <= 0:
+            return frame
+        
+        upper = slice(r0 - yi, r1 - yi)          # ağırlık: frac
+        lower = slice(r0 - yi + 1, r1 - yi + 1)  # ağırlık: 1 - frac
+        
+        rgb = self._rgb_out[:n]
+        inv_alpha = self._inv_out[:n]
+        cv2.addWeighted(self.rgb[lower], 1 - frac, self.rgb[upper], frac, 0, dst=rgb)
+        cv2.addWeighted(self.inv_alpha[lower], 1 - frac, self.inv_alpha[upper], frac, 0, dst=inv_alpha)
+        
+        blit_premultiplied(frame, rgb, inv_alpha, self.x, r0)
+        return frame
+    
+    def __call__(self, get_frame, t):
+        """MoviePy clip.transform() ile kullanım için"""
+        return self.apply(get_frame(t), t)
@@ -6,205 +6,259 @@ Pexels'ten video indirir ve MoviePy ile ses ekler.
 import os
 import requests
 import re
+import json
+import time
+import hashlib
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
-from moviepy import VideoFileClip, AudioFileClip, TextClip, CompositeVideoClip, ColorClip
+from moviepy import VideoFileClip, AudioFileClip, ColorClip
 from template_manager import TemplateManager
+from zoom_effect import ZoomEffect
+from subtitle_renderer import SubtitleRasterizer, ScrollingSubtitle, split_lines
+from compositor import LayerCompositor, sprite_from_clip
+from footage_cache import FootageCache, duration_bucket
+from search_cache import SearchCache
+from footage_library import FootageLibrary, probe_video
+from footage_pool import FootagePool
+from pexels_client import PexelsClient, TokenBucket
+from stream_source import HTTPStreamSource, NotStreamable
+from encoding_profiles import get_profile, moviepy_kwargs
 import config
 
 load_dotenv()
 
 
-class VideoManager:
-    def __init__(self, template_name="default"):
-        """
-        Pexels API'yi yapılandır
-        
-        Args:
-            template_name: Kullanılacak şablon adı
-        """
-        self.api_key = os.getenv('PEXELS_API_KEY')
-        if not self.api_key:
-            raise ValueError("PEXELS_API_KEY bulunamadı! .env dosyasını kontrol edin.")
-        
-        self.headers = {
-            'Authorization': self.api_key
-        }
-        self.base_url = 'https://api.pexels.com/videos'
-        
-        # Şablon yöneticisi
-        self.template = TemplateManager(template_name)
-        self.template_settings = self.template.get_template_settings()
+def score_rendition(file, target_width=1080, target_height=1920, target_fps=30):
+    """
+    Pexels video_files öğesinin maliyet puanı (düşük = daha iyi)
     
-    def search_video(self, search_term, orientation='portrait'):
-        """
-        Pexels'te video ara - Birden fazla video döndür
-        
-        Args:
-            search_term: Arama terimi
-            orientation: Video yönü (portrait/landscape)
-            
-        Returns:
-            list: Video indirme URL'leri listesi (3-5 video)
-        """
-        try:
-            print(f"🔍 Pexels'te '{search_term}' arıyor...")
-            
-            params = {
-                'query': search_term,
-                'per_page': 15  # Daha fazla seçenek
-            }
-            
-            response = requests.get(
-                f'{self.base_url}/search',
-                headers=self.headers,
-                params=params,
-                timeout=10
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            print(f"📊 API Yanıtı: {len(data.get('videos', []))} video bulundu")
-            
-            if not data.get('videos'):
-                print(f"⚠️ '{search_term}' için video bulunamadı, 'nature' ile deneniyor...")
-                params['query'] = 'nature'
-                response = requests.get(
-                    f'{self.base_url}/search',
-                    headers=self.headers,
-                    params=params,
-                    timeout=10
-                )
-                data = response.json()
-            
-            # Birden fazla HD portrait video bul
-            video_urls = []
-            
-            for video in data['videos']:
-                if len(video_urls) >= 5:  # Maksimum 5 video
-                    break
-                    
-                for file in video['video_files']:
-                    # Portrait HD video ara
-                    if file.get('quality') == 'hd' and file.get('width') and file.get('height'):
-                        if orientation == 'portrait' and file['width'] < file['height'] and file['height'] >= 1080:
-                            video_urls.append(file['link'])
-                            print(f"✅ Video {len(video_urls)}: {file['width']}x{file['height']}")
-                            break
-            
-            # Yeterli HD portrait bulunamazsa SD portrait ekle
-            if len(video_urls) < 3:
-                for video in data['videos']:
-                    if len(video_urls) >= 5:
-                        break
-                        
-                    for file in video['video_files']:
-                        if file.get('width') and file.get('height'):
-                            if orientation == 'portrait' and file['width'] < file['height']:
-                                if file['link'] not in video_urls:
-                                    video_urls.append(file['link'])
-                                    print(f"✅ Video {len(video_urls)}: {file['width']}x{file['height']}")
-                                    break
-            
-            if not video_urls:
-                print("⚠️ Portrait video bulunamadı, landscape videolarla deneniyor...")
-                # Landscape videoları da kabul et
-                for video in data['videos']:
-                    if len(video_urls) >= 5:
-                        break
-                    for file in video['video_files']:
-                        if file.get('quality') in ['hd', 'sd']:
-                            if file['link'] not in video_urls:
-                                video_urls.append(file['link'])
-                                print(f"✅ Video {len(video_urls)}: {file.get('width', '?')}x{file.get('height', '?')}")
-                                break
-            
-            if not video_urls:
-                raise Exception("Uygun video bulunamadı!")
-            
-            print(f"✅ Toplam {len(video_urls)} farklı video bulundu")
-            return video_urls
-            
-        except Exception as e:
-            print(f"❌ Video arama hatası: {e}")
-            raise
+    Hedefi kaplayan en küçük çözünürlük, hedefe yakın en/boy oranı ve kare hızı
+    tercih edilir; büyütme gerektiren dosyalar en sona kalır, gereksiz 4K/60fps
+    pikselleri maliyet olarak sayılır.
     
-    def download_video(self, video_url, output_path="temp_video.mp4"):
+    Args:
+        file: {'width', 'height', 'fps', ...}
+        target_width: Hedef genişlik
+        target_height: Hedef yükseklik
+        target_fps: Hedef kare hızı
+    
+    Returns:
+        tuple: (büyütme gerekiyor mu, maliyet) - tuple karşılaştırmasıyla sıralanır
+    """
+    width, height = file['width'], file['height']
+    
+    # Kaplamak için gereken ölçek (>1 = büyütme, kalite kaybı)
+    scale = max(target_width / width, target_height / height)
+    needs_upscale = scale > 1.01
+    
+    # Decode edilen piksel / çıktı pikseli (kırpılan alan da maliyet)
+    pixel_cost = (width * height) / (target_width * target_height)
+    
+    # Hedeften yüksek kare hızı fazladan decode demek, düşük kare hızı takılma
+    fps = file.get('fps') or target_fps
+    fps_cost = fps / target_fps if fps >= target_fps * 0.9 else 1 + (target_fps - fps) / target_fps
+    
+    cost = pixel_cost * fps_cost
+    if needs_upscale:
+        cost = scale * 100  # Sadece büyütmeden kaçınılamıyorsa ve en az büyütülen
+    return needs_upscale, cost
+
+
+def pick_rendition(video_files, target_width=1080, target_height=1920, target_fps=30, portrait_only=True):
+    """
+    Bir videonun dosyaları arasından en düşük maliyetli olanı seç
+    
+    Args:
+        video_files: Pexels video_files listesi
+        target_width: Hedef genişlik
+        target_height: Hedef yükseklik
+        target_fps: Hedef kare hızı
+        portrait_only: Sadece dikey dosyalar
+    
+    Returns:
+        tuple: (dosya, puan) veya (None, None)
+    """
+    candidates = [
+        f for f in video_files
+        if f.get('width') and f.get('height') and f.get('link')
+        and (not portrait_only or f['width'] < f['height'])
+    ]
+    if not candidates:
+        return None, None
+    
+    scored = [(score_rendition(f, target_width, target_height, target_fps), f) for f in candidates]
+    score, best = min(scored, key=lambda item: item[0])
+    return best, score
+
+
+def duration_fit(video_duration, segment_duration):
+    """
+    Videonun planlanan parça süresine uygunluk cezası (0 = tam uyum)
+    
+    Kısa videolar döngüye gireceği için ağır, uzun videolar indirilen fazla
+    bayt nedeniyle hafif cezalandırılır.
+    
+    Args:
+        video_duration: Video süresi (saniye)
+        segment_duration: Planlanan parça süresi (saniye)
+    
+    Returns:
+        float: Ceza
+    """
+    if not segment_duration or not video_duration:
+        return 0.0
+    if video_duration < segment_duration:
+        return (segment_duration - video_duration) / segment_duration * 2
+    return min((video_duration - segment_duration) / segment_duration, 10) * 0.05
+
+
+# Çoğulu olmayan (veya Pexels'te çoğulu anlamsız) kelimeler
+UNCOUNTABLE_WORDS = {
+    "money", "cash", "gold", "research", "wildlife", "training", "success",
+    "business", "technology", "science", "space", "nature", "future", "football",
+}
+
+
+def inflect(term):
+    """
+    Terimin son kelimesinin tekil/çoğul karşılığı (basit İngilizce kuralları)
+    
+    Args:
+        term: Arama terimi ("luxury car", "sharks")
+    
+    Returns:
+        str: Diğer biçim ("luxury cars", "shark") veya değişmiyorsa None
+    """
+    words = term.split()
+    if not words:
+        return None
+    last = words[-1].lower()
+    
+    if len(last) <= 2 or last in UNCOUNTABLE_WORDS:
+        return None  # "ai" gibi kısaltmalar, "money" gibi sayılamayanlar
+    if last.endswith('ies') and len(last) > 4:
+        other = last[:-3] + 'y'
+    elif last.endswith(('ches', 'shes', 'xes', 'sses')):
+        other = last[:-2]
+    elif last.endswith('s') and not last.endswith(('ss', 'us', 'is')):
+        other = last[:-1]
+    elif last.endswith('y') and last[-2] not in 'aeiou':
+        other = last[:-1] + 'ies'
+    elif last.endswith(('ch', 'sh', 'x', 's')):
+        other = last + 'es'
+    else:
+        other = last + 's'
+    
+    return " ".join(words[:-1] + [other])
+
+
+def related_queries(search_term, synonyms=None):
+    """
+    Birlikte aranacak sorgular ve alaka cezaları (0 = asıl terim)
+    
+    Genel yedek terim burada değildir: konu dışı olduğu için sadece bu
+    sorgular yetmediğinde ayrıca aranır (VideoManager._search_related).
+    
+    Args:
+        search_term: Gemini'nin verdiği terim
+        synonyms: {terim: [eş anlamlılar]} (opsiyonel)
+    
+    Returns:
+        list: (sorgu, ceza) listesi - tekrarsız, asıl terim önce
+    """
+    term = " ".join(search_term.lower().split())
+    queries = [(term, 0.0)]
+    
+    variant = inflect(term)
+    if variant:
+        queries.append((variant, 0.05))
+    for synonym in (synonyms or {}).get(term, []):
+        queries.append((synonym.lower(), 0.2))
+    
+    seen = set()
+    unique = []
+    for query, penalty in queries:
+        if query not in seen:
+            seen.add(query)
+            unique.append((query, penalty))
+    return unique
+
+
+class _DownloadProgress:
+    def __init__(self, file_count):
         """
-        Videoyu indir
+        Eşzamanlı indirmeler için toplam ilerleme (thread-safe)
         
         Args:
-            video_url: Video URL'i
-            output_path: Kayıt yolu
-            
-        Returns:
-            str: İndirilen dosya yolu
+            file_count: İndirilecek dosya sayısı
         """
-        try:
-            print("⬇️ Video indiriliyor...")
-            
-            response = requests.get(video_url, stream=True, timeout=30)
-            response.raise_for_status()
-            
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-            
-            file_size = os.path.getsize(output_path) / (1024 * 1024)  # MB
-            print(f"✅ Video indirildi: {output_path} ({file_size:.2f} MB)")
-            return output_path
-            
-        except Exception as e:
-            print(f"❌ Video indirme hatası: {e}")
-            raise
+        self.file_count = file_count
+        self.total_bytes = 0
+        self.done_bytes = 0
+        self._lock = threading.Lock()
+        self._last_percent = -10
     
-    def download_multiple_videos(self, video_urls, base_name="temp_video"):
+    def add_total(self, size):
+        """Boyutu öğrenilen bir dosyayı toplama ekle (Content-Length)"""
+        with self._lock:
+            self.total_bytes += size
+            # Toplam büyüdükçe yüzde geriler, eşik ona göre yeniden ayarlanır
+            if self.total_bytes:
+                percent = int(self.done_bytes * 100 / self.total_bytes)
+                self._last_percent = percent - percent % 10
+    
+    def update(self, size):
+        """İndirilen bayt sayısını ekle, her %10'da bir yazdır"""
+        with self._lock:
+            self.done_bytes += size
+            if not self.total_bytes:
+                return
+            percent = int(self.done_bytes * 100 / self.total_bytes)
+            if percent >= self._last_percent + 10:
+                self._last_percent = percent - percent % 10
+                print(f"   ⬇️ %{min(percent, 100)} ({self.done_bytes / (1024 * 1024):.1f} / "
+                      f"{self.total_bytes / (1024 * 1024):.1f} MB, {self.file_count} dosya)")
+
+
+class VideoComposer:
+    def __init__(self, template_name="default"):
         """
-        Birden fazla videoyu indir
+        Ana video kurulumu (zaman çizelgesi, zoom, alt yazı, watermark)
+        
+        Sadece şablon ve config kullanır; ağ, Pexels veya veritabanı açmaz.
+        Parça render işçileri pipeline'ı bununla yeniden kurar.
         
         Args:
-            video_urls: Video URL'leri listesi
-            base_name: Dosya adı tabanı
-            
-        Returns:
-            list: İndirilen dosya yolları
+            template_name: Kullanılacak şablon adı
         """
-        downloaded_files = []
-        
-        for idx, url in enumerate(video_urls):
-            output_path = f"{base_name}_{idx+1}.mp4"
-            try:
-                print(f"⬇️ Video {idx+1}/{len(video_urls)} indiriliyor...")
-                
-                response = requests.get(url, stream=True, timeout=30)
-                response.raise_for_status()
-                
-                with open(output_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                
-                file_size = os.path.getsize(output_path) / (1024 * 1024)
-                print(f"✅ Video {idx+1} indirildi ({file_size:.2f} MB)")
-                downloaded_files.append(output_path)
-                
-            except Exception as e:
-                print(f"⚠️ Video {idx+1} indirilemedi: {e}")
-                continue
+        # Şablon yöneticisi
+        self.template = TemplateManager(template_name)
+        self.template_settings = self.template.get_template_settings()
         
-        return downloaded_files
+        # Alt yazı sprite önbelleği (aynı süreçteki tüm videolar paylaşır)
+        self.subtitle_rasterizer = SubtitleRasterizer(
+            max_items=getattr(config, 'SUBTITLE_CACHE_SIZE', 256),
+            cache_dir=getattr(config, 'SUBTITLE_CACHE_DIR', None)
+        )
     
     def create_word_by_word_subtitle(self, text, video_width, video_height, duration):
         """
         2 satırlık kelime kelime vurgulu alt yazı oluştur - Ekranın daha geniş alanını kullan
         
+        Her kelime grubu önbellekli bir sprite olarak çizilir (tekrarlanan
+        ifadeler ve yeniden render'lar tekrar rasterize edilmez).
+        
         Args:
             text: Alt yazı metni
             video_width: Video genişliği
             video_height: Video yüksekliği
             duration: Video süresi
-            
+        
         Returns:
-            list: Alt yazı clip'leri listesi
+            list: (başlangıç, bitiş, sprite, x, y) listesi
         """
         # Şablon ayarlarından font al
         selected_font = self.template_settings["fonts"]["main"]
@@ -218,11 +272,14 @@ class VideoManager:
         # Her kelime için süre hesapla
         time_per_word = duration / len(words)
         
-        subtitle_clips = []
+        subtitle_events = []
         
         # Her 4-6 kelimeyi 2 satırda göster
         words_per_group = 6
         
+        # Pozisyon: Ekranın ortasında ama biraz daha yukarıda
+        y_position = int(video_height * 0.38)  # %38'e çekildi (daha yukarı)
+        
         for i in range(0, len(words), words_per_group):
             group = words[i:i+words_per_group]
             
@@ -238,33 +295,28 @@ class VideoManager:
             group_duration = len(group) * time_per_word
             
             try:
-                # Şablon ayarlarıyla metin oluştur - DAHA BÜYÜK ALAN + PADDING
-                main_text = TextClip(
-                    text=group_text.upper(),
-                    font=selected_font,
-                    font_size=self.template_settings["text_size"],
-                    color=self.template_settings["colors"]["primary"],
+                # Şablon ayarlarıyla metin sprite'ı - DAHA BÜYÜK ALAN + PADDING
+                sprite = self.subtitle_rasterizer.render(
+                    group_text.upper(),
+                    selected_font,
+                    self.template_settings["text_size"],
+                    self.template_settings["colors"]["primary"],
                     stroke_color=self.template_settings["colors"]["background"],
                     stroke_width=self.template_settings["stroke_width"],
-                    method="caption",
-                    size=(video_width - 100, None),  # Geniş alan
-                    text_align="center",
+                    width=video_width - 100,  # Geniş alan
                     interline=10  # Satır arası boşluk ARTIRILDI (yazı kesilmesin)
                 )
                 
-                # Pozisyon: Ekranın ortasında ama biraz daha yukarıda
-                y_position = int(video_height * 0.38)  # %38'e çekildi (daha yukarı)
-                
-                main_text = main_text.with_start(start_time).with_duration(group_duration)
-                main_text = main_text.with_position(("center", y_position))
-                
-                subtitle_clips.append(main_text)
-                
+                x_position = (video_width - sprite.width) // 2
+                subtitle_events.append(
+                    (start_time, start_time + group_duration, sprite, x_position, y_position)
+                )
+            
             except Exception as e:
                 print(f"⚠️ Kelime grubu {i} için alt yazı oluşturulamadı: {e}")
                 continue
         
-        return subtitle_clips
+        return subtitle_events
     
     def create_background_overlay(self, video_width, video_height, duration):
         """
@@ -274,7 +326,7 @@ class VideoManager:
             video_width: Video genişliği
             video_height: Video yüksekliği
             duration: Video süresi
-            
+        
         Returns:
             list: Arka plan clip'leri
         """
@@ -304,7 +356,7 @@ class VideoManager:
             overlays.append(bottom_overlay)
             
             return overlays
-            
+        
         except Exception as e:
             print(f"⚠️ Arka plan overlay oluşturulamadı: {e}")
             return []
@@ -318,9 +370,9 @@ class VideoManager:
             video_width: Video genişliği
             video_height: Video yüksekliği
             duration: Video süresi
-            
+        
         Returns:
-            TextClip: Kayan alt yazı clip'i
+            ScrollingSubtitle: Kayan alt yazı (clip.transform ile uygulanır) veya None
         """
         # Font seçenekleri
         font_options = [
@@ -340,276 +392,1276 @@ class VideoManager:
             selected_font = "Arial"
         
         # Metni satırlara böl (her satır max 25 karakter - daha okunaklı)
-        words = text.split()
-        lines = []
-        current_line = ""
-        max_chars_per_line = 25  # Daha kısa satırlar
-        
-        for word in words:
-            test_line = current_line + (" " + word if current_line else word)
-            if len(test_line) <= max_chars_per_line:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word
-        
-        if current_line:
-            lines.append(current_line)
-        
+        lines = split_lines(text, max_chars_per_line=25)  # Daha kısa satırlar
         subtitle_text = "\n".join(lines)
         
         try:
-            # Alt yazı oluştur - DAHA BÜYÜK VE RENKLI
-            subtitle = TextClip(
-                text=subtitle_text,
-                font=selected_font,
-                font_size=56,  # Daha büyük (48'den 56'ya)
-                color="yellow",  # Sarı - daha dikkat çekici
+            # Metin şeridi bir kez çizilir - DAHA BÜYÜK VE RENKLI
+            # Şerit her senaryoda farklı ve çok büyük: önbelleğe alınmaz
+            sprite = self.subtitle_rasterizer.render(
+                subtitle_text,
+                selected_font,
+                56,  # Daha büyük (48'den 56'ya)
+                "yellow",  # Sarı - daha dikkat çekici
                 stroke_color="black",
                 stroke_width=4,  # Daha kalın kontur
-                method="caption",
-                size=(video_width - 60, None),
-                text_align="center"
+                width=video_width - 60,
+                interline=4,
+                cache=False
             )
             
             # Başlangıç ve bitiş pozisyonları (AŞAĞIDAN YUKARIYA)
             start_y = video_height  # Ekranın altından başla
-            end_y = -subtitle.h     # Ekranın üstünden çık
+            end_y = -sprite.height  # Ekranın üstünden çık
             
             # Hareket süresini uzat (daha yavaş kaydırma için)
             scroll_duration = duration * 1.8
             
-            # Hareket fonksiyonu
-            def scroll_position(t):
-                progress = t / scroll_duration
-                
-                if progress > 1:
-                    progress = 1
-                
-                current_y = start_y + (end_y - start_y) * progress
-                return ("center", current_y)
-            
-            # Pozisyonu zamanla değiştir
-            subtitle = subtitle.with_position(scroll_position)
-            subtitle = subtitle.with_duration(duration)
-            
-            return subtitle
-            
+            return ScrollingSubtitle(
+                sprite,
+                (video_width - sprite.width) // 2,
+                video_height,
+                start_y,
+                end_y,
+                scroll_duration
+            )
+        
         except Exception as e:
             print(f"⚠️ Kayan alt yazı oluşturulamadı: {e}")
             return None
     
-    def create_final_video(self, video_path, audio_path, output_path, subtitle_text=None, audio_speed=1.0):
+    def _fit_to_shorts(self, clip, target_width=1080, target_height=1920):
         """
-        Video ve sesi birleştir, alt yazı ekle (YouTube Shorts formatında)
+        Clip'i en-boy oranını koruyarak ölçekle ve ortadan kırp (YouTube Shorts 9:16)
         
         Args:
-            video_path: Video dosyası yolu
-            audio_path: Ses dosyası yolu
-            output_path: Çıktı dosyası yolu
-            subtitle_text: Alt yazı metni (opsiyonel)
-            audio_speed: Ses hızı çarpanı (Edge-TTS'de zaten uygulandı)
+            clip: VideoFileClip
+            target_width: Hedef genişlik
+            target_height: Hedef yükseklik
+        
+        Returns:
+            VideoClip: target_width x target_height boyutunda clip
         """
-        try:
-            print("🎬 Video ve ses birleştiriliyor...")
-            
-            # Video ve sesi yükle
-            video = VideoFileClip(video_path)
-            audio = AudioFileClip(audio_path)
+        current_width = clip.w
+        current_height = clip.h
+        
+        if current_width == target_width and current_height == target_height:
+            return clip
+        
+        # Video aspect ratio'sunu hesapla
+        video_aspect = current_width / current_height
+        target_aspect = target_width / target_height  # 9:16 = 0.5625
+        
+        if video_aspect > target_aspect:
+            # Video çok geniş, yüksekliği hedef yap ve genişliği kırp
+            new_height = target_height
+            new_width = int(current_width * (target_height / current_height))
+        else:
+            # Video çok dar veya uygun, genişliği hedef yap ve yüksekliği kırp
+            new_width = target_width
+            new_height = int(current_height * (target_width / current_width))
+        
+        # Resize
+        clip = clip.resized(width=new_width, height=new_height)
+        
+        # Merkezi kırp
+        return clip.cropped(
+            x_center=new_width / 2,
+            y_center=new_height / 2,
+            width=target_width,
+            height=target_height
+        )
+    
+    def _build_timeline(self, sources, duration, target_width=1080, target_height=1920):
+        """
+        Kaynak clip'lerden tek bir zaman çizelgesi kur (ara dosya yazmadan)
+        
+        Giriş/çıkış noktası verilmeyen clip'ler toplam süreyi eşit paylaşır.
+        Kısa kalan clip'ler döngüye alınır.
+        
+        Args:
+            sources: (path, başlangıç, bitiş) listesi
+            duration: Hedef toplam süre (saniye)
+            target_width: Hedef genişlik
+            target_height: Hedef yükseklik
+        
+        Returns:
+            tuple: (birleşik video clip'i, kapatılacak kaynak clip'ler listesi)
+        """
+        from moviepy import concatenate_videoclips
+        
+        duration_per_video = duration / len(sources)
+        
+        source_clips = []
+        clips = []
+        
+        for path, start, end in sources:
+            clip = VideoFileClip(path)
+            source_clips.append(clip)
             
-            audio_duration = audio.duration
-            video_duration = video.duration
+            # Giriş/çıkış noktalarını uygula
+            start = start or 0
+            if start >= clip.duration:
+                start = 0
+            wanted = (end - start) if end is not None else duration_per_video
+            end = min(start + wanted, clip.duration)
             
-            print(f"📊 Ses süresi: {audio_duration:.2f}s, Video süresi: {video_duration:.2f}s")
+            # ÖNCE BOYUTU AYARLA (tüm videolar aynı boyutta olmalı)
+            clip = self._fit_to_shorts(clip, target_width, target_height)
+            clip = clip.subclipped(start, end)
             
-            # YouTube Shorts için süre kontrolü (max 60 saniye)
-            if audio_duration > 60:
-                print("⚠️ Video 60 saniyeden uzun, YouTube Shorts için kısaltılıyor...")
-                audio = audio.subclipped(0, 60)
-                audio_duration = 60
+            # Kısaysa döngüye al
+            if clip.duration < wanted:
+                loops = int(wanted / clip.duration) + 1
+                clip = concatenate_videoclips([clip] * loops)
+                clip = clip.subclipped(0, wanted)
             
-            # Video süresini ses süresine göre ayarla
-            if video_duration < audio_duration:
-                # Video kısaysa döngüye al
-                print("🔄 Video döngüye alınıyor...")
-                loops_needed = int(audio_duration / video_duration) + 1
-                # Manuel olarak videoyu döngüye al
-                clips = [video] * loops_needed
-                from moviepy import concatenate_videoclips
-                video = concatenate_videoclips(clips)
+            clips.append(clip)
+        
+        if len(clips) == 1:
+            timeline = clips[0]
+        else:
+            # Ard arda birleştir (tek encode - ara dosya yok)
+            timeline = concatenate_videoclips(clips, method="chain")
+        
+        return timeline, source_clips
+    
+    def _compose_main_video(self, sources, audio_duration, subtitle_text=None):
+        """
+        Ana videoyu kur: zaman çizelgesi, zoom, alt yazı ve watermark (ses hariç)
+        
+        Args:
+            sources: (path, başlangıç, bitiş) listesi
+            audio_duration: Ses süresi (saniye)
+            subtitle_text: Alt yazı metni (opsiyonel)
+        
+        Returns:
+            tuple: (sessiz video clip'i, kapatılacak kaynak clip'ler listesi)
+        """
+        # YouTube Shorts için boyut (9:16 - Portrait)
+        target_width = 1080
+        target_height = 1920
+        
+        if len(sources) > 1:
+            print(f"✨ {len(sources)} farklı video tek zaman çizelgesinde birleştiriliyor...")
+        
+        video, source_clips = self._build_timeline(
+            sources, audio_duration, target_width, target_height
+        )
+        video_duration = video.duration
+        
+        print(f"📊 Ses süresi: {audio_duration:.2f}s, Video süresi: {video_duration:.2f}s")
+        
+        # Video süresini ses süresine göre ayarla
+        if video_duration < audio_duration:
+            # Video kısaysa döngüye al
+            print("🔄 Video döngüye alınıyor...")
+            loops_needed = int(audio_duration / video_duration) + 1
+            # Manuel olarak videoyu döngüye al
+            clips = [video] * loops_needed
+            from moviepy import concatenate_videoclips
+            video = concatenate_videoclips(clips)
+        
+        # Videoyu ses süresine göre kes
+        video = video.subclipped(0, audio_duration)
+        
+        print(f"✅ Video boyutu ayarlandı: {target_width}x{target_height} (YouTube Shorts)")
+        
+        # Zoom efekti ekle (config'den kontrol et)
+        if config.ENABLE_ZOOM_EFFECT:
+            print("🎬 Zoom efekti ekleniyor...")
+            zoom_effect = ZoomEffect(
+                audio_duration,
+                zoom_amount=config.ZOOM_AMOUNT,
+                direction=getattr(config, 'ZOOM_DIRECTION', 'center'),
+                easing=getattr(config, 'ZOOM_EASING', 'linear')
+            )
             
-            # Videoyu ses süresine göre kes
-            video = video.subclipped(0, audio_duration)
+            try:
+                video = video.transform(zoom_effect)
+                print("✅ Zoom efekti eklendi")
+            except Exception as e:
+                print(f"⚠️ Zoom efekti eklenemedi: {e}, normal video kullanılıyor")
+        else:
+            print("ℹ️ Zoom efekti kapalı (config.py)")
+        
+        # Alt yazı ekle (kelime kelime vurgulu - Şablon tarzı)
+        if subtitle_text:
+            print(f"📝 Alt yazı ekleniyor (Şablon: {self.template_settings['name']})...")
             
-            # YouTube Shorts için boyut kontrolü ve düzenleme (9:16 - Portrait)
-            target_width = 1080
-            target_height = 1920
+            # Katmanlar eklenme sırasıyla üst üste biner; sadece kendi alanları işlenir
+            compositor = LayerCompositor()
             
-            current_width = video.w
-            current_height = video.h
+            # Arka plan overlay'leri KALDIRILDI (siyah filigran sorunu)
+            # overlays = self.create_background_overlay(video.w, video.h, audio_duration)
+            overlays = []  # Boş liste
+            for overlay in overlays:
+                compositor.add_static(*sprite_from_clip(overlay, video.w, video.h))
             
-            print(f"📐 Mevcut boyut: {current_width}x{current_height}")
+            # Alt yazı tipi config'den al
+            subtitle_type = config.SUBTITLE_TYPE if hasattr(config, 'SUBTITLE_TYPE') else "word_by_word"
+            subtitle_added = False
             
-            # Eğer video zaten portrait değilse veya boyut uygun değilse düzenle
-            if current_width != target_width or current_height != target_height:
-                print(f"📐 YouTube Shorts formatına dönüştürülüyor: {target_width}x{target_height}")
-                
-                # Video aspect ratio'sunu hesapla
-                video_aspect = current_width / current_height
-                target_aspect = target_width / target_height  # 9:16 = 0.5625
-                
-                if video_aspect > target_aspect:
-                    # Video çok geniş, yüksekliği hedef yap ve genişliği kırp
-                    new_height = target_height
-                    new_width = int(current_width * (target_height / current_height))
-                else:
-                    # Video çok dar veya uygun, genişliği hedef yap ve yüksekliği kırp
-                    new_width = target_width
-                    new_height = int(current_height * (target_width / current_width))
-                
-                # Resize
-                video = video.resized(width=new_width, height=new_height)
-                
-                # Merkezi kırp
-                x_center = new_width / 2
-                y_center = new_height / 2
-                
-                video = video.cropped(
-                    x_center=x_center,
-                    y_center=y_center,
-                    width=target_width,
-                    height=target_height
+            if subtitle_type == "scrolling":
+                # KAYAN ALT YAZI (VİRAL!)
+                print("📝 Alt yazı ekleniyor (Aşağıdan yukarıya kayan - VİRAL!)...")
+                scrolling_subtitle = self.create_scrolling_subtitle(
+                    subtitle_text,
+                    video.w,
+                    video.h,
+                    audio_duration
                 )
-                
-                print(f"✅ Video boyutu ayarlandı: {target_width}x{target_height} (YouTube Shorts)")
-
-            
-            # Zoom efekti ekle (config'den kontrol et)
-            if config.ENABLE_ZOOM_EFFECT:
-                print("🎬 Zoom efekti ekleniyor...")
-                def zoom_effect(get_frame, t):
-                    """Yavaş zoom-in efekti"""
-                    frame = get_frame(t)
-                    # Zoom faktörü: config'den al
-                    zoom_factor = 1.0 + (t / audio_duration) * config.ZOOM_AMOUNT
-                    
-                    h, w = frame.shape[:2]
-                    new_h, new_w = int(h * zoom_factor), int(w * zoom_factor)
-                    
-                    # Merkezi kırp
-                    y1 = (new_h - h) // 2
-                    x1 = (new_w - w) // 2
-                    
-                    # Resize ve crop
-                    import cv2
-                    resized = cv2.resize(frame, (new_w, new_h))
-                    cropped = resized[y1:y1+h, x1:x1+w]
-                    
-                    return cropped
-                
-                try:
-                    video = video.transform(zoom_effect)
-                    print("✅ Zoom efekti eklendi")
-                except Exception as e:
-                    print(f"⚠️ Zoom efekti eklenemedi: {e}, normal video kullanılıyor")
+                if scrolling_subtitle:
+                    compositor.add_dynamic(scrolling_subtitle)
+                    subtitle_added = True
             else:
-                print("ℹ️ Zoom efekti kapalı (config.py)")
-            
-            # Sesi videoya ekle
-            video_with_audio = video.with_audio(audio)
-            
-            # Alt yazı ekle (kelime kelime vurgulu - Şablon tarzı)
-            if subtitle_text:
+                # KELİME KELİME ALT YAZI (STATİK) - her grup sadece kendi süresinde işlenir
                 print(f"📝 Alt yazı ekleniyor (Şablon: {self.template_settings['name']})...")
-                
-                # Arka plan overlay'leri KALDIRILDI (siyah filigran sorunu)
-                # overlays = self.create_background_overlay(video.w, video.h, audio_duration)
-                overlays = []  # Boş liste
-                
-                # Alt yazı tipi config'den al
-                subtitle_type = config.SUBTITLE_TYPE if hasattr(config, 'SUBTITLE_TYPE') else "word_by_word"
-                
-                if subtitle_type == "scrolling":
-                    # KAYAN ALT YAZI (VİRAL!)
-                    print("📝 Alt yazı ekleniyor (Aşağıdan yukarıya kayan - VİRAL!)...")
-                    scrolling_subtitle = self.create_scrolling_subtitle(
-                        subtitle_text,
-                        video.w,
-                        video.h,
-                        audio_duration
-                    )
-                    subtitle_clips = [scrolling_subtitle] if scrolling_subtitle else []
-                else:
-                    # KELİME KELİME ALT YAZI (STATİK)
-                    print(f"📝 Alt yazı ekleniyor (Şablon: {self.template_settings['name']})...")
-                    subtitle_clips = self.create_word_by_word_subtitle(
-                        subtitle_text,
-                        video.w,
-                        video.h,
-                        audio_duration
-                    )
-                
-                # Watermark ekle (config'den kontrol et)
-                watermark = None
-                if config.SHOW_WATERMARK:
-                    watermark = self.template.add_watermark(video.w, video.h, audio_duration)
-                
-                if subtitle_clips:
-                    # Video + overlay'ler + alt yazılar + watermark
-                    all_clips = [video_with_audio] + overlays + subtitle_clips
-                    if watermark:
-                        all_clips.append(watermark)
-                    
-                    main_video = CompositeVideoClip(all_clips)
-                    print(f"✅ {len(subtitle_clips)} kelime grubu alt yazı eklendi")
-                else:
-                    print("⚠️ Alt yazı oluşturulamadı, alt yazısız devam ediliyor...")
-                    main_video = video_with_audio
-            else:
-                main_video = video_with_audio
-            
-            # Intro ve Outro ekle
-            intro = self.template.create_intro(video.w, video.h)
-            outro = self.template.create_outro(video.w, video.h)
-            
-            clips_to_concat = []
-            
-            if intro:
-                clips_to_concat.append(intro)
-                print("✅ Intro eklendi")
-            
-            clips_to_concat.append(main_video)
-            
-            if outro:
-                clips_to_concat.append(outro)
-                print("✅ Outro eklendi")
+                subtitle_events = self.create_word_by_word_subtitle(
+                    subtitle_text,
+                    video.w,
+                    video.h,
+                    audio_duration
+                )
+                for start, end, sprite, x, y in subtitle_events:
+                    compositor.add_timed(sprite, x, y, start, end)
+                if subtitle_events:
+                    print(f"✅ {len(subtitle_events)} kelime grubu alt yazı eklendi")
+                    subtitle_added = True
             
-            # Tüm parçaları birleştir
-            if len(clips_to_concat) > 1:
-                from moviepy import concatenate_videoclips
-                final_video = concatenate_videoclips(clips_to_concat)
-            else:
-                final_video = main_video
+            if not subtitle_added:
+                print("⚠️ Alt yazı oluşturulamadı, alt yazısız devam ediliyor...")
             
-            # Çıktıyı kaydet
-            print(f"💾 Final video kaydediliyor: {output_path}")
-            final_video.write_videofile(
-                output_path,
-                codec='libx264',
-                audio_codec='aac',
-                fps=30,
-                preset='medium',
-                threads=4
-            )
+            # Watermark ekle (config'den kontrol et) - statik, bir kez ön-birleştirilir
+            if config.SHOW_WATERMARK:
+                watermark = self.template.add_watermark(video.w, video.h, audio_duration)
+                if watermark:
+                    compositor.add_static(*sprite_from_clip(watermark, video.w, video.h))
+                    watermark.close()
             
-            # Kaynakları temizle
-            video.close()
-            audio.close()
-            final_video.close()
+            if len(compositor):
+                video = video.transform(compositor)
+        
+        return video, source_clips
+
+
+def compose_main_video(template_name, sources, audio_duration, subtitle_text=None):
+    """
+    Ana videoyu VideoManager kurmadan oluştur (parça render işçileri için)
+    
+    Args:
+        template_name: Şablon adı
+        sources: (path, başlangıç, bitiş) listesi
+        audio_duration: Ses süresi (saniye)
+        subtitle_text: Alt yazı metni (opsiyonel)
+    
+    Returns:
+        tuple: (sessiz video clip'i, kapatılacak kaynak clip'ler listesi)
+    """
+    return VideoComposer(template_name)._compose_main_video(sources, audio_duration, subtitle_text)
+
+
+class VideoManager(VideoComposer):
+    # Bir arama için kullanılacak maksimum video sayısı
+    MAX_VIDEOS = 5
+    
+    def __init__(self, template_name="default"):
+        """
+        Pexels API'yi yapılandır
+        
+        Args:
+            template_name: Kullanılacak şablon adı
+        """
+        super().__init__(template_name)
+        
+        # Yerel lisanslı klip kütüphanesi (Pexels'ten önce aranır). Klasör ilk
+        # aramada taranır; arama yapmayan süreçler (ör. parça render işçileri) taramaz
+        self.footage_library = None
+        self._library_indexed = False
+        self._library_lock = threading.Lock()
+        library_dir = getattr(config, 'FOOTAGE_LIBRARY_DIR', None)
+        if library_dir and os.path.isdir(library_dir):
+            self.footage_library = FootageLibrary(library_dir, db_path=config.FOOTAGE_LIBRARY_DB)
+        
+        # Yerel kütüphane varsa Pexels anahtarı olmadan da çalışılabilir (ağsız render)
+        self.api_key = os.getenv('PEXELS_API_KEY')
+        if not self.api_key:
+            if self.footage_library is None:
+                raise ValueError("PEXELS_API_KEY bulunamadı! .env dosyasını kontrol edin.")
+            print("ℹ️ PEXELS_API_KEY yok, sadece yerel kütüphane kullanılacak")
+        
+        # Tüm istekler tek bağlantı havuzunu paylaşır (eşzamanlı indirmeler dahil)
+        self.download_workers = getattr(config, 'DOWNLOAD_WORKERS', 5)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(self.download_workers, 1))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Pexels API istekleri süreçler arası paylaşılan kovadan hak alır (429 yerine sıra)
+        self.pexels = PexelsClient(
+            self.api_key,
+            session=self.session,
+            bucket=TokenBucket(
+                db_path=getattr(config, 'PEXELS_RATE_DB', "cache/pexels_rate.sqlite"),
+                capacity=getattr(config, 'PEXELS_RATE_BURST', 20),
+                per_hour=getattr(config, 'PEXELS_RATE_PER_HOUR', 200)
+            ),
+            max_wait=getattr(config, 'PEXELS_MAX_WAIT', 600)
+        )
+        
+        # Pexels arama yanıtları önbelleği (aynı terimler gün boyu tekrar aranıyor)
+        self.search_cache = None
+        self.search_cache_only = getattr(config, 'SEARCH_CACHE_ONLY', False)
+        self._revalidating = set()
+        self._revalidating_lock = threading.Lock()
+        if getattr(config, 'SEARCH_CACHE_ENABLED', False):
+            self.search_cache = SearchCache(
+                db_path=config.SEARCH_CACHE_PATH,
+                ttl=config.SEARCH_CACHE_TTL,
+                stale_ttl=config.SEARCH_CACHE_STALE_TTL
+            )
+        
+        # Normalize edilmiş stok video önbelleği (1080x1920 / 30fps mezzanine)
+        self.footage_cache = None
+        if getattr(config, 'FOOTAGE_CACHE_ENABLED', False):
+            self.footage_cache = FootageCache(
+                cache_dir=config.FOOTAGE_CACHE_DIR,
+                max_gb=config.FOOTAGE_CACHE_MAX_GB
+            )
+        
+        # prewarm.py ile doldurulan terim başına klip havuzları
+        self.footage_pool = None
+        if self.footage_cache:
+            self.footage_pool = FootagePool(getattr(config, 'FOOTAGE_POOL_DB', "cache/footage_pool.sqlite"))
+    
+    def _fetch_search(self, params):
+        """Pexels /videos/search isteği (önbelleksiz, hız sınırına uyarak)"""
+        return self.pexels.search_videos(params)
+    
+    def _start_revalidation(self, key):
+        """Anahtar zaten yenilenmiyorsa yenileniyor olarak işaretle (aramalar ayrı thread'lerde)"""
+        with self._revalidating_lock:
+            if key in self._revalidating:
+                return False
+            self._revalidating.add(key)
+            return True
+    
+    def _revalidate_search(self, key, params):
+        """Bayat kaydı arka planda yenile (hata olursa bayat kayıt kalır)"""
+        try:
+            self.search_cache.set(key, self._fetch_search(params))
+        except Exception as e:
+            print(f"⚠️ Arama önbelleği yenilenemedi ({params['query']}): {e}")
+        finally:
+            with self._revalidating_lock:
+                self._revalidating.discard(key)
+    
+    def _search_api(self, query, per_page=15, page=1, orientation=None):
+        """
+        Pexels'te ara - önbellekte taze kayıt varsa API çağrılmaz
+        
+        Bayat kayıt hemen döndürülür ve arka planda yenilenir.
+        
+        Args:
+            query: Arama terimi
+            per_page: Sayfa başına sonuç
+            page: Sayfa numarası
+            orientation: Pexels orientation filtresi (None = filtresiz)
+        
+        Returns:
+            dict: Pexels JSON yanıtı
+        """
+        params = {'query': query, 'per_page': per_page, 'page': page}
+        if orientation:
+            params['orientation'] = orientation
+        
+        if not self.search_cache:
+            return self._fetch_search(params)
+        
+        key = SearchCache.make_key(query, orientation, per_page, page)
+        data, fresh = self.search_cache.get(key)
+        
+        if data is not None:
+            if fresh:
+                print(f"⚡ Arama önbellekte: '{query}'")
+            elif not self.search_cache_only and self._start_revalidation(key):
+                print(f"⚡ Arama önbellekte (bayat, arka planda yenileniyor): '{query}'")
+                threading.Thread(target=self._revalidate_search, args=(key, params), daemon=True).start()
+            return data
+        
+        if self.search_cache_only:
+            raise Exception(f"'{query}' arama önbelleğinde yok (SEARCH_CACHE_ONLY açık)")
+        
+        data = self._fetch_search(params)
+        self.search_cache.set(key, data)
+        return data
+    
+    def _rank_videos(self, videos, target_width, target_height, segment_duration=None, portrait_only=True,
+                     relevance=None):
+        """
+        Videoları seçilen dosyanın maliyeti, süre uyumu ve alakaya göre sırala
+        
+        Args:
+            videos: Pexels videos listesi
+            target_width: Hedef genişlik
+            target_height: Hedef yükseklik
+            segment_duration: Planlanan parça süresi (None = süreye bakılmaz)
+            portrait_only: Sadece dikey dosyalar
+            relevance: Video başına (alaka katmanı, alaka cezası) listesi (None = hepsi eşit);
+                katman 0 = konuyla ilgili sorgular, 1 = genel yedek terim
+        
+        Returns:
+            list: (video, dosya) listesi - en iyi önce
+        """
+        ranked = []
+        for order, video in enumerate(videos):
+            file, score = pick_rendition(
+                video.get('video_files', []), target_width, target_height, portrait_only=portrait_only
+            )
+            if file is None:
+                continue
+            needs_upscale, cost = score
+            penalty = duration_fit(video.get('duration'), segment_duration)
+            tier = 0
+            if relevance:
+                tier, query_penalty = relevance[order]
+                penalty += query_penalty
+            # Konu dışı (yedek terim) videolar her zaman sona; katman içinde büyütme
+            # gerektirenler sona; sonra alaka + süre uyumu + dosya maliyeti; eşitlikte Pexels sırası
+            ranked.append(((tier, needs_upscale, penalty + cost * 0.1, order), video, file))
+        
+        ranked.sort(key=lambda item: item[0])
+        return [(video, file) for _, video, file in ranked]
+    
+    def _index_library(self):
+        """Yerel kütüphaneyi bu nesnede bir kez tara (hata verirse mevcut indeksle devam)"""
+        with self._library_lock:
+            if self._library_indexed:
+                return
+            self._library_indexed = True
+            try:
+                updated = self.footage_library.index()
+                print(f"📚 Yerel kütüphane: {len(self.footage_library)} klip ({updated} yeni/güncellenen)")
+            except Exception as e:
+                print(f"⚠️ Yerel kütüphane taranamadı, mevcut indeks kullanılıyor: {e}")
+    
+    def _search_library(self, search_term, target_width, target_height, segment_duration=None):
+        """
+        Yerel kütüphanede ara, alaka ve uyuma göre sırala
+        
+        Args:
+            search_term: Arama terimi
+            target_width: Hedef genişlik
+            target_height: Hedef yükseklik
+            segment_duration: Planlanan parça süresi (opsiyonel)
+        
+        Returns:
+            list: Yerel dosya yolları (en iyi önce)
+        """
+        if self.footage_library is None:
+            return []
+        self._index_library()
+        
+        ranked = []
+        for clip in self.footage_library.search(search_term):
+            needs_upscale, cost = score_rendition(clip, target_width, target_height)
+            # bm25 negatif: daha küçük = daha alakalı; uyum cezaları üstüne eklenir
+            score = clip['relevance'] + duration_fit(clip['duration'], segment_duration) + cost * 0.1
+            ranked.append(((needs_upscale, score), clip['path']))
+        
+        ranked.sort(key=lambda item: item[0])
+        return [path for _, path in ranked]
+    
+    def _search_related(self, search_term, wanted=None):
+        """
+        Terimi, tekil/çoğul biçimini ve eş anlamlılarını eşzamanlı ara
+        
+        Toplam bekleme tek bir istek kadardır. Sonuçlar Pexels video id'sine
+        göre tekilleştirilir; bir video birden fazla sorguda çıkarsa en alakalı
+        sorgunun cezası kalır. Genel yedek terim (SEARCH_FALLBACK_TERM) sadece
+        bu sorgular `wanted` videodan azını bulursa aranır ve sonuçları her
+        zaman konuyla ilgili videoların arkasında kalır.
+        
+        Args:
+            search_term: Arama terimi
+            wanted: İstenen video sayısı (None = MAX_VIDEOS)
+        
+        Returns:
+            tuple: (videos listesi, video başına (alaka katmanı, alaka cezası) listesi)
+        """
+        wanted = wanted or self.MAX_VIDEOS
+        queries = related_queries(search_term, synonyms=getattr(config, 'SEARCH_SYNONYMS', None))
+        
+        def search(query):
+            try:
+                return self._search_api(query, per_page=15)
+            except Exception as e:
+                print(f"⚠️ '{query}' araması başarısız: {e}")
+                return None
+        
+        with ThreadPoolExecutor(max_workers=len(queries)) as pool:
+            responses = list(pool.map(search, [query for query, _ in queries]))
+        
+        best = {}
+        
+        def merge(query, tier, query_penalty, data):
+            videos = data.get('videos', [])
+            print(f"📊 '{query}': {len(videos)} video")
+            for position, video in enumerate(videos):
+                # Pexels sırası da alaka sinyali: ilk sonuçlar biraz öne
+                relevance = (tier, query_penalty + position * 0.01)
+                key = video.get('id') or video.get('url') or id(video)
+                if key not in best or relevance < best[key][1]:
+                    best[key] = (video, relevance)
+        
+        for (query, query_penalty), data in zip(queries, responses):
+            if data is not None:
+                merge(query, 0, query_penalty, data)
+        
+        fallback = getattr(config, 'SEARCH_FALLBACK_TERM', 'nature')
+        fallback = fallback.lower() if fallback else None
+        if len(best) < wanted and fallback and fallback not in dict(queries):
+            print(f"⚠️ '{search_term}' için {len(best)} video, '{fallback}' ile tamamlanıyor...")
+            data = search(fallback)
+            if data is not None:
+                merge(fallback, 1, 0.0, data)
+                responses.append(data)
+        
+        if all(data is None for data in responses):
+            raise Exception(f"'{search_term}' için hiçbir arama yapılamadı")
+        
+        merged = list(best.values())
+        return [video for video, _ in merged], [relevance for _, relevance in merged]
+    
+    def search_video(self, search_term, orientation='portrait', segment_duration=None):
+        """
+        Pexels'te video ara - Birden fazla video döndür
+        
+        Args:
+            search_term: Arama terimi
+            orientation: Video yönü (portrait/landscape)
+            segment_duration: Her videonun kullanılacağı planlanan süre (saniye, opsiyonel)
+        
+        Returns:
+            list: Video indirme URL'leri listesi (3-5 video)
+        """
+        try:
+            if orientation == 'portrait':
+                target_width, target_height = 1080, 1920
+            else:
+                target_width, target_height = 1920, 1080
             
-            print(f"✅ Video başarıyla oluşturuldu: {output_path}")
+            # Önceden ısıtılmış havuz: sıradaki klipler, her videoda farklı
+            if self.footage_pool:
+                pooled = self.footage_pool.take(search_term, self.MAX_VIDEOS)
+                if pooled:
+                    print(f"🔥 Havuzdan {len(pooled)} klip alındı: '{search_term}'")
+                    return pooled
+            
+            # Sonra yerel kütüphane (ağ ve indirme yok)
+            local_paths = self._search_library(search_term, target_width, target_height, segment_duration)
+            min_local = getattr(config, 'FOOTAGE_LIBRARY_MIN_RESULTS', 3)
+            if local_paths and (len(local_paths) >= min_local or not self.api_key):
+                local_paths = local_paths[:self.MAX_VIDEOS]
+                print(f"📚 Yerel kütüphaneden {len(local_paths)} klip bulundu: '{search_term}'")
+                return local_paths
+            
+            if not self.api_key:
+                raise Exception(f"'{search_term}' yerel kütüphanede yok ve PEXELS_API_KEY tanımlı değil")
+            
+            print(f"🔍 Pexels'te '{search_term}' arıyor...")
+            
+            # İlgili sorgular tek seferde, eşzamanlı aranır (genel terim sadece yetmezse)
+            videos, relevance = self._search_related(search_term)
+            
+            # Her video için en düşük maliyetli dosyayı seç, videoları alaka ve parça süresine uyuma göre sırala
+            candidates = self._rank_videos(
+                videos, target_width, target_height, segment_duration,
+                portrait_only=(orientation == 'portrait'), relevance=relevance
+            )
+            
+            if not candidates and orientation == 'portrait':
+                print("⚠️ Portrait video bulunamadı, landscape videolarla deneniyor...")
+                # Landscape videoları da kabul et (kırpılacak)
+                candidates = self._rank_videos(
+                    videos, target_width, target_height, segment_duration,
+                    portrait_only=False, relevance=relevance
+                )
+            
+            # Yerel sonuçlar yetersizse önce onlar, kalan yer Pexels ile doldurulur
+            video_urls = list(local_paths)
+            for video, file in candidates[:self.MAX_VIDEOS - len(video_urls)]:
+                video_urls.append(file['link'])
+                print(f"✅ Video {len(video_urls)}: {file['width']}x{file['height']} "
+                      f"@{file.get('fps') or '?'}fps, {video.get('duration', '?')}s")
+            
+            if not video_urls:
+                raise Exception("Uygun video bulunamadı!")
+            
+            print(f"✅ Toplam {len(video_urls)} farklı video bulundu")
+            return video_urls
+        
+        except Exception as e:
+            print(f"❌ Video arama hatası: {e}")
+            raise
+    
+    def _ingest_download(self, video_url, downloaded_path, duration=None):
+        """
+        İndirilen videoyu mezzanine önbelleğine al (önbellek kapalıysa olduğu gibi döndür)
+        
+        Args:
+            video_url: Kaynak URL
+            downloaded_path: İndirilen ham dosya
+            duration: Kısmi indirmede alınan süre (None = tüm dosya)
+        
+        Returns:
+            str: Render'da kullanılacak dosya yolu
+        """
+        if not self.footage_cache:
+            return downloaded_path
+        
+        try:
+            mezzanine_path = self.footage_cache.ingest(downloaded_path, video_url, duration)
+            os.remove(downloaded_path)
+            print(f"📦 Önbelleğe alındı: {os.path.basename(mezzanine_path)}")
+            return mezzanine_path
+        except Exception as e:
+            print(f"⚠️ Önbelleğe alınamadı ({e}), ham video kullanılıyor")
+            return downloaded_path
+    
+    def _download_file(self, video_url, output_path, progress=None):
+        """
+        Dosyayı ortak oturumla .part dosyasına indir, kesilirse kaldığı yerden devam et
+        
+        Yarım dosya hiçbir zaman son adla görünmez: boyut (Content-Length) ve
+        varsa MD5 ETag doğrulandıktan sonra atomik olarak yeniden adlandırılır.
+        
+        Args:
+            video_url: Video URL'i
+            output_path: Kayıt yolu
+            progress: _DownloadProgress (opsiyonel)
+        
+        Returns:
+            int: Dosya boyutu (bayt)
+        """
+        chunk_size = getattr(config, 'DOWNLOAD_CHUNK_SIZE', 1024 * 1024)
+        retries = getattr(config, 'DOWNLOAD_RETRIES', 3)
+        part_path = output_path + ".part"
+        meta_path = part_path + ".json"
+        
+        # Önceki yarım indirme aynı URL'e aitse devam edilir
+        meta = {}
+        if os.path.exists(part_path) and os.path.exists(meta_path):
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+            except Exception:
+                meta = {}
+        if meta.get('url') != video_url:
+            meta = {'url': video_url}
+            for path in (part_path, meta_path):
+                if os.path.exists(path):
+                    os.remove(path)
+        
+        total_known = False
+        attempt = 0
+        while True:
+            offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+            headers = {}
+            if offset:
+                headers['Range'] = f"bytes={offset}-"
+                # Dosya sunucuda değiştiyse 200 ile baştan gönderilir
+                validator = meta.get('etag') or meta.get('last_modified')
+                if validator:
+                    headers['If-Range'] = validator
+            
+            try:
+                with self.session.get(video_url, stream=True, timeout=30, headers=headers) as response:
+                    if response.status_code == 416 and meta.get('length') == offset:
+                        break  # Zaten tamamı inmiş
+                    response.raise_for_status()
+                    
+                    if response.status_code == 206:
+                        # Content-Range: bytes <başlangıç>-<bitiş>/<toplam>
+                        total = response.headers.get('Content-Range', '').rsplit('/', 1)[-1]
+                        meta['length'] = int(total) if total.isdigit() else None
+                        mode = 'ab'
+                    else:
+                        length = response.headers.get('Content-Length')
+                        meta['length'] = int(length) if length else None
+                        meta['etag'] = response.headers.get('ETag')
+                        meta['last_modified'] = response.headers.get('Last-Modified')
+                        offset = 0
+                        mode = 'wb'
+                    
+                    with open(meta_path, 'w', encoding='utf-8') as f:
+                        json.dump(meta, f)
+                    
+                    if progress and not total_known:
+                        progress.add_total(meta['length'] or 0)
+                        progress.update(offset)
+                        total_known = True
+                    
+                    with open(part_path, mode, buffering=chunk_size) as f:
+                        for chunk in response.iter_content(chunk_size=chunk_size):
+                            f.write(chunk)
+                            if progress:
+                                progress.update(len(chunk))
+                
+                size = os.path.getsize(part_path)
+                if meta.get('length') is None or size == meta['length']:
+                    break
+                raise IOError(f"Eksik indirme: {size}/{meta['length']} bayt")
+            
+            except requests.HTTPError:
+                raise
+            except (requests.ConnectionError, requests.Timeout,
+                    requests.exceptions.ChunkedEncodingError, IOError) as e:
+                attempt += 1
+                if attempt > retries:
+                    raise
+                print(f"🔁 İndirme kesildi ({e}), kaldığı yerden devam ediliyor ({attempt}/{retries})...")
+                time.sleep(min(2 ** attempt, 10))
+        
+        self._verify_etag(part_path, meta.get('etag'))
+        
+        os.replace(part_path, output_path)
+        os.remove(meta_path)
+        return os.path.getsize(output_path)
+    
+    def _verify_etag(self, path, etag):
+        """
+        ETag bir MD5 özetiyse (tek parça yükleme) dosyayla karşılaştır
+        
+        Args:
+            path: İndirilen dosya
+            etag: Sunucunun ETag başlığı (None = kontrol yok)
+        """
+        value = (etag or '').strip('"')
+        if etag is None or etag.startswith('W/') or not re.fullmatch(r'[0-9a-fA-F]{32}', value):
+            return
+        
+        md5 = hashlib.md5()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                md5.update(block)
+        
+        if md5.hexdigest() != value.lower():
+            os.remove(path)
+            raise IOError("İndirilen dosya ETag (MD5) ile eşleşmiyor")
+    
+    def _download_partial(self, video_url, output_path, duration):
+        """
+        Uzak dosyanın sadece ilk `duration` saniyesini indir (yeniden encode yok)
+        
+        ffmpeg önce moov atom'unu okur, sonra HTTP Range ile sadece gereken
+        mdat aralığını çeker; paketler kopyalanarak yerel dosyaya yazılır.
+        
+        Args:
+            video_url: Video URL'i
+            output_path: Kayıt yolu
+            duration: Alınacak süre (saniye)
+        
+        Returns:
+            int: Yazılan bayt sayısı
+        """
+        from ffmpeg_renderer import get_ffmpeg_exe
+        
+        part_path = output_path + ".part"
+        cmd = [
+            get_ffmpeg_exe(), "-y", "-hide_banner", "-loglevel", "error",
+            "-xerror",  # Range desteklenmezse yarım dosyayla başarılı dönmesin
+            "-reconnect", "1", "-reconnect_delay_max", "5",
+            "-t", str(duration),
+            "-i", video_url,
+            "-map", "0:v:0",
+            "-c", "copy",
+            "-movflags", "+faststart",
+            "-f", "mp4",
+            part_path,
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+        if result.returncode != 0:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise RuntimeError(f"Kısmi indirme başarısız: {result.stderr.strip()[-300:]}")
+        
+        os.replace(part_path, output_path)
+        return os.path.getsize(output_path)
+    
+    def _fetch(self, video_url, output_path, duration=None, progress=None):
+        """
+        Videoyu indir: süre verilmişse sadece gereken kısmı, olmazsa (veya hata olursa) tümünü
+        
+        Args:
+            video_url: Video URL'i
+            output_path: Kayıt yolu
+            duration: Gereken süre (None = tüm dosya)
+            progress: _DownloadProgress (opsiyonel, sadece tam indirmede)
+        
+        Returns:
+            tuple: (yazılan bayt, önbellek için süre - tam indirmede None)
+        """
+        if duration and getattr(config, 'PARTIAL_DOWNLOAD', False):
+            needed = duration_bucket(duration + 1)  # GOP sınırı için pay
+            try:
+                return self._download_partial(video_url, output_path, needed), needed
+            except Exception as e:
+                print(f"⚠️ Kısmi indirme olmadı ({e}), tüm dosya indiriliyor")
+        
+        return self._download_file(video_url, output_path, progress), None
+    
+    def _can_stream(self):
+        """Akış kaynakları kullanılabilir mi (sadece FFmpeg motoru, intro/outro yok)"""
+        return (
+            getattr(config, 'STREAM_UNCACHED', False)
+            and getattr(config, 'RENDER_BACKEND', 'moviepy') == "ffmpeg"
+            and not self.template_settings["intro_duration"]
+            and not self.template_settings["outro_duration"]
+        )
+    
+    def _stream_source(self, video_url, fallback_path):
+        """
+        Videoyu indirmeden render'a akıtmak için kaynak oluştur (bağlantı açılmaz)
+        
+        İstek render başlarken açılır (_open_streams); iş render slotunu
+        beklerken sunucu bağlantısı boşta tutulmaz, zaman aşımına uğramaz.
+        
+        Args:
+            video_url: Video URL'i
+            fallback_path: Akış render'da kullanılamazsa indirileceği yol
+        
+        Returns:
+            HTTPStreamSource: Açılmamış akış kaynağı
+        """
+        return HTTPStreamSource(
+            video_url,
+            self.session,
+            read_ahead_mb=getattr(config, 'STREAM_READ_AHEAD_MB', 16),
+            fallback_path=fallback_path
+        )
+    
+    def _open_streams(self, sources):
+        """
+        Render başlarken akış kaynaklarını aç; akıtılamayanları dosyaya indir
+        
+        Args:
+            sources: (path, başlangıç, bitiş) listesi
+        
+        Returns:
+            list: Açılmış akışlar ve indirilen dosya yollarıyla liste
+        """
+        opened = []
+        try:
+            for idx, (path, start, end) in enumerate(sources):
+                if isinstance(path, HTTPStreamSource):
+                    try:
+                        path = path.open()
+                    except Exception as e:
+                        if isinstance(e, NotStreamable):
+                            print(f"ℹ️ Akıtılamıyor ({e}), indirilecek")
+                        else:
+                            print(f"⚠️ Akış açılamadı ({e}), indirilecek")
+                        path.close()
+                        output_path = path.fallback_path or f"temp_stream_{idx+1}.mp4"
+                        self._download_file(path.url, output_path)
+                        path = output_path
+                opened.append((path, start, end))
+        except Exception:
+            for path, _, _ in opened:
+                if isinstance(path, HTTPStreamSource):
+                    path.close()
+            raise
+        return opened
+    
+    def _materialize_streams(self, sources):
+        """
+        Akış kaynaklarını dosyaya indir (FFmpeg dışı render'lar pipe okuyamaz)
+        
+        Args:
+            sources: (path, başlangıç, bitiş) listesi
+        
+        Returns:
+            list: Akışların yerine dosya yolları konmuş liste
+        """
+        materialized = []
+        for idx, (path, start, end) in enumerate(sources):
+            if isinstance(path, HTTPStreamSource):
+                path.close()
+                output_path = path.fallback_path or f"temp_stream_{idx+1}.mp4"
+                # Render başlarken akıtılamayıp indirilmiş olabilir
+                if not os.path.exists(output_path):
+                    print(f"⬇️ Akış kaynağı indiriliyor: {os.path.basename(output_path)}")
+                    self._download_file(path.url, output_path)
+                path = output_path
+            materialized.append((path, start, end))
+        return materialized
+    
+    def download_video(self, video_url, output_path="temp_video.mp4"):
+        """
+        Videoyu indir (önbellekte varsa indirmeden önbellekteki dosyayı kullan)
+        
+        Args:
+            video_url: Video URL'i
+            output_path: Kayıt yolu
+        
+        Returns:
+            str: Kullanılacak dosya yolu (önbellek aktifse mezzanine yolu)
+        """
+        # Yerel kütüphane klibi - indirme yok
+        if not video_url.startswith(('http://', 'https://')):
+            return video_url
+        
+        if self.footage_cache:
+            cached_path = self.footage_cache.get(video_url)
+            if cached_path:
+                print(f"⚡ Video önbellekte: {os.path.basename(cached_path)}")
+                return cached_path
+        
+        try:
+            print("⬇️ Video indiriliyor...")
+            
+            written = self._download_file(video_url, output_path)
             
+            print(f"✅ Video indirildi: {output_path} ({written / (1024 * 1024):.2f} MB)")
+            return self._ingest_download(video_url, output_path)
+        
+        except Exception as e:
+            print(f"❌ Video indirme hatası: {e}")
+            raise
+    
+    def download_multiple_videos(self, video_urls, base_name="temp_video", duration=None, stream=None,
+                                 with_urls=False):
+        """
+        Birden fazla videoyu eşzamanlı indir (önbellekte olanlar indirilmez)
+        
+        Toplam süre en yavaş dosyaya yakındır. İndirilemeyen videolar atlanır,
+        sıralama korunur. config.STREAM_UNCACHED açıksa önbellekte olmayan
+        videolar indirilmez, render sırasında HTTP'den akıtılır (bağlantı render
+        başlarken açılır; akıtılamayanlar o anda indirilir).
+        
+        Args:
+            video_urls: Video URL'leri listesi
+            base_name: Dosya adı tabanı
+            duration: Her videodan gereken süre (saniye) - verilirse sadece o kısım indirilir
+            stream: Önbellekte olmayanları akıt (None = config; False = her zaman dosya
+                indir, ör. önbellek ısıtma)
+            with_urls: True ise (URL, yol) çiftleri döndürülür
+        
+        Returns:
+            list: Kullanılacak dosya yolları (akıtılanlar için HTTPStreamSource)
+        """
+        results = [None] * len(video_urls)
+        pending = []
+        stream = self._can_stream() if stream is None else stream and self._can_stream()
+        
+        for idx, url in enumerate(video_urls):
+            # Yerel kütüphane klibi - indirme yok
+            if not url.startswith(('http://', 'https://')):
+                results[idx] = url
+                continue
+            if self.footage_cache:
+                cached_path = self.footage_cache.get(url, duration_bucket(duration + 1) if duration else None)
+                if cached_path:
+                    print(f"⚡ Video {idx+1}/{len(video_urls)} önbellekte")
+                    results[idx] = cached_path
+                    continue
+            if stream:
+                results[idx] = self._stream_source(url, f"{base_name}_{idx+1}.mp4")
+                print(f"📡 Video {idx+1}/{len(video_urls)} render sırasında akıtılacak")
+                continue
+            pending.append(idx)
+        
+        if pending:
+            print(f"⬇️ {len(pending)} video eşzamanlı indiriliyor...")
+            progress = _DownloadProgress(len(pending))
+            
+            def download(idx):
+                url = video_urls[idx]
+                output_path = f"{base_name}_{idx+1}.mp4"
+                try:
+                    written, cached_duration = self._fetch(url, output_path, duration, progress)
+                    print(f"✅ Video {idx+1} indirildi ({written / (1024 * 1024):.2f} MB)")
+                    return self._ingest_download(url, output_path, cached_duration)
+                except Exception as e:
+                    print(f"⚠️ Video {idx+1} indirilemedi: {e}")
+                    return None
+            
+            workers = max(min(self.download_workers, len(pending)), 1)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for idx, path in zip(pending, pool.map(download, pending)):
+                    results[idx] = path
+        
+        if with_urls:
+            return [(url, path) for url, path in zip(video_urls, results) if path]
+        return [path for path in results if path]
+    
+    def extend_short_clips(self, footage, audio_duration, base_name="temp_video"):
+        """
+        Kısa kalan kısmi indirmeleri gerçek ses süresine göre yeniden indir
+        
+        Kısmi indirme süresi ses üretilmeden tahminle ve aranan video sayısına
+        göre belirlenir. Ses tahminden uzunsa veya bazı videolar
+        indirilemediyse her klibin payı büyür; kısa kalan klip render'da
+        görünür şekilde döngüye girer.
+        
+        Args:
+            footage: (URL, yol) listesi (download_multiple_videos(with_urls=True))
+            audio_duration: Gerçek ses süresi (saniye)
+            base_name: Yeniden indirilenlerin dosya adı tabanı
+        
+        Returns:
+            list: (URL, yol) listesi - kısa kalanlar yenileriyle değiştirilmiş
+        """
+        if not footage:
+            return footage
+        
+        share = audio_duration / len(footage)
+        result = []
+        for idx, (url, path) in enumerate(footage):
+            # Akışlar ve yerel kütüphane klipleri zaten tam dosya
+            if not isinstance(path, str) or not url.startswith(('http://', 'https://')):
+                result.append((url, path))
+                continue
+            
+            try:
+                length = probe_video(path)["duration"]
+            except Exception as e:
+                print(f"⚠️ Klip süresi okunamadı ({e}), olduğu gibi kullanılıyor")
+                length = share
+            
+            if length + 0.1 < share:
+                print(f"⬇️ Klip {idx+1} kısa ({length:.1f}s < {share:.1f}s), yeniden indiriliyor...")
+                extended = self.download_multiple_videos(
+                    [url], f"{base_name}_ext{idx+1}", duration=share, with_urls=True
+                )
+                if extended:
+                    path = extended[0][1]
+            result.append((url, path))
+        return result
+    
+    def get_audio_duration(self, audio_path):
+        """
+        Seslendirme süresi (YouTube Shorts için en fazla 60 saniye)
+        
+        Args:
+            audio_path: Ses dosyası yolu
+        
+        Returns:
+            float: Süre (saniye)
+        """
+        audio = AudioFileClip(audio_path)
+        duration = min(audio.duration, 60)  # YouTube Shorts: max 60 saniye
+        audio.close()
+        return duration
+    
+    def _normalize_sources(self, video_path):
+        """
+        Kaynak video girdisini (path, başlangıç, bitiş) listesine çevir
+        
+        Args:
+            video_path: Tek video yolu, video yolları listesi veya
+                (path, başlangıç, bitiş) tuple'ları listesi
+        
+        Returns:
+            list: (path, başlangıç, bitiş) listesi (başlangıç/bitiş None olabilir)
+        """
+        if isinstance(video_path, (str, os.PathLike)):
+            return [(video_path, None, None)]
+        
+        sources = []
+        for item in video_path:
+            if isinstance(item, (tuple, list)):
+                path = item[0]
+                start = item[1] if len(item) > 1 else None
+                end = item[2] if len(item) > 2 else None
+                sources.append((path, start, end))
+            else:
+                sources.append((item, None, None))
+        
+        if not sources:
+            raise ValueError("En az bir kaynak video gerekli!")
+        
+        return sources
+    
+    def _create_final_video_ffmpeg(self, sources, audio_path, output_path, subtitle_text=None, profile=None):
+        """
+        Final videoyu tek bir ffmpeg filtergraph'ı ile oluştur (kareler Python'dan geçmez)
+        
+        Args:
+            sources: (path, başlangıç, bitiş) listesi
+            audio_path: Ses dosyası yolu
+            output_path: Çıktı dosyası yolu
+            subtitle_text: Alt yazı metni (opsiyonel)
+            profile: Encode profili (None = config'deki)
+        """
+        from ffmpeg_renderer import FFmpegRenderer
+        
+        # Intro/outro filtergraph'ta yok, bu durumda MoviePy kullanılır
+        if self.template_settings["intro_duration"] > 0 or self.template_settings["outro_duration"] > 0:
+            raise ValueError("Intro/outro FFmpeg motorunda desteklenmiyor")
+        
+        print("🎬 Video ve ses birleştiriliyor (FFmpeg filtergraph)...")
+        
+        audio_duration = self.get_audio_duration(audio_path)
+        
+        subtitle_type = config.SUBTITLE_TYPE if hasattr(config, 'SUBTITLE_TYPE') else "word_by_word"
+        
+        renderer = FFmpegRenderer(self.template, footage_cache=self.footage_cache, profile=profile)
+        
+        # Akışlar ancak şimdi açılır (footage aşamasında açılsa render slotunu beklerken boşta kalırdı)
+        sources = self._open_streams(sources)
+        
+        print(f"💾 Final video kaydediliyor: {output_path}")
+        renderer.render(
+            sources,
+            audio_path,
+            output_path,
+            audio_duration,
+            subtitle_text=subtitle_text,
+            subtitle_type=subtitle_type
+        )
+        
+        print(f"✅ Video başarıyla oluşturuldu: {output_path}")
+    
+    def _create_final_video_segmented(self, sources, audio_path, output_path, subtitle_text=None, profile=None):
+        """
+        Final videoyu paralel parçalar halinde oluştur (parçalar yeniden encode edilmeden birleştirilir)
+        
+        Args:
+            sources: (path, başlangıç, bitiş) listesi
+            audio_path: Ses dosyası yolu
+            output_path: Çıktı dosyası yolu
+            subtitle_text: Alt yazı metni (opsiyonel)
+            profile: Encode profili (None = config'deki)
+        """
+        from segment_renderer import render_segmented
+        
+        # Intro/outro ayrı ses zamanlaması gerektirir, bu durumda tek parça render
+        if self.template_settings["intro_duration"] > 0 or self.template_settings["outro_duration"] > 0:
+            raise ValueError("Intro/outro parçalı render'da desteklenmiyor")
+        
+        print("🎬 Video ve ses birleştiriliyor (paralel parçalar)...")
+        
+        audio_duration = self.get_audio_duration(audio_path)
+        
+        print(f"💾 Final video kaydediliyor: {output_path}")
+        render_segmented(
+            self.template.template_name,
+            sources,
+            audio_path,
+            output_path,
+            audio_duration,
+            subtitle_text=subtitle_text,
+            segments=config.RENDER_SEGMENTS,
+            workers=getattr(config, 'RENDER_WORKERS', None),
+            profile=profile or get_profile()
+        )
+        
+        print(f"✅ Video başarıyla oluşturuldu: {output_path}")
+    
+    def create_final_video(self, video_path, audio_path, output_path, subtitle_text=None, audio_speed=1.0,
+                           workdir=None, threads=None):
+        """
+        Video ve sesi birleştir, alt yazı ekle (YouTube Shorts formatında)
+        
+        Birden fazla kaynak clip verilirse tek bir zaman çizelgesi kurulur ve
+        sonuç tek seferde encode edilir (ara birleştirme dosyası yok).
+        
+        Args:
+            video_path: Video dosyası yolu, yollar listesi veya
+                (path, başlangıç, bitiş) tuple'ları listesi
+            audio_path: Ses dosyası yolu
+            output_path: Çıktı dosyası yolu
+            subtitle_text: Alt yazı metni (opsiyonel)
+            audio_speed: Ses hızı çarpanı (Edge-TTS'de zaten uygulandı)
+            workdir: Ara dosyaların yazılacağı klasör (None = çalışma dizini)
+            threads: Render'ın thread bütçesi (None = profildeki; aynı anda
+                birden fazla render varsa zamanlayıcı çekirdekleri paylaştırır)
+        """
+        sources = self._normalize_sources(video_path)
+        
+        profile = get_profile()
+        if threads:
+            profile["threads"] = threads
+        
+        # Render motoru seçimi (config'den)
+        if getattr(config, 'RENDER_BACKEND', 'moviepy') == "ffmpeg":
+            try:
+                return self._create_final_video_ffmpeg(sources, audio_path, output_path, subtitle_text, profile)
+            except Exception as e:
+                print(f"⚠️ FFmpeg render başarısız: {e}")
+                print("🔄 MoviePy ile devam ediliyor...")
+        
+        # Akış kaynakları tek kullanımlık ve MoviePy pipe okuyamaz: dosyaya indir
+        sources = self._materialize_streams(sources)
+        
+        # Paralel parça render (config'den)
+        if getattr(config, 'RENDER_SEGMENTS', 1) > 1:
+            try:
+                return self._create_final_video_segmented(sources, audio_path, output_path, subtitle_text, profile)
+            except Exception as e:
+                print(f"⚠️ Parçalı render başarısız: {e}")
+                print("🔄 Tek parça render ile devam ediliyor...")
+        
+        try:
+            print("🎬 Video ve ses birleştiriliyor...")
+            
+            # Sesi yükle
+            audio = AudioFileClip(audio_path)
+            audio_duration = audio.duration
+            
+            # YouTube Shorts için süre kontrolü (max 60 saniye)
+            if audio_duration > 60:
+                print("⚠️ Video 60 saniyeden uzun, YouTube Shorts için kısaltılıyor...")
+                audio = audio.subclipped(0, 60)
+                audio_duration = 60
+            
+            video, source_clips = self._compose_main_video(sources, audio_duration, subtitle_text)
+            main_video = video.with_audio(audio)
+            
+            # Intro ve Outro ekle
+            intro = self.template.create_intro(video.w, video.h)
+            outro = self.template.create_outro(video.w, video.h)
+            
+            clips_to_concat = []
+            
+            if intro:
+                clips_to_concat.append(intro)
+                print("✅ Intro eklendi")
+            
+            clips_to_concat.append(main_video)
+            
+            if outro:
+                clips_to_concat.append(outro)
+                print("✅ Outro eklendi")
+            
+            # Tüm parçaları birleştir
+            if len(clips_to_concat) > 1:
+                from moviepy import concatenate_videoclips
+                final_video = concatenate_videoclips(clips_to_concat)
+            else:
+                final_video = main_video
+            
+            # Çıktıyı kaydet
+            print(f"💾 Final video kaydediliyor: {output_path} (profil: {profile['name']})")
+            final_video.write_videofile(
+                output_path,
+                codec='libx264',
+                audio_codec='aac',
+                fps=30,
+                temp_audiofile_path=workdir or "",
+                **moviepy_kwargs(profile)
+            )
+            
+            # Kaynakları temizle
+            for clip in source_clips:
+                clip.close()
+            audio.close()
+            final_video.close()
+            
+            print(f"✅ Video başarıyla oluşturuldu: {output_path}")
+        
         except Exception as e:
             print(f"❌ Video oluşturma hatası: {e}")
             raise
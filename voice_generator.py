@@ -6,6 +6,7 @@ Edge-TTS kullanarak metni Türkçe sese çevirir.
 import asyncio
 import edge_tts
 import os
+import config
 
 
 class VoiceGenerator:
@@ -20,6 +21,21 @@ class VoiceGenerator:
         self.voice = voice
         self.speed_multiplier = speed_multiplier
     
+    def estimate_duration(self, text, margin=1.15):
+        """
+        Metnin seslendirme süresini ses üretmeden tahmin et (kelime sayısından)
+        
+        Args:
+            text: Seslendirilecek metin
+            margin: Güvenlik payı (kısa tahmin videoların döngüye girmesine yol açar)
+            
+        Returns:
+            float: Tahmini süre (saniye, YouTube Shorts için en fazla 60)
+        """
+        words_per_second = getattr(config, 'TTS_WORDS_PER_SECOND', 2.3) * self.speed_multiplier
+        duration = len(text.split()) / words_per_second * margin
+        return min(max(duration, 1.0), 60)
+    
     async def generate_voice(self, text, output_path="output_audio.mp3"):
         """
         Metni sese çevir (hızlandırılmış)
@@ -0,0 +1,112 @@
+"""
+VideoOtoFabrika - İş Çalışma Alanı Modülü
+Her video işi kendi klasöründe çalışır (ses, ham klipler, render ara
+dosyaları); aynı anda çalışan işler birbirinin dosyalarına dokunmaz.
+
+Yeterli boş yer ve bellek varsa klasör tmpfs'te (/dev/shm) açılır: ara
+dosyalar diske hiç yazılmaz. Yoksa sistemin geçici klasörü kullanılır.
+"""
+
+import os
+import shutil
+import tempfile
+
+
+def mem_available_mb():
+    """
+    Kullanılabilir bellek (/proc/meminfo MemAvailable)
+    
+    Returns:
+        float veya None: MB (Linux dışında None)
+    """
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def workspace_root(required_mb, tmpfs="/dev/shm", min_free_mb=2048):
+    """
+    Çalışma alanının açılacağı kök klasörü seç
+    
+    tmpfs dosyaları RAM'de tutar; iş oraya ancak hem tmpfs'te hem bellekte
+    ihtiyacından `min_free_mb` fazla yer varsa alınır (render'lara bellek kalsın).
+    
+    Args:
+        required_mb: İşin ara dosyalarının tahmini boyutu (MB)
+        tmpfs: tmpfs bağlama noktası (None = kullanma)
+        min_free_mb: İş yerleştikten sonra tmpfs'te ve bellekte kalması gereken boş alan (MB)
+    
+    Returns:
+        str: Kök klasör
+    """
+    if tmpfs and os.path.isdir(tmpfs) and os.access(tmpfs, os.W_OK):
+        free_mb = shutil.disk_usage(tmpfs).free / (1024 * 1024)
+        mem_mb = mem_available_mb()
+        needed = required_mb + min_free_mb
+        if free_mb >= needed and (mem_mb is None or mem_mb >= needed):
+            return tmpfs
+    return tempfile.gettempdir()
+
+
+def create_workspace(job_id, required_mb=500, root=None, tmpfs="/dev/shm", min_free_mb=2048):
+    """
+    İşe özel çalışma klasörü oluştur (varsa olduğu gibi kullanılır)
+    
+    Args:
+        job_id: İş kimliği (klasör adı)
+        required_mb: İşin ara dosyalarının tahmini boyutu (MB)
+        root: Sabit kök klasör (None = tmpfs veya sistem geçici klasörü)
+        tmpfs: tmpfs bağlama noktası
+        min_free_mb: tmpfs seçimi için boş alan payı (MB)
+    
+    Returns:
+        str: Çalışma klasörü
+    """
+    root = root or workspace_root(required_mb, tmpfs, min_free_mb)
+    path = os.path.join(root, f"vof_job_{job_id}")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def remove_workspace(path):
+    """
+    Çalışma klasörünü içindekilerle birlikte sil
+    
+    Args:
+        path: create_workspace() sonucu
+    """
+    if path and os.path.isdir(path):
+        shutil.rmtree(path, ignore_errors=True)
+        print(f"🗑️ Silindi: {path}")
+
+
+def on_tmpfs(path, tmpfs="/dev/shm"):
+    """Klasör tmpfs altında mı (RAM'de)?"""
+    if not tmpfs:
+        return False
+    tmpfs = os.path.abspath(tmpfs)
+    return os.path.abspath(path).startswith(tmpfs + os.sep)
+
+
+def park_workspace(path, park_dir):
+    """
+    Çalışma klasörünü diske taşı (hatalı işin dosyaları RAM'i tutmasın)
+    
+    Args:
+        path: Mevcut çalışma klasörü
+        park_dir: Hedef kök klasör
+    
+    Returns:
+        str: Yeni klasör yolu
+    """
+    os.makedirs(park_dir, exist_ok=True)
+    destination = os.path.join(os.path.abspath(park_dir), os.path.basename(path))
+    if os.path.isdir(destination):
+        shutil.rmtree(destination, ignore_errors=True)
+    shutil.move(path, destination)
+    return destination
@@ -0,0 +1,159 @@
+"""
+VideoOtoFabrika - Zoom / Ken Burns Efekt Modülü
+Her kare için bir kırpma dikdörtgeni hesaplar ve sadece o bölgeyi
+önceden ayrılmış bir tampona yeniden örnekler (crop-then-resize,
+kare başına yeni dizi yok).
+"""
+
+import cv2
+import numpy as np
+
+
+# İlerleme (0-1) -> yumuşatılmış ilerleme (0-1)
+EASINGS = {
+    "linear": lambda p: p,
+    "ease_in": lambda p: p * p,
+    "ease_out": lambda p: 1 - (1 - p) * (1 - p),
+    "ease_in_out": lambda p: p * p * (3 - 2 * p),
+}
+
+# Aynı eğriler ffmpeg ifadesi olarak (zoompan için, P = ilerleme)
+FFMPEG_EASINGS = {
+    "linear": "P",
+    "ease_in": "P*P",
+    "ease_out": "1-(1-P)*(1-P)",
+    "ease_in_out": "P*P*(3-2*P)",
+}
+
+# Kırpma penceresinin zoom sırasında kaydığı yön (dx, dy)
+PAN_DIRECTIONS = {
+    "center": (0, 0),
+    "left": (-1, 0),
+    "right": (1, 0),
+    "up": (0, -1),
+    "down": (0, 1),
+    "up-left": (-1, -1),
+    "up-right": (1, -1),
+    "down-left": (-1, 1),
+    "down-right": (1, 1),
+}
+
+
+class ZoomEffect:
+    def __init__(self, duration, zoom_amount=0.15, direction="center", easing="linear"):
+        """
+        Zoom efektini başlat
+        
+        Args:
+            duration: Efekt süresi (saniye)
+            zoom_amount: Son karedeki zoom miktarı (0.15 = %15)
+            direction: Pan yönü (center, left, right, up, down, up-left, ...)
+            easing: Yumuşatma eğrisi (linear, ease_in, ease_out, ease_in_out)
+        """
+        if direction not in PAN_DIRECTIONS:
+            raise ValueError(f"Geçersiz pan yönü: {direction}")
+        if easing not in EASINGS:
+            raise ValueError(f"Geçersiz easing: {easing}")
+        
+        self.duration = duration
+        self.zoom_amount = zoom_amount
+        self.direction = direction
+        self.easing = easing
+        self._ease = EASINGS[easing]
+        self._dx, self._dy = PAN_DIRECTIONS[direction]
+        
+        # Çıktı tamponları (sırayla kullanılır; bir önceki kare hâlâ okunuyor olabilir)
+        self._buffers = [None, None]
+        self._buffer_index = 0
+    
+    def progress(self, t):
+        """t anındaki yumuşatılmış ilerleme (0-1)"""
+        if self.duration <= 0:
+            return 1.0
+        p = min(max(t / self.duration, 0.0), 1.0)
+        return self._ease(p)
+    
+    def crop_rect(self, t, width, height):
+        """
+        t anında görünen kaynak bölgesini hesapla
+        
+        Args:
+            t: Zaman (saniye)
+            width: Kare genişliği
+            height: Kare yüksekliği
+        
+        Returns:
+            tuple: (x, y, genişlik, yükseklik) - alt piksel hassasiyetinde float
+        """
+        e = self.progress(t)
+        zoom = 1.0 + self.zoom_amount * e
+        
+        crop_w = width / zoom
+        crop_h = height / zoom
+        
+        # Boşluk: pencerenin kayabileceği alan (merkezden kenara)
+        x = (width - crop_w) * (0.5 + 0.5 * self._dx * e)
+        y = (height - crop_h) * (0.5 + 0.5 * self._dy * e)
+        
+        return x, y, crop_w, crop_h
+    
+    def _next_buffer(self, shape, dtype):
+        """Sıradaki çıktı tamponunu döndür (boyut değişirse yeniden ayır)"""
+        self._buffer_index ^= 1
+        buffer = self._buffers[self._buffer_index]
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype=dtype)
+            self._buffers[self._buffer_index] = buffer
+        return buffer
+    
+    def apply(self, frame, t):
+        """
+        Kareye zoom uygula - sadece kırpma bölgesi yeniden örneklenir
+        
+        Args:
+            frame: RGB kare (numpy dizisi)
+            t: Zaman (saniye)
+        
+        Returns:
+            numpy.ndarray: Aynı boyutta zoom'lanmış kare (tekrar kullanılan tampon)
+        """
+        h, w = frame.shape[:2]
+        x, y, crop_w, crop_h = self.crop_rect(t, w, h)
+        
+        # Kırpma bölgesi (view - kopya yok), kare sınırları içinde tut
+        crop_w = min(int(round(crop_w)), w)
+        crop_h = min(int(round(crop_h)), h)
+        x0 = min(max(int(round(x)), 0), w - crop_w)
+        y0 = min(max(int(round(y)), 0), h - crop_h)
+        region = frame[y0:y0 + crop_h, x0:x0 + crop_w]
+        
+        # Sadece görünen bölge hedef boyuta örneklenir, sonuç tampona yazılır
+        out = self._next_buffer(frame.shape, frame.dtype)
+        cv2.resize(region, (w, h), dst=out, interpolation=cv2.INTER_LINEAR)
+        return out
+    
+    def __call__(self, get_frame, t):
+        """MoviePy clip.transform() ile kullanım için"""
+        return self.apply(get_frame(t), t)
+    
+    def zoompan_filter(self, width, height, fps, total_frames):
+        """
+        Aynı efektin ffmpeg zoompan filtresi karşılığı
+        
+        Args:
+            width: Çıktı genişliği
+            height: Çıktı yüksekliği
+            fps: Kare hızı
+            total_frames: Toplam kare sayısı
+        
+        Returns:
+            str: zoompan filtre tanımı
+        """
+        progress = f"min(on/{max(total_frames, 1)},1)"
+        eased = "(" + FFMPEG_EASINGS[self.easing].replace("P", progress) + ")"
+        
+        zoom = f"1+{self.zoom_amount}*{eased}"
+        x = f"(iw-iw/zoom)*(0.5+0.5*({self._dx})*{eased})"
+        y = f"(ih-ih/zoom)*(0.5+0.5*({self._dy})*{eased})"
+        
+        return f"zoompan=z='{zoom}':x='{x}':y='{y}':d=1:s={width}x{height}:fps={fps}"